@@ -0,0 +1,124 @@
+"""Benchmark ``classify_error`` over a corpus of real yt-dlp / ffmpeg / requests errors.
+
+Checks every corpus line classifies as labelled, then times the shipped
+token table against two alternatives: per-rule ``any()`` generators (the
+previous implementation) and a single combined regex pass.
+
+    python benchmarks/bench_error_classification.py [--repeat 200]
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+import argparse
+import re
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from link2vid.core.error_classification import _RULES, classify_error  # noqa: E402
+
+CORPUS_PATH = Path(__file__).with_name("corpus") / "error_messages.txt"
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> list[tuple[str, str]]:
+    """``(expected_reason, message)`` pairs from a ``reason<TAB>message`` file."""
+    cases = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip() or line.startswith("#"):
+            continue
+        reason, message = line.split("\t", 1)
+        cases.append((reason, message))
+    return cases
+
+
+def generator_classify(err_text: str) -> tuple[str, str]:
+    msg = (err_text or "").lower()
+    for rule in _RULES:
+        if any(token in msg for token in rule.tokens):
+            return rule.reason, rule.hint
+    return "unknown", ""
+
+
+def _build_regex_classifier() -> Callable[[str], tuple[str, str]]:
+    # One alternation with a named group per rule; the earliest match position
+    # decides, so rule priority needs a scan of every match.
+    pattern = re.compile(
+        "|".join(
+            f"(?P<r{index}>{'|'.join(re.escape(token) for token in rule.tokens)})"
+            for index, rule in enumerate(_RULES)
+        )
+    )
+
+    def classify(err_text: str) -> tuple[str, str]:
+        best = None
+        for match in pattern.finditer((err_text or "").lower()):
+            index = int(match.lastgroup[1:])
+            if best is None or index < best:
+                best = index
+                if best == 0:
+                    break
+        if best is None:
+            return "unknown", ""
+        rule = _RULES[best]
+        return rule.reason, rule.hint
+
+    return classify
+
+
+def check(cases: list[tuple[str, str]]) -> list[str]:
+    """Mismatches between the corpus labels and ``classify_error``."""
+    failures = []
+    for expected, message in cases:
+        reason, _hint = classify_error(message)
+        if reason != expected:
+            failures.append(f"expected {expected!r}, got {reason!r}: {message[:100]}")
+    return failures
+
+
+def time_per_call(func: Callable[[str], object], messages: list[str], repeat: int) -> float:
+    """Best-of-three microseconds per call."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for message in messages:
+                func(message)
+        best = min(best, time.perf_counter() - start)
+    return best / (repeat * len(messages)) * 1e6
+
+
+def run(repeat: int = 200) -> dict[str, float]:
+    cases = load_corpus()
+    failures = check(cases)
+    if failures:
+        raise AssertionError("corpus mismatches:\n  " + "\n  ".join(failures))
+    messages = [message for _reason, message in cases]
+    return {
+        "classify_error": time_per_call(classify_error, messages, repeat),
+        "generator any()": time_per_call(generator_classify, messages, repeat),
+        "combined regex": time_per_call(_build_regex_classifier(), messages, repeat),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args(argv)
+    try:
+        results = run(args.repeat)
+    except AssertionError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"{len(load_corpus())} corpus messages, all classified as labelled")
+    for name, micros in results.items():
+        print(f"  {name:<16} {micros:7.2f} us/call")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""Hot-path benchmarks over large synthetic inputs, with regression thresholds.
+
+Each case checks its result against the fixture (so a "fast" run that stops
+finding videos fails too), then reports the best-of-N wall time and fails
+when it exceeds the case's threshold. Thresholds are several times the
+times measured on a typical laptop; scale them for slow CI machines with
+``--threshold-scale``.
+
+    python benchmarks/run_benchmarks.py [--only NAME ...] [--repeat 5] [--scale 1.0]
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+import argparse
+import json
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+BENCH_DIR = Path(__file__).resolve().parent
+for path in (ROOT, BENCH_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import bench_error_classification  # noqa: E402
+import synthetic  # noqa: E402
+from link2vid.core.batch_fetch import merge_entries  # noqa: E402
+from link2vid.core.extractors import direct_media_entries_from_html, guess_video_titles, scan_headers  # noqa: E402
+from link2vid.core.helpers import FfmpegProgressReader, parse_ffmpeg_time_seconds  # noqa: E402
+from link2vid.core.selenium_fallback import collapse_selenium_media_candidates  # noqa: E402
+
+
+@dataclass
+class Case:
+    name: str
+    # Builds the input once (untimed) and returns (input, expected count).
+    setup: Callable[[float], tuple[Any, int]]
+    # Timed; returns the count compared against the expected one.
+    run: Callable[[Any], int]
+    threshold_ms: float
+
+
+def _noop(_msg: str) -> None:
+    pass
+
+
+def _scan_direct_media(html: str) -> int:
+    entries = direct_media_entries_from_html(synthetic.PAGE_URL, html, scan_headers(synthetic.PAGE_URL), _noop)
+    return sum(1 for entry in entries if not entry["title"].startswith("Module 1 - Video"))
+
+
+def _guess_titles(data: tuple[str, list[str]]) -> int:
+    html, urls = data
+    return sum(1 for title in guess_video_titles(html, urls) if title)
+
+
+def _read_progress(lines: list[str]) -> int:
+    reader = FfmpegProgressReader()
+    return sum(1 for line in lines if reader.feed(line) is not None)
+
+
+def _parse_stderr(lines: list[str]) -> int:
+    return sum(1 for line in lines if parse_ffmpeg_time_seconds(line) is not None)
+
+
+def _size(value: float, scale: float) -> int:
+    return max(1, int(value * scale))
+
+
+def _mux_titles_setup(scale: float) -> tuple[tuple[str, list[str]], int]:
+    html, players = synthetic.mux_page(_size(400, scale))
+    return (html, synthetic.media_urls(html)), players
+
+
+CASES = [
+    # Entries whose title came from the nearby markup, not the numbered fallback.
+    Case(
+        "scan_direct_media (4 MB Circle page)",
+        lambda scale: synthetic.circle_page(_size(4 * 1024 * 1024, scale)),
+        _scan_direct_media,
+        threshold_ms=500,
+    ),
+    Case(
+        "scan_direct_media (400 mux players)",
+        lambda scale: synthetic.mux_page(_size(400, scale)),
+        _scan_direct_media,
+        threshold_ms=150,
+    ),
+    Case("guess_video_titles (400 mux players)", _mux_titles_setup, _guess_titles, threshold_ms=100),
+    Case(
+        "collapse_selenium_media_candidates (14k URLs)",
+        lambda scale: synthetic.selenium_candidates(_size(2000, scale)),
+        lambda candidates: len(collapse_selenium_media_candidates(candidates)),
+        threshold_ms=500,
+    ),
+    Case(
+        "merge_entries (20k-entry playlist, 4 pages)",
+        lambda scale: synthetic.playlist_batches(_size(20000, scale)),
+        lambda batches: len(merge_entries(batches)[0]),
+        threshold_ms=1000,
+    ),
+    Case(
+        "FfmpegProgressReader (100k lines)",
+        lambda scale: synthetic.ffmpeg_progress_lines(_size(100_000, scale)),
+        _read_progress,
+        threshold_ms=150,
+    ),
+    Case(
+        "parse_ffmpeg_time_seconds (100k stderr lines)",
+        lambda scale: synthetic.ffmpeg_stderr_lines(_size(100_000, scale)),
+        _parse_stderr,
+        threshold_ms=150,
+    ),
+]
+# classify_error is timed per call over the labelled corpus (microseconds).
+CLASSIFY_ERROR_THRESHOLD_US = 20.0
+
+
+@dataclass
+class Result:
+    name: str
+    value: float
+    threshold: float
+    unit: str
+    error: str | None = None
+
+    @property
+    def passed(self) -> bool:
+        return self.error is None and self.value <= self.threshold
+
+
+def run_case(case: Case, *, repeat: int, scale: float, threshold_scale: float) -> Result:
+    data, expected = case.setup(scale)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = case.run(data)
+        best = min(best, time.perf_counter() - start)
+        if found != expected:
+            return Result(case.name, best * 1000, case.threshold_ms * threshold_scale, "ms", f"expected {expected}, got {found}")
+    # Smaller inputs get a proportionally smaller budget (most cases are linear).
+    return Result(case.name, best * 1000, case.threshold_ms * min(scale, 1.0) * threshold_scale, "ms")
+
+
+def run_classify_error(*, repeat: int, threshold_scale: float) -> Result:
+    name = "classify_error (corpus)"
+    try:
+        timings = bench_error_classification.run(repeat)
+    except AssertionError as exc:
+        return Result(name, float("inf"), CLASSIFY_ERROR_THRESHOLD_US * threshold_scale, "us", str(exc))
+    return Result(name, timings["classify_error"], CLASSIFY_ERROR_THRESHOLD_US * threshold_scale, "us")
+
+
+def run(
+    *,
+    only: list[str] | None = None,
+    repeat: int = 5,
+    scale: float = 1.0,
+    threshold_scale: float = 1.0,
+) -> list[Result]:
+    def wanted(name: str) -> bool:
+        return not only or any(token.lower() in name.lower() for token in only)
+
+    results = [
+        run_case(case, repeat=repeat, scale=scale, threshold_scale=threshold_scale)
+        for case in CASES
+        if wanted(case.name)
+    ]
+    if wanted("classify_error (corpus)"):
+        results.append(run_classify_error(repeat=max(1, int(40 * scale)), threshold_scale=threshold_scale))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="*", help="run cases whose name contains any of these")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case (best is reported)")
+    parser.add_argument("--scale", type=float, default=1.0, help="input size multiplier")
+    parser.add_argument("--threshold-scale", type=float, default=1.0, help="loosen (>1) or tighten thresholds")
+    parser.add_argument("--json", type=Path, help="also write results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(only=args.only, repeat=args.repeat, scale=args.scale, threshold_scale=args.threshold_scale)
+    for result in results:
+        status = "ok" if result.passed else "FAIL"
+        line = f"{status:<4} {result.name:<48} {result.value:9.2f} {result.unit}  (limit {result.threshold:.2f} {result.unit})"
+        if result.error:
+            line += f"\n     {result.error}"
+        print(line)
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                [
+                    {"name": r.name, "value": r.value, "threshold": r.threshold, "unit": r.unit, "error": r.error}
+                    for r in results
+                ],
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    return 0 if results and all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
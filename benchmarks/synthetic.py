@@ -0,0 +1,173 @@
+"""Deterministic synthetic inputs for ``run_benchmarks.py``.
+
+Sizes are parameters so the suite can run scaled down; every generator
+returns the expected result size alongside the data so the runner can
+check the code under test still finds everything.
+"""
+
+from __future__ import annotations
+
+import random
+
+PAGE_URL = "https://community.example/c/lessons/module-1"
+_FILLER_WORDS = "lesson module video member space course comment reply like share".split()
+
+
+def _filler_block(rng: random.Random, index: int) -> str:
+    words = " ".join(rng.choice(_FILLER_WORDS) for _ in range(40))
+    return (
+        f'<div class="post" data-id="{index}"><h3>{words[:60]}</h3><p>{words}</p>'
+        f'<img src="https://cdn.community.example/img/{index}.png" alt="avatar">'
+        f'<script type="application/json">{{"id":{index},"body":"{words}","likes":{index % 97}}}</script></div>\n'
+    )
+
+
+def _mux_player(playback_id: str, title: str) -> str:
+    return (
+        f'<section class="lesson"><h2>{title}</h2>'
+        f'<mux-player playback-id="{playback_id}" aria-label="{title}"></mux-player>'
+        f'<script>window.__player = {{"title": "{title}", '
+        f'"src": "https://stream.mux.com/{playback_id}.m3u8?token=abc"}};</script></section>\n'
+    )
+
+
+def _playback_id(index: int) -> str:
+    return f"Mx{index:05d}" + "a" * 20
+
+
+def circle_page(target_bytes: int = 4 * 1024 * 1024, videos: int = 12, seed: int = 1) -> tuple[str, int]:
+    """A Circle-style lesson page of roughly ``target_bytes`` with ``videos`` mux players spread through it."""
+    rng = random.Random(seed)
+    head = '<html><head><title>Module 1 | Circle</title><meta property="og:title" content="Module 1"></head><body>\n'
+    parts = [head]
+    size = len(head)
+    index = 0
+    next_video = 0
+    spacing = max(1, target_bytes // max(videos, 1))
+    while size < target_bytes or next_video < videos:
+        if next_video < videos and size >= next_video * spacing:
+            block = _mux_player(_playback_id(next_video), f"Lesson {next_video + 1}")
+            next_video += 1
+        else:
+            block = _filler_block(rng, index)
+            index += 1
+        parts.append(block)
+        size += len(block)
+    parts.append("</body></html>")
+    return "".join(parts), videos
+
+
+def mux_page(players: int = 400, seed: int = 2) -> tuple[str, int]:
+    """A course index page with ``players`` mux players, each with a title nearby."""
+    rng = random.Random(seed)
+    parts = ["<html><head><title>All lessons - Circle</title></head><body>\n"]
+    for index in range(players):
+        parts.append(_filler_block(rng, index))
+        parts.append(_mux_player(_playback_id(index), f"Lesson {index + 1}"))
+    parts.append("</body></html>")
+    return "".join(parts), players
+
+
+def media_urls(html: str) -> list[str]:
+    """The mux URLs in a generated page, as ``direct_media_entries_from_html`` would pass them on."""
+    marker = "https://stream.mux.com/"
+    urls = []
+    start = html.find(marker)
+    while start >= 0:
+        end = html.index('"', start)
+        urls.append(html[start:end])
+        start = html.find(marker, end)
+    return urls
+
+
+def selenium_candidates(videos: int = 2000, seed: int = 3) -> tuple[list[str], int]:
+    """Network-log style candidates: per video an HLS master, its renditions, an mp4, plus images/noise."""
+    rng = random.Random(seed)
+    candidates: list[str] = []
+    for index in range(videos):
+        uuid = f"{index:08x}-1111-2222-3333-{index:012x}"
+        vimeo = f"https://vod-adaptive.akamaized.vimeocdn.com/exp=1/{uuid}/playlist.m3u8"
+        rendition = f"https://vod-adaptive.akamaized.vimeocdn.com/exp=1/{uuid}/sep/video/720.m3u8"
+        candidates.extend(
+            [
+                f"https://cdn.site.example/img/{index}.jpg",
+                rendition,
+                vimeo,
+                vimeo.replace("/", "\\u002f") if index % 5 == 0 else vimeo,
+                f"https://player.vimeo.com/video/{index}",
+                f"https://stream.mux.com/{_playback_id(index)}.m3u8",
+                f"https://cdn.site.example/v/{index}.mp4",
+            ]
+        )
+    rng.shuffle(candidates)
+    # Each video collapses to: one vimeocdn group, one mux, one mp4.
+    return candidates, videos * 3
+
+
+def playlist_batches(videos: int = 20000, pages: int = 4, overlap: float = 0.25) -> tuple[list[list[dict]], int]:
+    """Flat yt-dlp playlist entries split across ``pages`` fetches that overlap by ``overlap``."""
+    per_page = videos // pages
+    step = int(per_page * (1 - overlap))
+    batches = []
+    for page in range(pages):
+        start = page * step
+        batches.append(
+            [
+                {
+                    "_type": "url",
+                    "ie_key": "Youtube",
+                    "id": f"vid{index:07d}",
+                    "url": f"https://www.youtube.com/watch?v=vid{index:07d}",
+                    "title": f"Episode {index}",
+                    "duration": 600 + index % 300,
+                }
+                for index in range(start, start + per_page)
+            ]
+        )
+    unique = (pages - 1) * step + per_page
+    return batches, unique
+
+
+def ffmpeg_progress_lines(lines: int = 100_000) -> tuple[list[str], int]:
+    """``ffmpeg -progress pipe:1`` output: 12-line blocks closed by ``progress=``."""
+    block = 12
+    out: list[str] = []
+    blocks = lines // block
+    for index in range(blocks):
+        us = index * 500_000
+        seconds = us / 1_000_000
+        out.extend(
+            [
+                f"frame={index * 15}\n",
+                "fps=30.00\n",
+                "stream_0_0_q=28.0\n",
+                f"bitrate={1800 + index % 50}.3kbits/s\n",
+                f"total_size={index * 112_000}\n",
+                f"out_time_us={us}\n",
+                f"out_time_ms={us}\n",
+                f"out_time={int(seconds // 3600):02d}:{int(seconds % 3600 // 60):02d}:{seconds % 60:09.6f}\n",
+                "dup_frames=0\n",
+                "drop_frames=0\n",
+                "speed=4.01x\n",
+                "progress=end\n" if index == blocks - 1 else "progress=continue\n",
+            ]
+        )
+    return out, blocks
+
+
+def ffmpeg_stderr_lines(lines: int = 100_000) -> tuple[list[str], int]:
+    """Classic ffmpeg stderr stats lines, with a status line every fourth line."""
+    out = []
+    status = 0
+    for index in range(lines):
+        if index % 4 == 0:
+            seconds = index / 8
+            out.append(
+                f"frame={index:5d} fps= 30 q=28.0 size=   {index * 4}kB "
+                f"time={int(seconds // 3600):02d}:{int(seconds % 3600 // 60):02d}:{seconds % 60:05.2f} "
+                "bitrate=1800.3kbits/s speed=4.01x"
+            )
+            status += 1
+        else:
+            out.append(f"[hls @ 0x55d5] Opening 'https://cdn.example/seg{index}.ts' for reading")
+    return out, status
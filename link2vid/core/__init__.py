@@ -2,7 +2,7 @@
 
 from .downloader import DownloadManager
 from .diagnostics import build_diagnostics
-from .errors import CookiesRequiredError, NoTranscriptAvailableError
+from .errors import CookiesRequiredError, DownloadCancelledError, NoTranscriptAvailableError
 from .error_classification import classify_error, get_error_guidance
 from .extractors import extract_embedded_page_videos, scan_direct_m3u8, scan_direct_media_entries, build_media_entries
 from .fetcher import (
@@ -23,11 +23,24 @@ from .helpers import (
     unique_output_path,
     url_from_clipboard_text,
 )
-from .selenium_fallback import SeleniumMediaResult, selenium_fetch_m3u8, selenium_fetch_media_entries
+
+# Selenium is heavy to import and only needed for the browser fallback, so its
+# exports are resolved on first attribute access.
+_LAZY_SELENIUM_EXPORTS = ("SeleniumMediaResult", "selenium_fetch_m3u8", "selenium_fetch_media_entries")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SELENIUM_EXPORTS:
+        from . import selenium_fallback
+
+        return getattr(selenium_fallback, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "DownloadManager",
     "CookiesRequiredError",
+    "DownloadCancelledError",
     "NoTranscriptAvailableError",
     "build_diagnostics",
     "classify_error",
@@ -0,0 +1,192 @@
+"""Persistent record of completed downloads, checked before a download starts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+ARCHIVE_FILENAME = "download-archive.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    key TEXT NOT NULL,
+    format TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER,
+    title TEXT,
+    url TEXT,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (key, format)
+) WITHOUT ROWID
+"""
+# Columns added after the first release; created on open when missing.
+_VERIFICATION_COLUMNS = (
+    ("verified_at", "REAL"),
+    ("verified_ok", "INTEGER"),
+    ("sha256", "TEXT"),
+    ("duration", "REAL"),
+    ("verify_error", "TEXT"),
+)
+_RECORD_COLUMNS = "key, format, path, size, title, url, completed_at, verified_at, verified_ok, sha256, duration, verify_error"
+
+
+@dataclass(frozen=True)
+class ArchiveRecord:
+    key: str
+    format_id: str
+    path: str
+    size: int | None
+    title: str | None
+    url: str | None
+    completed_at: float
+    verified_at: float | None = None
+    verified_ok: bool | None = None
+    sha256: str | None = None
+    duration: float | None = None
+    verify_error: str | None = None
+
+
+def url_archive_key(url: str) -> str:
+    digest = hashlib.sha256(url.strip().encode("utf-8")).hexdigest()
+    return f"url:{digest[:32]}"
+
+
+def archive_keys(entry: dict | None = None, url: str | None = None) -> list[str]:
+    """Keys identifying one video: ``extractor:id`` when known, plus the URL hash."""
+    keys: list[str] = []
+    entry = entry or {}
+    extractor = entry.get("extractor_key") or entry.get("ie_key") or entry.get("extractor")
+    video_id = entry.get("id")
+    if extractor and video_id:
+        keys.append(f"{str(extractor).lower()}:{video_id}")
+    url = url or entry.get("webpage_url") or entry.get("url")
+    if url:
+        keys.append(url_archive_key(str(url)))
+    return keys
+
+
+class DownloadArchive:
+    """SQLite-backed archive keyed by (video key, format).
+
+    A record only counts as archived while its output file still exists, so
+    deleting a file is enough to make the video downloadable again.
+    """
+
+    def __init__(self, path: str | Path, *, log: Callable[[str], None] | None = None) -> None:
+        self.path = str(path)
+        self.log = log or (lambda _msg: None)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._failed:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(downloads)")}
+            for column, column_type in _VERIFICATION_COLUMNS:
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE downloads ADD COLUMN {column} {column_type}")
+            conn.commit()
+        except sqlite3.Error as exc:
+            self._failed = True
+            self.log(f"[archive] Download archive unavailable ({self.path}): {exc}")
+            return None
+        self._conn = conn
+        return conn
+
+    def lookup(self, keys: Iterable[str], format_id: str) -> ArchiveRecord | None:
+        """Newest record whose file still exists and did not fail verification."""
+        keys = [key for key in keys if key]
+        if not keys:
+            return None
+        placeholders = ", ".join("?" for _ in keys)
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            rows = conn.execute(
+                f"SELECT {_RECORD_COLUMNS} FROM downloads "
+                f"WHERE format = ? AND key IN ({placeholders}) ORDER BY completed_at DESC",
+                (format_id, *keys),
+            ).fetchall()
+        for row in rows:
+            record = _record_from_row(row)
+            if record.verified_ok is False:
+                continue
+            if os.path.isfile(record.path):
+                return record
+        return None
+
+    def record(
+        self,
+        keys: Iterable[str],
+        format_id: str,
+        path: str,
+        *,
+        size: int | None = None,
+        title: str | None = None,
+        url: str | None = None,
+    ) -> None:
+        completed_at = time.time()
+        rows = [(key, format_id, path, size, title, url, completed_at) for key in keys if key]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO downloads (key, format, path, size, title, url, completed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    def record_verification(
+        self,
+        keys: Iterable[str],
+        format_id: str,
+        *,
+        ok: bool,
+        sha256: str | None = None,
+        duration: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        keys = [key for key in keys if key]
+        if not keys:
+            return
+        placeholders = ", ".join("?" for _ in keys)
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute(
+                    "UPDATE downloads SET verified_at = ?, verified_ok = ?, sha256 = ?, duration = ?, verify_error = ? "
+                    f"WHERE format = ? AND key IN ({placeholders})",
+                    (time.time(), int(ok), sha256, duration, error, format_id, *keys),
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _record_from_row(row: tuple) -> ArchiveRecord:
+    values = list(row)
+    if values[8] is not None:
+        values[8] = bool(values[8])
+    return ArchiveRecord(*values)
@@ -0,0 +1,341 @@
+"""Asyncio engine for I/O-bound page scans and thumbnail fetches.
+
+One daemon thread runs an event loop. Other threads hand it coroutines with
+``submit`` (returns a ``concurrent.futures.Future``) or ``run`` (blocks for
+the result). Coroutines must not block the loop: CPU-heavy work such as
+HTML parsing goes through ``in_executor``.
+
+HTTP goes through a shared ``httpx.AsyncClient`` (httpx is a runtime
+dependency and bundled in the frozen build), so hundreds of in-flight
+requests cost one thread. If httpx is missing (e.g. an outdated dev venv),
+``requests`` calls run on a small pool owned by the engine instead and a
+warning is logged: concurrency is still capped by ``max_connections``, but
+at most ``fallback_workers`` requests are in flight at once.
+
+A page scan opens a ``session()`` so its page, iframe and script requests
+share one cookie jar, like the blocking scanners' ``requests.Session``;
+separate scans never see each other's cookies.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Coroutine, TypeVar
+import asyncio
+import functools
+import threading
+import time
+
+T = TypeVar("T")
+ThrottleFn = Callable[[int], float]
+
+DEFAULT_TIMEOUT = 15.0
+CHUNK_SIZE = 8192
+
+
+class ResponseTooLargeError(ValueError):
+    pass
+
+
+class _BorrowedTransport:
+    """A session client's view of the shared connection pool; closing the session leaves the pool open."""
+
+    def __init__(self, pool) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request):
+        return await self._pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HttpxTransport:
+    name = "httpx"
+
+    def __init__(self, *, max_connections: int, timeout: float) -> None:
+        import httpx
+
+        self._httpx = httpx
+        self._timeout = timeout
+        self._pool = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections // 4 or 1),
+        )
+        self._client = httpx.AsyncClient(transport=self._pool, follow_redirects=True, timeout=timeout)
+
+    def open_session(self):
+        # Own cookie jar, shared connections.
+        return self._httpx.AsyncClient(
+            transport=_BorrowedTransport(self._pool),
+            follow_redirects=True,
+            timeout=self._timeout,
+        )
+
+    async def close_session(self, session) -> None:
+        await session.aclose()
+
+    async def get_text(self, url: str, headers: dict | None, timeout: float, session=None) -> str:
+        response = await (session or self._client).get(url, headers=headers, timeout=timeout)
+        return response.text
+
+    async def get_bytes(
+        self,
+        url: str,
+        headers: dict | None,
+        timeout: float,
+        max_bytes: int,
+        throttle: ThrottleFn | None,
+    ) -> bytes:
+        async with self._client.stream("GET", url, headers=headers, timeout=timeout) as response:
+            response.raise_for_status()
+            _check_content_length(response.headers.get("content-length"), max_bytes)
+            data = bytearray()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                data.extend(chunk)
+                if len(data) > max_bytes:
+                    raise ResponseTooLargeError("Response too large")
+                delay = throttle(len(chunk)) if throttle is not None else 0.0
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            return bytes(data)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class RequestsTransport:
+    """Fallback: blocking ``requests`` calls on a bounded pool.
+
+    Calls outside a ``session()`` use one Session per worker thread.
+    """
+
+    name = "requests"
+
+    def __init__(self, *, workers: int) -> None:
+        self.workers = workers
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="link2vid-http")
+        self._local = threading.local()
+
+    def _session(self):
+        import requests
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    async def _in_pool(self, func: Callable[[], T]) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._pool, func)
+
+    def open_session(self):
+        import requests
+
+        return requests.Session()
+
+    async def close_session(self, session) -> None:
+        session.close()
+
+    async def get_text(self, url: str, headers: dict | None, timeout: float, session=None) -> str:
+        return await self._in_pool(lambda: (session or self._session()).get(url, headers=headers, timeout=timeout).text)
+
+    async def get_bytes(
+        self,
+        url: str,
+        headers: dict | None,
+        timeout: float,
+        max_bytes: int,
+        throttle: ThrottleFn | None,
+    ) -> bytes:
+        def download() -> bytes:
+            with self._session().get(url, headers=headers, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                _check_content_length(response.headers.get("content-length"), max_bytes)
+                data = bytearray()
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    if not chunk:
+                        continue
+                    data.extend(chunk)
+                    if len(data) > max_bytes:
+                        raise ResponseTooLargeError("Response too large")
+                    delay = throttle(len(chunk)) if throttle is not None else 0.0
+                    if delay > 0:
+                        time.sleep(delay)
+                return bytes(data)
+
+        return await self._in_pool(download)
+
+    async def aclose(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _check_content_length(value: str | None, max_bytes: int) -> None:
+    if value and value.isdigit() and int(value) > max_bytes:
+        raise ResponseTooLargeError("Response too large")
+
+
+def default_transport(*, max_connections: int, timeout: float, fallback_workers: int):
+    try:
+        return HttpxTransport(max_connections=max_connections, timeout=timeout)
+    except ImportError:
+        return RequestsTransport(workers=fallback_workers)
+
+
+class ScanSession:
+    """Requests that share one cookie jar; get one from ``AsyncEngine.session()``."""
+
+    def __init__(self, engine: AsyncEngine, handle) -> None:
+        self._engine = engine
+        self._handle = handle
+
+    async def get_text(self, url: str, headers: dict | None = None, *, timeout: float | None = None) -> str:
+        return await self._engine.get_text(url, headers, timeout=timeout, session=self._handle)
+
+
+class AsyncEngine:
+    """Background event loop plus a concurrency-capped HTTP client.
+
+    The loop thread starts on first use. Coroutines must not block: parsing
+    goes through ``in_executor`` (``parse_workers`` threads); image decoding
+    stays on the caller's executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 64,
+        timeout: float = DEFAULT_TIMEOUT,
+        fallback_workers: int = 8,
+        parse_workers: int = 2,
+        transport_factory: Callable[[], Any] | None = None,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.parse_workers = parse_workers
+        self.log = log or (lambda _msg: None)
+        self._transport_factory = transport_factory or (
+            lambda: default_transport(
+                max_connections=max_connections,
+                timeout=timeout,
+                fallback_workers=fallback_workers,
+            )
+        )
+        self._transport = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def transport_name(self) -> str | None:
+        return getattr(self._transport, "name", None)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+                    loop.close()
+
+                self._thread = threading.Thread(target=run, name="link2vid-async", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run ``coro`` on the engine and wait for it (never from the loop thread itself)."""
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("AsyncEngine.run() called from the engine thread; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    def _client(self):
+        if self._transport is None:
+            self._transport = self._transport_factory()
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+            if isinstance(self._transport, RequestsTransport):
+                self.log(
+                    "[async] httpx is not installed; page scans and thumbnails fall back to "
+                    f"{self._transport.workers} blocking requests workers. Run: pip install -r requirements.txt"
+                )
+            else:
+                self.log(f"[async] HTTP engine using {self.transport_name}.")
+        return self._transport
+
+    async def in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """``func(*args)`` on the engine's parse pool, keeping the loop free for I/O."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.parse_workers, thread_name_prefix="link2vid-parse")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args))
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ScanSession]:
+        """A ``ScanSession`` with its own cookie jar, closed on exit."""
+        transport = self._client()
+        handle = transport.open_session()
+        try:
+            yield ScanSession(self, handle)
+        finally:
+            await transport.close_session(handle)
+
+    async def get_text(
+        self,
+        url: str,
+        headers: dict | None = None,
+        *,
+        timeout: float | None = None,
+        session=None,
+    ) -> str:
+        transport = self._client()
+        async with self._semaphore:
+            return await transport.get_text(url, headers, timeout or self.timeout, session)
+
+    async def get_bytes(
+        self,
+        url: str,
+        headers: dict | None = None,
+        *,
+        timeout: float | None = None,
+        max_bytes: int = 5 * 1024 * 1024,
+        throttle: ThrottleFn | None = None,
+    ) -> bytes:
+        """Body of ``url``; raises ``ResponseTooLargeError`` past ``max_bytes``.
+
+        ``throttle(nbytes)`` returns a delay (``BandwidthGovernor.reserve``).
+        """
+        transport = self._client()
+        async with self._semaphore:
+            return await transport.get_bytes(url, headers, timeout or self.timeout, max_bytes, throttle)
+
+    def close(self) -> None:
+        with self._lock:
+            loop, self._loop = self._loop, None
+            thread, self._thread = self._thread, None
+        if loop is None:
+            return
+        if self._transport is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._transport.aclose(), loop).result(5)
+            except Exception as exc:
+                self.log(f"[async] Closing HTTP client failed: {exc}")
+            self._transport = None
+        loop.call_soon_threadsafe(loop.stop)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if thread is not None:
+            thread.join(timeout=5)
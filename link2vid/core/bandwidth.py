@@ -0,0 +1,192 @@
+"""Token-bucket bandwidth limits shared by downloads and thumbnail fetches."""
+
+from __future__ import annotations
+
+from typing import Callable, Mapping
+from urllib.parse import urlparse
+import itertools
+import threading
+import time
+
+
+def host_for_url(url: str | None) -> str:
+    host = (urlparse(url or "").hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class TokenBucket:
+    """Bytes-per-second bucket; ``rate=None`` means unlimited.
+
+    ``reserve`` never blocks: it takes the bytes (going into debt if needed)
+    and returns how long the caller should sleep, so concurrent callers queue
+    up fairly behind each other.
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        *,
+        burst_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.burst_seconds = burst_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.rate: float | None = None
+        self._tokens = 0.0
+        self._updated = clock()
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float | None) -> None:
+        with self._lock:
+            self.rate = rate if rate and rate > 0 else None
+            self._tokens = self._capacity()
+            self._updated = self._clock()
+
+    def _capacity(self) -> float:
+        return (self.rate or 0.0) * self.burst_seconds
+
+    def reserve(self, nbytes: int) -> float:
+        with self._lock:
+            if self.rate is None:
+                return 0.0
+            now = self._clock()
+            self._tokens = min(self._capacity(), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= nbytes
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class BandwidthGovernor:
+    """Global and per-host byte-rate limits, adjustable at runtime.
+
+    Link2Vid's own HTTP reads call ``throttle`` per chunk. yt-dlp downloads
+    ``attach`` their live ``params`` dict instead: the governor writes a
+    ``ratelimit`` share into it (limit divided by concurrent downloads) and
+    rewrites it whenever downloads start, finish or the limits change, which
+    yt-dlp picks up on its next chunk.
+
+    That only reaches single-file HTTP downloads. For native HLS/DASH,
+    yt-dlp's fragment downloader copies ``params`` when it starts, so the
+    share in effect at that moment stays fixed for the whole download.
+
+    Host limits match the host and its subdomains (``example.com`` also
+    covers ``cdn.example.com``).
+    """
+
+    def __init__(
+        self,
+        global_bps: float | None = None,
+        host_bps: Mapping[str, float | None] | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._global = TokenBucket(global_bps, clock=clock)
+        self._host_limits: dict[str, float] = {}
+        self._host_buckets: dict[str, TokenBucket] = {}
+        self._leases: dict[int, tuple[str | None, dict]] = {}  # id -> (url, params)
+        self._lease_ids = itertools.count()
+        for host, bps in (host_bps or {}).items():
+            if bps:
+                self._host_limits[host_for_url(f"//{host}")] = float(bps)
+
+    @property
+    def global_limit(self) -> float | None:
+        return self._global.rate
+
+    def set_global_limit(self, bps: float | None) -> None:
+        self._global.set_rate(bps)
+        self._rebalance()
+
+    def set_host_limit(self, host: str, bps: float | None) -> None:
+        host = host_for_url(f"//{host}")
+        with self._lock:
+            if bps:
+                self._host_limits[host] = float(bps)
+            else:
+                self._host_limits.pop(host, None)
+            self._host_buckets.pop(host, None)
+        self._rebalance()
+
+    def _limited_host(self, url: str | None) -> str | None:
+        """The configured host entry covering ``url``, if any (caller holds the lock)."""
+        labels = host_for_url(url).split(".")
+        for index in range(len(labels)):
+            candidate = ".".join(labels[index:])
+            if candidate in self._host_limits:
+                return candidate
+        return None
+
+    def throttle(self, url: str | None, nbytes: int) -> float:
+        """Account ``nbytes`` read from ``url``; sleeps as needed and returns the delay."""
+        delay = self.reserve(url, nbytes)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    def reserve(self, url: str | None, nbytes: int) -> float:
+        """Like ``throttle`` but only returns the delay (for callers that sleep asynchronously)."""
+        with self._lock:
+            host = self._limited_host(url)
+            bucket = None
+            if host is not None:
+                bucket = self._host_buckets.get(host)
+                if bucket is None:
+                    bucket = self._host_buckets[host] = TokenBucket(self._host_limits[host], clock=self._clock)
+        delay = self._global.reserve(nbytes)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve(nbytes))
+        return delay
+
+    def attach(self, url: str | None, params: dict) -> Callable[[], None]:
+        """Manage ``params["ratelimit"]`` of one yt-dlp download; returns a detach function."""
+        with self._lock:
+            lease_id = next(self._lease_ids)
+            self._leases[lease_id] = (url, params)
+        self._rebalance()
+
+        def detach() -> None:
+            with self._lock:
+                self._leases.pop(lease_id, None)
+            self._rebalance()
+
+        return detach
+
+    def _rebalance(self) -> None:
+        global_limit = self._global.rate
+        with self._lock:
+            leases = [(self._limited_host(url), params) for url, params in self._leases.values()]
+            per_host: dict[str | None, int] = {}
+            for host, _params in leases:
+                per_host[host] = per_host.get(host, 0) + 1
+            for host, params in leases:
+                shares = []
+                if global_limit:
+                    shares.append(global_limit / len(leases))
+                if host is not None:
+                    shares.append(self._host_limits[host] / per_host[host])
+                if shares:
+                    params["ratelimit"] = max(1, int(min(shares)))
+                else:
+                    params.pop("ratelimit", None)
+
+
+def governor_from_config(config: Mapping | None) -> BandwidthGovernor:
+    """Build a governor from ``developer.json`` (``bandwidth_limit_kbps`` / ``bandwidth_host_limits_kbps``)."""
+    config = config or {}
+
+    def to_bps(value) -> float | None:
+        try:
+            return float(value) * 1024 if value else None
+        except (TypeError, ValueError):
+            return None
+
+    host_limits = config.get("bandwidth_host_limits_kbps") or {}
+    return BandwidthGovernor(
+        to_bps(config.get("bandwidth_limit_kbps")),
+        {host: to_bps(kbps) for host, kbps in host_limits.items()} if isinstance(host_limits, Mapping) else None,
+    )
@@ -0,0 +1,158 @@
+"""Multi-URL fetch: parse a pasted list or file, fetch concurrently, merge the results."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+from urllib.parse import urlsplit, urlunsplit
+import re
+
+from .extractors import hls_result_entries
+from .fetcher import DirectHlsFound, FetchError, FetchResults, NeedsCookies, NeedsSelenium, VideoFetcher
+from .helpers import _trim_trailing_url_junk, is_usable_http_url, normalize_url
+
+# Commas are valid inside URLs, but one directly followed by another URL separates them.
+_URL_TOKEN = re.compile(r"https?://(?:[^\s<>\"',]|,(?!\s*https?://))+", re.IGNORECASE)
+
+CredentialsFn = Callable[[str], tuple[str | None, str | None]]
+
+
+@dataclass
+class BatchFetchItem:
+    url: str
+    status: str  # "ok", "needs_cookies", "needs_selenium" or "failed"
+    entries: list[dict] = field(default_factory=list)
+    error: Exception | None = None
+
+
+@dataclass
+class BatchFetchResult:
+    entries: list[dict]
+    items: list[BatchFetchItem]
+    duplicates: int = 0
+
+    @property
+    def failures(self) -> list[BatchFetchItem]:
+        return [item for item in self.items if item.status != "ok"]
+
+
+def url_dedupe_key(url: str) -> str:
+    """``url`` normalized for comparison: https, lowercase host, no fragment or trailing slash."""
+    parts = urlsplit(normalize_url(url))
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def parse_url_list(text: str | None) -> list[str]:
+    """Normalized, de-duplicated http(s) URLs from ``text``, in first-seen order.
+
+    Accepts one URL per line as well as URLs separated by spaces or commas;
+    ``#`` comment lines and anything that is not an http(s) URL are ignored.
+    """
+    urls: list[str] = []
+    seen: set[str] = set()
+    for line in (text or "").splitlines():
+        if line.lstrip().startswith("#"):
+            continue
+        for match in _URL_TOKEN.finditer(line):
+            url = normalize_url(_trim_trailing_url_junk(match.group(0)))
+            if not is_usable_http_url(url):
+                continue
+            key = url_dedupe_key(url)
+            if key in seen:
+                continue
+            seen.add(key)
+            urls.append(url)
+    return urls
+
+
+def entry_dedupe_keys(entry: dict) -> list[str]:
+    """``extractor:id`` when known, plus the normalized page / media URL."""
+    keys: list[str] = []
+    extractor = entry.get("extractor_key") or entry.get("ie_key") or entry.get("extractor")
+    video_id = entry.get("id")
+    if extractor and video_id:
+        keys.append(f"id:{str(extractor).lower()}:{video_id}")
+    for name in ("webpage_url", "url"):
+        value = entry.get(name)
+        if isinstance(value, str) and is_usable_http_url(value):
+            keys.append(f"url:{url_dedupe_key(value)}")
+    return keys
+
+
+def merge_entries(batches: Iterable[list[dict]]) -> tuple[list[dict], int]:
+    """Concatenate ``batches`` keeping the first entry per video; returns ``(entries, dropped)``."""
+    merged: list[dict] = []
+    seen: set[str] = set()
+    dropped = 0
+    for entries in batches:
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            keys = entry_dedupe_keys(entry)
+            if any(key in seen for key in keys):
+                dropped += 1
+                continue
+            seen.update(keys)
+            merged.append(entry)
+    return merged, dropped
+
+
+def _item_for_outcome(url: str, outcome) -> BatchFetchItem:
+    if isinstance(outcome, FetchResults):
+        return BatchFetchItem(url=url, status="ok", entries=list(outcome.entries), error=outcome.error)
+    if isinstance(outcome, DirectHlsFound):
+        return BatchFetchItem(url=url, status="ok", entries=hls_result_entries(url, outcome.result))
+    if isinstance(outcome, NeedsCookies):
+        return BatchFetchItem(url=url, status="needs_cookies", error=outcome.error)
+    if isinstance(outcome, NeedsSelenium):
+        return BatchFetchItem(url=url, status="needs_selenium", error=outcome.error)
+    if isinstance(outcome, FetchError):
+        return BatchFetchItem(url=url, status="failed", error=outcome.error)
+    return BatchFetchItem(url=url, status="failed", error=RuntimeError("Fetch failed without details"))
+
+
+def fetch_batch(
+    fetcher: VideoFetcher,
+    urls: list[str],
+    *,
+    max_workers: int = 4,
+    credentials_for: CredentialsFn | None = None,
+    on_item: Callable[[BatchFetchItem, int, int], None] | None = None,
+    log: Callable[[str], None] | None = None,
+) -> BatchFetchResult:
+    """Run ``fetcher.fetch`` for every URL with bounded parallelism.
+
+    Entries are merged in input order (not completion order) and
+    de-duplicated by video id and URL. URLs that need cookies or Selenium are
+    reported, not prompted for: those flows are interactive and stay
+    single-URL. ``on_item`` is called from worker threads with
+    ``(item, done, total)``.
+    """
+    logger = log or (lambda _msg: None)
+    credentials_for = credentials_for or (lambda _url: (None, None))
+
+    def fetch_one(url: str) -> BatchFetchItem:
+        try:
+            username, password = credentials_for(url)
+            return _item_for_outcome(url, fetcher.fetch(url, username, password))
+        except Exception as exc:
+            return BatchFetchItem(url=url, status="failed", error=exc)
+
+    total = len(urls)
+    if not total:
+        return BatchFetchResult(entries=[], items=[])
+    items: dict[str, BatchFetchItem] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total)), thread_name_prefix="link2vid-batch") as pool:
+        futures = {pool.submit(fetch_one, url): url for url in urls}
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = future.result()
+            items[futures[future]] = item
+            if on_item is not None:
+                on_item(item, done, total)
+    ordered = [items[url] for url in urls]
+    entries, duplicates = merge_entries(item.entries for item in ordered)
+    ok = sum(1 for item in ordered if item.status == "ok")
+    logger(f"[batch] {ok}/{total} URL(s) fetched, {len(entries)} entries ({duplicates} duplicate(s) dropped).")
+    return BatchFetchResult(entries=entries, items=ordered, duplicates=duplicates)
@@ -0,0 +1,130 @@
+"""Parallel probing of browser cookie jars for sites that need a signed-in session.
+
+Instead of running a full yt-dlp extraction once per browser, every
+candidate jar is loaded concurrently and checked with one plain request to
+the page. Only jars that pass are handed to yt-dlp (as a temporary
+cookies.txt, so the browser database is not decrypted a second time).
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Sequence
+from urllib.parse import urlparse
+import os
+import tempfile
+import time
+
+from .dev_defaults import host_matches_domain
+
+LOGIN_PATH_SIGNALS = ("login", "signin", "sign_in", "sign-in", "accounts.", "/auth")
+PROBE_TIMEOUT = 10.0
+
+JarLoader = Callable[[str], Any]
+SessionCheck = Callable[[str, Any], None]
+
+
+@dataclass
+class CookieProbeResult:
+    browser: str
+    jar: Any = None
+    site_cookies: int = 0
+    verified: bool = False
+    error: Exception | None = None
+    seconds: float = 0.0
+
+    @property
+    def usable(self) -> bool:
+        """Jar loaded and holds cookies for the site (verified or not)."""
+        return self.jar is not None and self.site_cookies > 0
+
+
+def site_cookie_count(jar, url: str) -> int:
+    host = urlparse(url).hostname or ""
+    return sum(1 for cookie in jar if host_matches_domain(host, cookie.domain.lstrip(".")))
+
+
+def looks_like_login_url(url: str) -> bool:
+    parsed = urlparse(url)
+    target = f"{parsed.hostname or ''}{parsed.path}".lower()
+    return any(token in target for token in LOGIN_PATH_SIGNALS)
+
+
+def load_browser_jar(browser: str, logger=None):
+    from yt_dlp.cookies import extract_cookies_from_browser
+
+    if logger is None:
+        return extract_cookies_from_browser(browser)
+    return extract_cookies_from_browser(browser, logger=logger)
+
+
+def check_session(url: str, jar, *, timeout: float = PROBE_TIMEOUT) -> None:
+    """One GET of ``url`` with ``jar``; raises unless it lands on a non-login page."""
+    import requests
+
+    with requests.get(url, cookies=jar, timeout=timeout, stream=True, allow_redirects=True) as response:
+        if response.status_code >= 400:
+            raise RuntimeError(f"HTTP Error {response.status_code}")
+        if looks_like_login_url(response.url) and not looks_like_login_url(url):
+            raise RuntimeError(f"redirected to login page ({urlparse(response.url).netloc})")
+
+
+def save_cookiefile(jar) -> str:
+    """Write ``jar`` to a temporary Netscape cookies.txt; the caller removes it."""
+    handle, path = tempfile.mkstemp(prefix="link2vid-cookies-", suffix=".txt")
+    os.close(handle)
+    jar.save(path)
+    return path
+
+
+class BrowserCookieProber:
+    """Loads and checks candidate browser jars concurrently."""
+
+    def __init__(
+        self,
+        *,
+        load_jar: JarLoader | None = None,
+        check: SessionCheck | None = None,
+        max_workers: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.load_jar = load_jar or load_browser_jar
+        self.check = check or check_session
+        self.max_workers = max_workers
+        self._clock = clock
+
+    def _probe_one(self, url: str, browser: str) -> CookieProbeResult:
+        started = self._clock()
+        result = CookieProbeResult(browser=browser)
+        try:
+            result.jar = self.load_jar(browser)
+            result.site_cookies = site_cookie_count(result.jar, url)
+            if result.site_cookies:
+                self.check(url, result.jar)
+                result.verified = True
+            else:
+                result.error = RuntimeError(f"no cookies for {urlparse(url).hostname or 'this site'}")
+        except Exception as exc:
+            result.error = exc
+        result.seconds = self._clock() - started
+        return result
+
+    def probe(self, url: str, browsers: Sequence[str]) -> Iterator[CookieProbeResult]:
+        """Results in ``browsers`` order, each yielded as soon as it and its predecessors finish.
+
+        Probes start together, so a caller that stops at the first verified
+        jar waits only as long as the slowest higher-priority browser.
+        """
+        if not browsers:
+            return
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(browsers)),
+            thread_name_prefix="link2vid-cookie-probe",
+        )
+        try:
+            futures: list[Future] = [pool.submit(self._probe_one, url, browser) for browser in browsers]
+            for future in futures:
+                yield future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
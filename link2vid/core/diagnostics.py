@@ -26,6 +26,10 @@ def build_diagnostics(
     last_error: str | None,
     last_error_reason: str | None,
     log_history: Iterable[str] | None,
+    ffprobe_path: str | None = None,
+    running_browsers: Iterable[str] | None = None,
+    environment_probed: bool = True,
+    performance_summary: Iterable[str] | None = None,
 ) -> list[str]:
     action_kind_value = action_kind or "n/a"
     transcript_source_value = transcript_source or "n/a"
@@ -36,7 +40,12 @@ def build_diagnostics(
     js_runtime_used_value = js_runtime_used or "n/a"
     js_runtime_path_value = js_runtime_path or "n/a"
     remote_components_value = ", ".join(remote_components or []) or "none"
+    running_browsers_value = ", ".join(running_browsers or []) or "none"
+    if not environment_probed:
+        running_browsers_value = "probe pending"
     log_tail = list(log_history or [])[-20:]
+    performance_lines = list(performance_summary or [])
+    performance_section = ["-- Performance --", *performance_lines] if performance_lines else []
 
     return [
         "Link2Vid Diagnostics",
@@ -49,15 +58,18 @@ def build_diagnostics(
         f"Transcript source: {transcript_source_value}",
         f"Transcript languages: {transcript_languages_value}",
         f"yt-dlp version: {yt_dlp_version}",
-        f"ffmpeg: {ffmpeg_path or 'not found'}",
+        f"ffmpeg: {ffmpeg_path or ('not found' if environment_probed else 'probe pending')}",
+        f"ffprobe: {ffprobe_path or ('not found' if environment_probed else 'probe pending')}",
         f"JS runtime: {js_runtime_value}",
         f"yt-dlp JS runtime: {js_runtime_used_value}",
         f"yt-dlp JS runtime path: {js_runtime_path_value}",
         f"EJS remote components: {remote_components_value}",
         f"Cookies mode: {cookies_mode_value}",
         f"Cookies browser: {cookies_browser_value}",
+        f"Running browsers: {running_browsers_value}",
         f"Last error: {last_error or 'n/a'}",
         f"Last classified error: {last_error_reason or 'n/a'}",
+        *performance_section,
         "-- Recent log --",
         *log_tail,
     ]
@@ -2,22 +2,49 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable
-
-from .errors import CookiesRequiredError, NoTranscriptAvailableError
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, TypeVar
+
+from .bandwidth import BandwidthGovernor
+from .browser_cookies import BrowserCookieProber, CookieProbeResult, load_browser_jar, save_cookiefile
+from .cancellation import CancelToken
+from .environment import JS_RUNTIME_CANDIDATES, EnvironmentProbe, running_browsers
+from .error_classification import is_auth_error
+from .errors import CookiesRequiredError, DownloadCancelledError, NoTranscriptAvailableError
+from .retry import RetryScheduler
+from .site_profiles import SiteProfileStore
+from .telemetry import Telemetry, maybe_span
+import os
 import sys
-import subprocess
 import re
+import time
 import shutil
+import threading
 from urllib.parse import urlparse
-import yt_dlp
+
+
+SUBTITLE_EXT_PREFERENCE = ("vtt", "srt")
+
+T = TypeVar("T")
 
 
 @dataclass
 class TranscriptDownloadResult:
     source: str
     languages: list[str]
+    path: str | None = None
+
+
+@dataclass
+class CallState:
+    """Cookies and JS runtime used by one ``DownloadManager`` call."""
+
+    cookies_mode: str = "none"
+    cookies_browser: str | None = None
+    js_runtime: str | None = None
+    js_runtime_path: str | None = None
+    remote_components: list[str] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -25,6 +52,7 @@ class TranscriptTrack:
     source: str
     language: str
     label: str
+    search_key: str = field(default="", compare=False, repr=False)
 
 
 class DownloadManager:
@@ -36,17 +64,59 @@ class DownloadManager:
         log_error: Callable[[str, Exception], None] | None = None,
         dev_defaults: dict | None = None,
         get_cookies_path: Callable[[], str | None] | None = None,
+        environment: EnvironmentProbe | None = None,
+        telemetry: Telemetry | None = None,
+        bandwidth: BandwidthGovernor | None = None,
+        retry: RetryScheduler | None = None,
+        cookie_prober: BrowserCookieProber | None = None,
+        site_profiles: SiteProfileStore | None = None,
     ) -> None:
         self.ydl_logger = ydl_logger
         self.log = log or (lambda _msg: None)
         self.log_error = log_error or (lambda _stage, _err: None)
         self.dev_defaults = dev_defaults or {}
         self.get_cookies_path = get_cookies_path or (lambda: None)
-        self.last_cookies_mode = "none"
-        self.last_cookies_browser = None
-        self.last_js_runtime = None
-        self.last_js_runtime_path = None
-        self.last_remote_components = []
+        self.environment = environment
+        self.telemetry = telemetry
+        self.bandwidth = bandwidth
+        self.retry = retry or RetryScheduler(log=self.log)
+        self.cookie_prober = cookie_prober or BrowserCookieProber(
+            load_jar=lambda browser: load_browser_jar(browser, self.ydl_logger)
+        )
+        self.site_profiles = site_profiles
+        # Calls run concurrently (bulk transcript export, batch fetch), so each
+        # thread records into its own CallState; diagnostics read the latest one.
+        self._local = threading.local()
+        self._last_state = CallState()
+
+    def _begin_call(self) -> CallState:
+        state = self._local.state = CallState()
+        self._last_state = state
+        return state
+
+    def _state(self) -> CallState:
+        state = getattr(self._local, "state", None)
+        return state if state is not None else self._begin_call()
+
+    @property
+    def last_cookies_mode(self) -> str:
+        return self._last_state.cookies_mode
+
+    @property
+    def last_cookies_browser(self) -> str | None:
+        return self._last_state.cookies_browser
+
+    @property
+    def last_js_runtime(self) -> str | None:
+        return self._last_state.js_runtime
+
+    @property
+    def last_js_runtime_path(self) -> str | None:
+        return self._last_state.js_runtime_path
+
+    @property
+    def last_remote_components(self) -> list[str]:
+        return self._last_state.remote_components
 
     def _browser_name(self) -> str:
         browser = None
@@ -57,74 +127,42 @@ class DownloadManager:
         return browser
 
     def _running_browsers(self) -> list[str]:
-        candidates: list[str] = []
-        output = ""
-        if sys.platform.startswith("win"):
-            try:
-                result = subprocess.run(["tasklist"], capture_output=True, text=True, check=False)
-                output = result.stdout.lower()
-            except Exception:
-                return []
-            process_map = {
-                "msedge.exe": "edge",
-                "brave.exe": "brave",
-                "chrome.exe": "chrome",
-                "firefox.exe": "firefox",
-            }
-        else:
-            try:
-                result = subprocess.run(["ps", "-A"], capture_output=True, text=True, check=False)
-                output = result.stdout.lower()
-            except Exception:
-                return []
-            process_map = {
-                "microsoft-edge": "edge",
-                "msedge": "edge",
-                "brave-browser": "brave",
-                "brave": "brave",
-                "chrome": "chrome",
-                "chromium": "chrome",
-                "firefox": "firefox",
-            }
-        for process, browser in process_map.items():
-            if process in output:
-                candidates.append(browser)
-        return candidates
+        if self.environment is not None:
+            return self.environment.browsers()
+        return running_browsers()
 
     def _reset_cookie_state(self) -> None:
-        self.last_cookies_mode = "none"
-        self.last_cookies_browser = None
+        state = self._state()
+        state.cookies_mode = "none"
+        state.cookies_browser = None
 
     def _apply_cookies(self, opts: dict) -> None:
         cookies_path = self.get_cookies_path()
         if cookies_path:
             opts["cookiefile"] = cookies_path
-            self.last_cookies_mode = "cookies.txt"
+            self._state().cookies_mode = "cookies.txt"
 
     def _mark_browser_cookies(self, browser: str) -> None:
-        self.last_cookies_mode = "browser"
-        self.last_cookies_browser = browser
+        state = self._state()
+        state.cookies_mode = "browser"
+        state.cookies_browser = browser
+
+    def cookie_source(self) -> str:
+        """Cookies used by this thread's last call: ``none``, ``cookies.txt`` or ``browser:<name>``."""
+        state = self._state()
+        if state.cookies_mode == "browser" and state.cookies_browser:
+            return f"browser:{state.cookies_browser}"
+        return state.cookies_mode or "none"
+
+    def _remembered_cookie_browser(self, url: str, opts: dict) -> str | None:
+        """Browser whose cookies last worked for this site, unless cookies.txt is in use."""
+        if self.site_profiles is None or opts.get("cookiefile"):
+            return None
+        profile = self.site_profiles.get(url)
+        return profile.cookie_browser if profile is not None else None
 
     def _is_cookie_error(self, err: Exception) -> bool:
-        message = str(err).lower()
-        signals = (
-            "account",
-            "cookie",
-            "cookies",
-            "consent",
-            "sign in",
-            "signin",
-            "login",
-            "age-restricted",
-            "age restricted",
-            "age verification",
-            "403",
-            "forbidden",
-            "bot",
-            "verify",
-            "verification",
-        )
-        return any(token in message for token in signals)
+        return is_auth_error(err)
 
     def _browser_candidates(self) -> list[str]:
         ordered: list[str] = []
@@ -151,13 +189,9 @@ class DownloadManager:
         return ordered
 
     def _select_js_runtime(self) -> tuple[str | None, str | None]:
-        candidates = [
-            ("deno", "deno"),
-            ("node", "node"),
-            ("bun", "bun"),
-            ("quickjs", "qjs"),
-        ]
-        for runtime, exe in candidates:
+        if self.environment is not None:
+            return self.environment.preferred_js_runtime()
+        for runtime, exe in JS_RUNTIME_CANDIDATES:
             path = shutil.which(exe)
             if path:
                 return runtime, path
@@ -165,15 +199,16 @@ class DownloadManager:
 
     def _apply_js_runtime_opts(self, opts: dict) -> None:
         runtime, path = self._select_js_runtime()
-        self.last_js_runtime = runtime
-        self.last_js_runtime_path = path
+        state = self._state()
+        state.js_runtime = runtime
+        state.js_runtime_path = path
         if runtime:
             opts["js_runtimes"] = {runtime: {"path": path} if path else {}}
             components = ["ejs:github"]
             if runtime in ("deno", "bun"):
                 components.append("ejs:npm")
             opts["remote_components"] = components
-            self.last_remote_components = components
+            state.remote_components = components
             self.log(f"[yt-dlp] JS runtime selected: {runtime} ({path})")
             self.log(f"[yt-dlp] EJS remote components enabled: {', '.join(components)}")
             try:
@@ -183,9 +218,73 @@ class DownloadManager:
             except Exception:
                 self.log("[yt-dlp] EJS package not detected; relying on remote components.")
         else:
-            self.last_remote_components = []
+            state.remote_components = []
             self.log("[yt-dlp] No JS runtime found; EJS challenge solver will be unavailable.")
 
+    def _apply_telemetry_hooks(self, opts: dict) -> None:
+        telemetry = self.telemetry
+        if telemetry is None:
+            return
+        postprocess_started: dict[str, float] = {}
+
+        def progress_hook(d: dict) -> None:
+            if d.get("status") != "finished":
+                return
+            elapsed = float(d.get("elapsed") or 0.0)
+            size = d.get("total_bytes") or d.get("downloaded_bytes") or 0
+            telemetry.record(
+                "ytdlp.download_stream",
+                elapsed,
+                bytes=size,
+                bytes_per_s=round(size / elapsed) if elapsed > 0 else None,
+            )
+            telemetry.count("download.bytes", size)
+
+        def postprocessor_hook(d: dict) -> None:
+            name = str(d.get("postprocessor") or "unknown")
+            if d.get("status") == "started":
+                postprocess_started[name] = time.perf_counter()
+            elif d.get("status") == "finished" and name in postprocess_started:
+                elapsed = time.perf_counter() - postprocess_started.pop(name)
+                telemetry.record("ytdlp.postprocess", elapsed, postprocessor=name)
+
+        opts["progress_hooks"] = [*opts.get("progress_hooks", []), progress_hook]
+        opts["postprocessor_hooks"] = [*opts.get("postprocessor_hooks", []), postprocessor_hook]
+
+    @contextmanager
+    def _bandwidth_lease(self, url: str, ydl) -> Iterator[None]:
+        """Let the governor adjust this download's ``ratelimit`` while it runs.
+
+        Fragmented formats read the value once at start (see ``BandwidthGovernor``).
+        """
+        params = getattr(ydl, "params", None)
+        if self.bandwidth is None or not isinstance(params, dict):
+            yield
+            return
+        detach = self.bandwidth.attach(url, params)
+        try:
+            yield
+        finally:
+            detach()
+
+    def _apply_cancel_hooks(self, opts: dict, cancel_token: CancelToken | None) -> None:
+        if cancel_token is None:
+            return
+        cancel_token.raise_if_cancelled()
+
+        def check(_d: dict) -> None:
+            cancel_token.raise_if_cancelled()
+
+        # First in line so a cancelled download stops before any other hook runs.
+        opts["progress_hooks"] = [check, *opts.get("progress_hooks", [])]
+        opts["postprocessor_hooks"] = [check, *opts.get("postprocessor_hooks", [])]
+
+    def _raise_if_cancelled(self, cancel_token: CancelToken | None, err: Exception) -> None:
+        # yt-dlp may re-wrap the hook's exception, so trust the token over the type.
+        if isinstance(err, DownloadCancelledError) or (cancel_token is not None and cancel_token.cancelled):
+            self.log("[yt-dlp] Download cancelled.")
+            raise DownloadCancelledError() from err
+
     def _strip_ansi(self, text: str) -> str:
         return re.sub(r"\x1b\[[0-9;]*m", "", text or "")
 
@@ -214,6 +313,112 @@ class DownloadManager:
         parsed = urlparse(url)
         return parsed.netloc or "this site"
 
+    def _cookie_probe_mode(self) -> str:
+        mode = str(self.dev_defaults.get("browser_cookie_probe") or "parallel").lower()
+        return mode if mode in ("parallel", "sequential") else "parallel"
+
+    def _log_browser_cookie_failure(self, browser: str, err: Exception) -> None:
+        self.log(f"[yt-dlp] Browser cookies ({browser}) failed: {self._format_exception(err)}")
+        hint = self._cookie_failure_hint(err)
+        if hint:
+            self.log(f"[yt-dlp] {hint}")
+
+    def _retry_with_browser_cookies(
+        self,
+        url: str,
+        opts: dict,
+        first_err: Exception,
+        attempt: Callable[[dict, str], T],
+        *,
+        label: str = "Retry",
+        cancel_token: CancelToken | None = None,
+    ) -> T:
+        """Re-run ``attempt(opts, browser)`` with browser cookies after an auth failure.
+
+        Raises ``CookiesRequiredError`` when no browser's cookies work.
+        """
+        candidates = self._browser_candidates()
+        self.log(f"[yt-dlp] Browser cookie candidates: {', '.join(candidates)}")
+        failures: list[Exception] = []
+        if self._cookie_probe_mode() == "parallel":
+            attempts = self._probed_cookie_attempts(url, opts, candidates, label, failures)
+        else:
+            attempts = self._sequential_cookie_attempts(url, opts, candidates, label)
+        # closing() removes the temporary cookie file as soon as an attempt wins.
+        with closing(attempts):
+            for browser, retry_opts in attempts:
+                if cancel_token is not None and cancel_token.cancelled:
+                    raise DownloadCancelledError()
+                self._mark_browser_cookies(browser)
+                try:
+                    return attempt(retry_opts, browser)
+                except Exception as retry_err:
+                    self._raise_if_cancelled(cancel_token, retry_err)
+                    self._log_browser_cookie_failure(browser, retry_err)
+                    failures.append(retry_err)
+        self.log("[yt-dlp] All browser cookie attempts failed; falling back to cookies.txt prompt.")
+        raise CookiesRequiredError(original=failures[-1] if failures else first_err) from first_err
+
+    def _sequential_cookie_attempts(
+        self, url: str, opts: dict, candidates: list[str], label: str
+    ) -> Iterator[tuple[str, dict]]:
+        site_label = self._site_label(url)
+        for browser in candidates:
+            self.log(f"[yt-dlp] {label} with cookies from browser ({browser}) for {site_label}…")
+            retry_opts = dict(opts)
+            retry_opts.pop("cookiefile", None)
+            retry_opts["cookiesfrombrowser"] = (browser,)
+            yield browser, retry_opts
+
+    def _probed_cookie_attempts(
+        self,
+        url: str,
+        opts: dict,
+        candidates: list[str],
+        label: str,
+        failures: list[Exception],
+    ) -> Iterator[tuple[str, dict]]:
+        """Attempts only with jars that passed ``cookie_prober``, best candidate first.
+
+        Each jar is handed to yt-dlp as a temporary cookies.txt so the browser
+        database is not read and decrypted again.
+        """
+        site_label = self._site_label(url)
+        self.log(f"[yt-dlp] Checking browser cookies in parallel for {site_label}…")
+        unverified: list[CookieProbeResult] = []
+
+        def with_cookiefile(result: CookieProbeResult) -> Iterator[tuple[str, dict]]:
+            cookie_path = save_cookiefile(result.jar)
+            try:
+                retry_opts = dict(opts)
+                retry_opts.pop("cookiesfrombrowser", None)
+                retry_opts["cookiefile"] = cookie_path
+                yield result.browser, retry_opts
+            finally:
+                try:
+                    os.remove(cookie_path)
+                except OSError:
+                    pass
+
+        for result in self.cookie_prober.probe(url, candidates):
+            if not result.verified:
+                error = result.error or RuntimeError("cookie check failed")
+                self._log_browser_cookie_failure(result.browser, error)
+                failures.append(error)
+                if result.usable:
+                    unverified.append(result)
+                continue
+            self.log(
+                f"[yt-dlp] {label} with cookies from browser ({result.browser}; "
+                f"{result.site_cookies} site cookies, checked in {result.seconds:.1f}s) for {site_label}…"
+            )
+            yield from with_cookiefile(result)
+        # A plain page request can be stopped by bot walls yt-dlp gets past, so
+        # jars that do hold site cookies still get one attempt each.
+        for result in unverified:
+            self.log(f"[yt-dlp] {label} with unverified cookies from browser ({result.browser}) for {site_label}…")
+            yield from with_cookiefile(result)
+
     def _available_transcript_languages(self, tracks: dict | None) -> list[str]:
         if not isinstance(tracks, dict):
             return []
@@ -245,14 +450,16 @@ class DownloadManager:
         result: list[TranscriptTrack] = []
         for language in self._available_transcript_languages(tracks):
             entries = tracks.get(language)
+            label = self._transcript_track_label(source, language, entries)
             result.append(
                 TranscriptTrack(
                     source=source,
                     language=language,
-                    label=self._transcript_track_label(source, language, entries),
+                    label=label,
+                    search_key=label.lower(),
                 )
             )
-        return sorted(result, key=lambda track: track.label.lower())
+        return sorted(result, key=lambda track: track.search_key)
 
     def transcript_tracks_from_info(self, info: dict | None) -> list[TranscriptTrack]:
         info = info or {}
@@ -345,8 +552,43 @@ class DownloadManager:
 
         raise NoTranscriptAvailableError("No transcript/subtitles available for this video.")
 
+    def _subtitle_track_file(self, info: dict, config: dict[str, object]) -> dict | None:
+        """Pick the downloadable file of the configured track, preferring vtt/srt."""
+        key = "subtitles" if config["source"] == "subtitles" else "automatic_captions"
+        tracks = info.get(key)
+        if not isinstance(tracks, dict):
+            return None
+        languages = list(config["languages"])
+        entries = [entry for entry in tracks.get(languages[0]) or [] if isinstance(entry, dict) and entry.get("url")]
+        if not entries:
+            return None
+        for ext in SUBTITLE_EXT_PREFERENCE:
+            for entry in entries:
+                if entry.get("ext") == ext:
+                    return entry
+        return entries[0]
+
+    def _fetch_subtitle_file(self, ydl, info: dict, config: dict[str, object], track_file: dict) -> str:
+        from yt_dlp.networking import Request
+
+        language = list(config["languages"])[0]
+        ext = str(track_file.get("ext") or "vtt")
+        base, _ = os.path.splitext(ydl.prepare_filename(info))
+        path = f"{base}.{language}.{ext}"
+        headers = track_file.get("http_headers") or info.get("http_headers") or None
+        with ydl.urlopen(Request(track_file["url"], headers=headers)) as response:
+            data = response.read()
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "wb") as handle:
+            handle.write(data)
+        return path
+
     def get_video_info(self, url: str, username: str | None = None, password: str | None = None):
-        self._reset_cookie_state()
+        import yt_dlp
+
+        self._begin_call()
         ydl_opts = {"quiet": True, "skip_download": True, "logger": self.ydl_logger}
         if username and password:
             ydl_opts["username"] = username
@@ -354,39 +596,38 @@ class DownloadManager:
         self._apply_cookies(ydl_opts)
         self._apply_js_runtime_opts(ydl_opts)
 
-        try:
+        def extract() -> list:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
                 if "entries" in info:
                     return info["entries"]
                 return [info]
+
+        def extract_with(retry_opts: dict, browser: str) -> list:
+            with maybe_span(self.telemetry, "ytdlp.browser_cookie_extract", browser=browser):
+                with yt_dlp.YoutubeDL(retry_opts) as ydl:
+                    info = ydl.extract_info(url, download=False)
+                    if "entries" in info:
+                        return info["entries"]
+                    return [info]
+
+        remembered = self._remembered_cookie_browser(url, ydl_opts)
+        if remembered:
+            # Skip the cookie-less attempt that is known to fail for this site.
+            self.log(f"[profile] {self._site_label(url)} last worked with {remembered} cookies; trying them first.")
+            remembered_opts = dict(ydl_opts, cookiesfrombrowser=(remembered,))
+            self._mark_browser_cookies(remembered)
+            try:
+                return extract_with(remembered_opts, remembered)
+            except Exception as exc:
+                self._log_browser_cookie_failure(remembered, exc)
+                self._reset_cookie_state()
+
+        try:
+            return self.retry.run(extract, url=url, stage="Extraction")
         except Exception as first_err:
             if self._should_try_browser_cookies(url, first_err):
-                site_label = self._site_label(url)
-                last_err = first_err
-                candidates = self._browser_candidates()
-                self.log(f"[yt-dlp] Browser cookie candidates: {', '.join(candidates)}")
-                for browser in candidates:
-                    self.log(f"[yt-dlp] Retry with cookies from browser ({browser}) for {site_label}…")
-                    try:
-                        retry_opts = dict(ydl_opts)
-                        retry_opts.pop("cookiefile", None)
-                        retry_opts["cookiesfrombrowser"] = (browser,)
-                        self._mark_browser_cookies(browser)
-                        with yt_dlp.YoutubeDL(retry_opts) as ydl:
-                            info = ydl.extract_info(url, download=False)
-                            if "entries" in info:
-                                return info["entries"]
-                            return [info]
-                    except Exception as retry_err:
-                        self.log(f"[yt-dlp] Browser cookies ({browser}) failed: {self._format_exception(retry_err)}")
-                        hint = self._cookie_failure_hint(retry_err)
-                        if hint:
-                            self.log(f"[yt-dlp] {hint}")
-                        last_err = retry_err
-                        continue
-                self.log("[yt-dlp] All browser cookie attempts failed; falling back to cookies.txt prompt.")
-                raise CookiesRequiredError(original=last_err) from first_err
+                return self._retry_with_browser_cookies(url, ydl_opts, first_err, extract_with)
             raise
 
     def download(
@@ -396,8 +637,12 @@ class DownloadManager:
         out_path: str,
         progress_hook: Callable | None = None,
         post_hook: Callable[[str], None] | None = None,
+        cancel_token: CancelToken | None = None,
     ) -> bool:
-        self._reset_cookie_state()
+        """Download ``url``; raises ``DownloadCancelledError`` once ``cancel_token`` is set."""
+        import yt_dlp
+
+        self._begin_call()
         opts = {
             "format": format_id,
             "outtmpl": out_path,
@@ -408,35 +653,30 @@ class DownloadManager:
         }
         self._apply_cookies(opts)
         self._apply_js_runtime_opts(opts)
-        try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
+        self._apply_telemetry_hooks(opts)
+        self._apply_cancel_hooks(opts, cancel_token)
+
+        def run_download() -> None:
+            with yt_dlp.YoutubeDL(opts) as ydl, self._bandwidth_lease(url, ydl):
                 ydl.download([url])
+
+        try:
+            with maybe_span(self.telemetry, "ytdlp.download", format=format_id):
+                self.retry.run(run_download, url=url, stage="Download", cancel_token=cancel_token)
             return True
         except Exception as first_err:
+            self._raise_if_cancelled(cancel_token, first_err)
             if self._should_try_browser_cookies(url, first_err):
-                site_label = self._site_label(url)
-                last_err = first_err
-                candidates = self._browser_candidates()
-                self.log(f"[yt-dlp] Browser cookie candidates: {', '.join(candidates)}")
-                for browser in candidates:
-                    self.log(f"[yt-dlp] Download retry with cookies from browser ({browser}) for {site_label}…")
-                    try:
-                        retry_opts = dict(opts)
-                        retry_opts.pop("cookiefile", None)
-                        retry_opts["cookiesfrombrowser"] = (browser,)
-                        self._mark_browser_cookies(browser)
-                        with yt_dlp.YoutubeDL(retry_opts) as ydl:
+
+                def download_with(retry_opts: dict, browser: str) -> bool:
+                    with maybe_span(self.telemetry, "ytdlp.download", format=format_id, browser=browser):
+                        with yt_dlp.YoutubeDL(retry_opts) as ydl, self._bandwidth_lease(url, ydl):
                             ydl.download([url])
-                        return True
-                    except Exception as retry_err:
-                        self.log(f"[yt-dlp] Browser cookies ({browser}) failed: {self._format_exception(retry_err)}")
-                        hint = self._cookie_failure_hint(retry_err)
-                        if hint:
-                            self.log(f"[yt-dlp] {hint}")
-                        last_err = retry_err
-                        continue
-                self.log("[yt-dlp] All browser cookie attempts failed; falling back to cookies.txt prompt.")
-                raise CookiesRequiredError(original=last_err) from first_err
+                    return True
+
+                return self._retry_with_browser_cookies(
+                    url, opts, first_err, download_with, label="Download retry", cancel_token=cancel_token
+                )
             self.log_error("Download", first_err)
             return False
 
@@ -445,8 +685,17 @@ class DownloadManager:
         url: str,
         out_path: str,
         selected_track: TranscriptTrack | None = None,
+        info: dict | None = None,
     ) -> TranscriptDownloadResult:
-        self._reset_cookie_state()
+        """Download one transcript track.
+
+        When ``info`` already carries subtitle metadata (a fetched card entry),
+        the chosen track file is requested directly instead of re-extracting
+        the video; a failed direct fetch falls back to a full extraction.
+        """
+        import yt_dlp
+
+        self._begin_call()
         opts = {
             "skip_download": True,
             "outtmpl": out_path,
@@ -455,21 +704,23 @@ class DownloadManager:
         }
         self._apply_cookies(opts)
         self._apply_js_runtime_opts(opts)
+        has_transcript_metadata = isinstance(info, dict) and (
+            "subtitles" in info or "automatic_captions" in info
+        )
 
         def attempt(current_opts: dict) -> TranscriptDownloadResult:
+            with maybe_span(self.telemetry, "ytdlp.transcript", direct=has_transcript_metadata):
+                return run_attempt(current_opts)
+
+        def run_attempt(current_opts: dict) -> TranscriptDownloadResult:
+            if has_transcript_metadata:
+                result = direct_attempt(current_opts)
+                if result is not None:
+                    return result
             with yt_dlp.YoutubeDL(current_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                config = self._transcript_download_config(info or {}, selected_track=selected_track)
-
-            selected_languages = list(config["languages"])
-            available_languages = list(config.get("available_languages", selected_languages))
-            if available_languages:
-                selected_label = ", ".join(selected_languages)
-                available_label = ", ".join(available_languages)
-                self.log(
-                    f"[yt-dlp] Transcript selection: {config['source']} -> {selected_label} "
-                    f"(available: {available_label})"
-                )
+                extracted = ydl.extract_info(url, download=False)
+                config = self._transcript_download_config(extracted or {}, selected_track=selected_track)
+            log_selection(config)
 
             download_opts = dict(current_opts)
             download_opts.update(
@@ -480,35 +731,49 @@ class DownloadManager:
                 }
             )
             with yt_dlp.YoutubeDL(download_opts) as ydl:
-                ydl.download([url])
+                downloaded = ydl.extract_info(url, download=True) or {}
+            written = downloaded.get("requested_subtitles") or {}
+            track = written.get(list(config["languages"])[0]) or {}
+            return TranscriptDownloadResult(
+                source=str(config["source"]),
+                languages=list(config["languages"]),
+                path=track.get("filepath"),
+            )
+
+        def direct_attempt(current_opts: dict) -> TranscriptDownloadResult | None:
+            config = self._transcript_download_config(info, selected_track=selected_track)
+            track_file = self._subtitle_track_file(info, config)
+            if track_file is None:
+                return None
+            log_selection(config)
+            try:
+                with yt_dlp.YoutubeDL(current_opts) as ydl:
+                    path = self._fetch_subtitle_file(ydl, info, config, track_file)
+            except Exception as exc:
+                self.log(f"[yt-dlp] Direct transcript fetch failed ({self._format_exception(exc)}); re-extracting.")
+                return None
             return TranscriptDownloadResult(
                 source=str(config["source"]),
                 languages=list(config["languages"]),
+                path=path,
             )
 
+        def log_selection(config: dict[str, object]) -> None:
+            selected_languages = list(config["languages"])
+            available_languages = list(config.get("available_languages", selected_languages))
+            if available_languages:
+                selected_label = ", ".join(selected_languages)
+                available_label = ", ".join(available_languages)
+                self.log(
+                    f"[yt-dlp] Transcript selection: {config['source']} -> {selected_label} "
+                    f"(available: {available_label})"
+                )
+
         try:
             return attempt(opts)
         except Exception as first_err:
             if self._should_try_browser_cookies(url, first_err):
-                site_label = self._site_label(url)
-                last_err = first_err
-                candidates = self._browser_candidates()
-                self.log(f"[yt-dlp] Browser cookie candidates: {', '.join(candidates)}")
-                for browser in candidates:
-                    self.log(f"[yt-dlp] Transcript retry with cookies from browser ({browser}) for {site_label}…")
-                    try:
-                        retry_opts = dict(opts)
-                        retry_opts.pop("cookiefile", None)
-                        retry_opts["cookiesfrombrowser"] = (browser,)
-                        self._mark_browser_cookies(browser)
-                        return attempt(retry_opts)
-                    except Exception as retry_err:
-                        self.log(f"[yt-dlp] Browser cookies ({browser}) failed: {self._format_exception(retry_err)}")
-                        hint = self._cookie_failure_hint(retry_err)
-                        if hint:
-                            self.log(f"[yt-dlp] {hint}")
-                        last_err = retry_err
-                        continue
-                self.log("[yt-dlp] All browser cookie attempts failed; falling back to cookies.txt prompt.")
-                raise CookiesRequiredError(original=last_err) from first_err
+                return self._retry_with_browser_cookies(
+                    url, opts, first_err, lambda retry_opts, _browser: attempt(retry_opts), label="Transcript retry"
+                )
             raise
@@ -0,0 +1,204 @@
+"""Background probing of external tools (ffmpeg, JS runtimes, browsers)."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+JS_RUNTIME_CANDIDATES = (
+    ("deno", "deno"),
+    ("node", "node"),
+    ("bun", "bun"),
+    ("quickjs", "qjs"),
+)
+
+WINDOWS_BROWSER_PROCESSES = {
+    "msedge.exe": "edge",
+    "brave.exe": "brave",
+    "chrome.exe": "chrome",
+    "firefox.exe": "firefox",
+}
+POSIX_BROWSER_PROCESSES = {
+    "microsoft-edge": "edge",
+    "msedge": "edge",
+    "brave-browser": "brave",
+    "brave": "brave",
+    "chrome": "chrome",
+    "chromium": "chrome",
+    "firefox": "firefox",
+}
+
+
+def running_browsers() -> list[str]:
+    if sys.platform.startswith("win"):
+        command = ["tasklist"]
+        process_map = WINDOWS_BROWSER_PROCESSES
+    else:
+        command = ["ps", "-A"]
+        process_map = POSIX_BROWSER_PROCESSES
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=False)
+        output = result.stdout.lower()
+    except Exception:
+        return []
+    candidates: list[str] = []
+    for process, browser in process_map.items():
+        if process in output:
+            candidates.append(browser)
+    return candidates
+
+
+@dataclass(frozen=True)
+class EnvironmentSnapshot:
+    ffmpeg_path: str | None
+    ffprobe_path: str | None
+    js_runtimes: tuple[tuple[str, str], ...]
+    running_browsers: tuple[str, ...]
+    probed_at: float
+
+    @property
+    def js_runtime_names(self) -> list[str]:
+        return [runtime for runtime, _path in self.js_runtimes]
+
+    def preferred_js_runtime(self) -> tuple[str | None, str | None]:
+        if not self.js_runtimes:
+            return None, None
+        return self.js_runtimes[0]
+
+
+class EnvironmentProbe:
+    """Probes tools once in the background and serves cached results.
+
+    Found binaries are re-validated by file mtime on each lookup; missing ones
+    are re-probed only when PATH changes or on an explicit ``refresh``.
+    """
+
+    def __init__(
+        self,
+        *,
+        which: Callable[[str], str | None] | None = None,
+        list_browsers: Callable[[], list[str]] | None = None,
+        browser_ttl: float = 30.0,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self._which = which or shutil.which
+        self._list_browsers = list_browsers or running_browsers
+        self.browser_ttl = browser_ttl
+        self.log = log or (lambda _msg: None)
+        self._binaries: dict[str, tuple[str | None, float | None, str]] = {}
+        self._browsers: tuple[tuple[str, ...], float] | None = None
+        self._snapshot: EnvironmentSnapshot | None = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._subscribers: list[Callable[[EnvironmentSnapshot], None]] = []
+
+    def subscribe(self, callback: Callable[[EnvironmentSnapshot], None]) -> None:
+        with self._lock:
+            self._subscribers.append(callback)
+            snapshot = self._snapshot
+        if snapshot is not None:
+            callback(snapshot)
+
+    def start(self) -> None:
+        threading.Thread(target=self._probe_all, name="link2vid-env-probe", daemon=True).start()
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._binaries.clear()
+            self._browsers = None
+        self.start()
+
+    def _probe_all(self) -> None:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            ffmpeg = pool.submit(self.which, "ffmpeg")
+            ffprobe = pool.submit(self.which, "ffprobe")
+            runtimes = pool.submit(self.js_runtimes)
+            browsers = pool.submit(self.browsers)
+            snapshot = EnvironmentSnapshot(
+                ffmpeg_path=self._result(ffmpeg, None),
+                ffprobe_path=self._result(ffprobe, None),
+                js_runtimes=tuple(self._result(runtimes, [])),
+                running_browsers=tuple(self._result(browsers, [])),
+                probed_at=time.time(),
+            )
+        with self._lock:
+            self._snapshot = snapshot
+            subscribers = list(self._subscribers)
+        self._ready.set()
+        self.log(f"[env] Environment probe finished in {(time.perf_counter() - started) * 1000:.0f} ms.")
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as exc:
+                self.log(f"[env] Environment subscriber failed: {exc}")
+
+    def _result(self, future, default):
+        try:
+            return future.result()
+        except Exception as exc:
+            self.log(f"[env] Probe failed: {exc}")
+            return default
+
+    def snapshot(self, *, wait: bool = True, timeout: float | None = 10.0) -> EnvironmentSnapshot | None:
+        if wait:
+            self._ready.wait(timeout)
+        with self._lock:
+            return self._snapshot
+
+    def which(self, name: str) -> str | None:
+        search_path = os.environ.get("PATH", "")
+        with self._lock:
+            cached = self._binaries.get(name)
+        if cached is not None:
+            path, mtime, cached_search_path = cached
+            if path is None:
+                if cached_search_path == search_path:
+                    return None
+            elif _file_mtime(path) == mtime:
+                return path
+        path = self._which(name)
+        with self._lock:
+            self._binaries[name] = (path, _file_mtime(path) if path else None, search_path)
+        return path
+
+    def js_runtimes(self) -> list[tuple[str, str]]:
+        found: list[tuple[str, str]] = []
+        for runtime, exe in JS_RUNTIME_CANDIDATES:
+            path = self.which(exe)
+            if path:
+                found.append((runtime, path))
+        return found
+
+    def preferred_js_runtime(self) -> tuple[str | None, str | None]:
+        runtimes = self.js_runtimes()
+        if not runtimes:
+            return None, None
+        return runtimes[0]
+
+    def browsers(self) -> list[str]:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._browsers
+        if cached is not None and now - cached[1] < self.browser_ttl:
+            return list(cached[0])
+        found = tuple(self._list_browsers())
+        with self._lock:
+            self._browsers = (found, now)
+        return list(found)
+
+
+def _file_mtime(path: str | None) -> float | None:
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
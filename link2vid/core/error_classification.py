@@ -1,81 +1,244 @@
-"""Error classification helpers for user-facing hints."""
+"""Error classification helpers for user-facing hints.
+
+Structured signals (HTTP status codes, yt-dlp/urllib/requests exception
+types anywhere in the cause chain) decide network vs. auth failures unless
+the text names something more specific; the message text covers the rest.
+Text rules are a precompiled, priority-ordered token table:
+for the short messages yt-dlp produces, CPython's substring search beats a
+combined regex by a wide margin (see ``benchmarks/bench_error_classification.py``).
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator
+
+# Shared with VideoFetcher / DownloadManager so "needs cookies" means the same everywhere.
+AUTH_SIGNALS = (
+    "account",
+    "cookie",
+    "cookies",
+    "consent",
+    "sign in",
+    "signin",
+    "login",
+    "age-restricted",
+    "age restricted",
+    "age verification",
+    "403",
+    "forbidden",
+    "bot",
+    "verify",
+    "verification",
+)
+# Browser cookie store failures (e.g. Windows DPAPI) also mean "ask for cookies.txt".
+COOKIE_STORE_SIGNALS = ("dpapi",)
+NO_VIDEO_SIGNALS = (
+    "no video could be found",
+    "no video found",
+    "no media could be found",
+    "no video formats found",
+)
+IMPERSONATION_SIGNALS = (
+    "impersonation",
+    "impersonate target",
+    "no impersonate target",
+)
+
+NETWORK_REASON = "network/rate-limit"
+AUTH_REASON = "cookies/auth"
+_NETWORK_HINT = " (Hint: check your network or wait and retry.)"
+_AUTH_HINT = " (Hint: try cookies.txt or browser cookies.)"
+
+
+@dataclass(frozen=True)
+class _Rule:
+    reason: str
+    hint: str
+    tokens: tuple[str, ...]
+
+
+def _compile_tokens(tokens: tuple[str, ...]) -> tuple[str, ...]:
+    """Lowercase, dedupe and drop tokens that contain another token of the same rule."""
+    unique = sorted({token.lower() for token in tokens}, key=len)
+    kept: list[str] = []
+    for token in unique:
+        if not any(shorter in token for shorter in kept):
+            kept.append(token)
+    return tuple(kept)
+
+
+def _rule(reason: str, hint: str, tokens: tuple[str, ...]) -> _Rule:
+    return _Rule(reason, hint, _compile_tokens(tokens))
+
+
+# Priority order: the first rule with a matching token wins.
+_RULES = (
+    _rule(
+        "js runtime",
+        " (Hint: update yt-dlp/yt-dlp-ejs and ensure a JS runtime; see the yt-dlp EJS wiki.)",
+        ("challenge solving failed", "n challenge", "challenge solver", "ejs", "sig function possibilities", "[jsc]"),
+    ),
+    _rule("js runtime", " (Hint: install deno/node/bun and ensure it's on PATH.)", ("javascript runtime", "js runtime")),
+    _rule("format unavailable", " (Hint: re-fetch formats or try Best (single file).)", ("requested format is not available",)),
+    _rule(
+        "format unavailable",
+        " (Hint: install EJS scripts or re-fetch formats.)",
+        ("only images are available", "no video formats"),
+    ),
+    _rule(
+        "no transcript",
+        " (Hint: this video may not expose transcript/caption tracks.)",
+        ("no transcript", "no subtitles", "no caption", "no captions"),
+    ),
+    _rule("ffmpeg", " (Hint: install ffmpeg and ensure it's on PATH.)", ("ffmpeg", "ffprobe", "avconv", "merge", "mux")),
+    _rule(
+        NETWORK_REASON,
+        _NETWORK_HINT,
+        (
+            "429",
+            "too many requests",
+            "rate limit",
+            "throttle",
+            "timeout",
+            "timed out",
+            "connection",
+            "network",
+            "name resolution",
+            "ssl",
+            "http error 5",
+        ),
+    ),
+    # Not a bare "age": it matches "Unable to download webpage" in every network failure.
+    _rule(AUTH_REASON, _AUTH_HINT, (*AUTH_SIGNALS, "confirm your age", "age-gate", "age gate")),
+    _rule(
+        "extractor drift/SABR",
+        " (Hint: install yt-dlp impersonation dependencies or update yt-dlp.)",
+        IMPERSONATION_SIGNALS,
+    ),
+    _rule(
+        "extractor drift/SABR",
+        " (Hint: try updating yt-dlp.)",
+        ("signature", "cipher", "extractor", "unable to extract", "sabr", "nsig", "player response", "po token"),
+    ),
+)
+# Rules before the first network rule are specific enough to beat an HTTP status.
+_STATUS_OVERRIDE_LIMIT = next(index for index, rule in enumerate(_RULES) if rule.reason == NETWORK_REASON)
+_AUTH_TOKENS = _compile_tokens(AUTH_SIGNALS)
+_COOKIE_STORE_TOKENS = _compile_tokens(COOKIE_STORE_SIGNALS)
+_NO_VIDEO_TOKENS = _compile_tokens(NO_VIDEO_SIGNALS)
+_IMPERSONATION_TOKENS = _compile_tokens(IMPERSONATION_SIGNALS)
+
+
+def _contains_any(msg: str, tokens: tuple[str, ...]) -> bool:
+    for token in tokens:
+        if token in msg:
+            return True
+    return False
+
 
 def _has_impersonation_signal(msg: str) -> bool:
-    return any(token in msg for token in (
-        "impersonation",
-        "impersonate target",
-        "no impersonate target",
-    ))
-
-
-def classify_error(err_text: str) -> tuple[str, str]:
-    msg = (err_text or "").lower()
-    if any(token in msg for token in ("challenge solving failed", "n challenge", "challenge solver", "ejs", "sig function possibilities", "[jsc]")):
-        return "js runtime", " (Hint: update yt-dlp/yt-dlp-ejs and ensure a JS runtime; see the yt-dlp EJS wiki.)"
-    if any(token in msg for token in ("javascript runtime", "js runtime")):
-        return "js runtime", " (Hint: install deno/node/bun and ensure it's on PATH.)"
-    if "requested format is not available" in msg:
-        return "format unavailable", " (Hint: re-fetch formats or try Best (single file).)"
-    if any(token in msg for token in ("only images are available", "no video formats")):
-        return "format unavailable", " (Hint: install EJS scripts or re-fetch formats.)"
-    if any(token in msg for token in ("no transcript", "no subtitles", "no caption", "no captions")):
-        return "no transcript", " (Hint: this video may not expose transcript/caption tracks.)"
-    if any(token in msg for token in ("ffmpeg", "ffprobe", "avconv", "merge", "mux")):
-        return "ffmpeg", " (Hint: install ffmpeg and ensure it's on PATH.)"
-    if any(token in msg for token in (
-        "429",
-        "too many requests",
-        "rate limit",
-        "throttle",
-        "timeout",
-        "timed out",
-        "connection",
-        "network",
-        "ssl",
-        "http error 5",
-        "http error 429",
-        "http error 503",
-        "http error 502",
-        "http error 500",
-    )):
-        return "network/rate-limit", " (Hint: check your network or wait and retry.)"
-    if any(token in msg for token in (
-        "cookie",
-        "cookies",
-        "consent",
-        "sign in",
-        "signin",
-        "login",
-        "age",
-        "403",
-        "forbidden",
-        "bot",
-        "account",
-        "verify",
-        "verification",
-    )):
-        return "cookies/auth", " (Hint: try cookies.txt or browser cookies.)"
-    if _has_impersonation_signal(msg):
-        return "extractor drift/SABR", " (Hint: install yt-dlp impersonation dependencies or update yt-dlp.)"
-    if any(token in msg for token in (
-        "signature",
-        "cipher",
-        "extractor",
-        "unable to extract",
-        "sabr",
-        "nsig",
-        "player response",
-        "po token",
-    )):
-        return "extractor drift/SABR", " (Hint: try updating yt-dlp.)"
-    return "unknown", ""
-
-
-def get_error_guidance(err_text: str) -> tuple[str, str, str] | None:
-    msg = (err_text or "").lower()
+    return _contains_any(msg, _IMPERSONATION_TOKENS)
+
+
+def iter_error_chain(err: BaseException) -> Iterator[BaseException]:
+    """``err`` and everything it wraps (``__cause__``, yt-dlp ``exc_info``/``cause``, ``original``)."""
+    stack: list[object] = [err]
+    seen: set[int] = set()
+    while stack:
+        current = stack.pop()
+        if not isinstance(current, BaseException) or id(current) in seen:
+            continue
+        seen.add(id(current))
+        yield current
+        exc_info = getattr(current, "exc_info", None)
+        if isinstance(exc_info, tuple) and len(exc_info) > 1:
+            stack.append(exc_info[1])
+        # Not ``__context__``: an error raised while handling another was not caused by it.
+        for attr in ("__cause__", "original", "cause"):
+            stack.append(getattr(current, attr, None))
+
+
+def http_status(err: BaseException) -> int | None:
+    """HTTP status carried by ``err`` itself (yt-dlp, requests or urllib HTTP errors)."""
+    response = getattr(err, "response", None)
+    for value in (
+        getattr(err, "status", None),
+        getattr(err, "code", None),
+        getattr(response, "status_code", None),
+        getattr(response, "status", None),
+    ):
+        if isinstance(value, int) and 100 <= value <= 599:
+            return value
+    return None
+
+
+@lru_cache(maxsize=1)
+def _ytdlp_error_types() -> tuple[tuple[type, ...], tuple[type, ...]]:
+    """(network types, cookie-load types) from yt-dlp, when it is importable."""
+    try:
+        from yt_dlp.networking.exceptions import TransportError
+        from yt_dlp.utils import CookieLoadError
+    except Exception:
+        return (), ()
+    return (TransportError,), (CookieLoadError,)
+
+
+def _structured_reason(err: BaseException) -> str | None:
+    network_types, cookie_types = _ytdlp_error_types()
+    for current in iter_error_chain(err):
+        status = http_status(current)
+        if status == 429 or (status is not None and status >= 500):
+            return NETWORK_REASON
+        if status in (401, 403):
+            return AUTH_REASON
+        if cookie_types and isinstance(current, cookie_types):
+            return AUTH_REASON
+        if isinstance(current, (TimeoutError, ConnectionError)) or (network_types and isinstance(current, network_types)):
+            return NETWORK_REASON
+    return None
+
+
+def _text_rule(msg: str) -> tuple[int, _Rule] | None:
+    for index, rule in enumerate(_RULES):
+        if _contains_any(msg, rule.tokens):
+            return index, rule
+    return None
+
+
+def classify_error(err: str | BaseException | None) -> tuple[str, str]:
+    """``(reason, hint)`` for an error message or exception."""
+    msg = str(err or "").lower()
+    match = _text_rule(msg)
+    if isinstance(err, BaseException) and (match is None or match[0] >= _STATUS_OVERRIDE_LIMIT):
+        # e.g. a JS challenge failure that surfaces as HTTP 403 keeps its specific hint.
+        structured = _structured_reason(err)
+        if structured is not None:
+            return structured, _NETWORK_HINT if structured == NETWORK_REASON else _AUTH_HINT
+    if match is None:
+        return "unknown", ""
+    return match[1].reason, match[1].hint
+
+
+def is_auth_error(err: str | BaseException | None, *, include_cookie_store: bool = False) -> bool:
+    """True when the error means the site wants cookies / a signed-in session."""
+    if isinstance(err, BaseException):
+        for current in iter_error_chain(err):
+            if http_status(current) in (401, 403):
+                return True
+    msg = str(err or "").lower()
+    if _contains_any(msg, _AUTH_TOKENS):
+        return True
+    return include_cookie_store and _contains_any(msg, _COOKIE_STORE_TOKENS)
+
+
+def is_no_video_error(err: str | BaseException | None) -> bool:
+    return _contains_any(str(err or "").lower(), _NO_VIDEO_TOKENS)
+
+
+def get_error_guidance(err_text: str | BaseException | None) -> tuple[str, str, str] | None:
+    msg = str(err_text or "").lower()
     reason, _hint = classify_error(err_text)
 
     if reason == "js runtime":
@@ -87,9 +250,9 @@ def get_error_guidance(err_text: str) -> tuple[str, str, str] | None:
             "Update yt-dlp and yt-dlp-ejs, confirm a JS runtime is on PATH, then retry.",
         )
 
-    if reason == "network/rate-limit":
+    if reason == NETWORK_REASON:
         return (
-            "network/rate-limit",
+            NETWORK_REASON,
             "Rate limited by site",
             "The site is temporarily rejecting requests (HTTP 429 / rate limit).\n\n"
             "Try again after waiting a bit, switch networks if possible, and consider\n"
@@ -13,3 +13,10 @@ class CookiesRequiredError(RuntimeError):
 
 class NoTranscriptAvailableError(RuntimeError):
     """Raised when a video does not expose subtitles/captions that can be downloaded."""
+
+
+class DownloadCancelledError(RuntimeError):
+    """Raised when a download is stopped through its ``CancelToken``."""
+
+    def __init__(self, message: str = "Download cancelled.") -> None:
+        super().__init__(message)
@@ -3,13 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable
+from typing import TYPE_CHECKING, Awaitable, Callable, Generator
+import asyncio
 import re
 import urllib.parse
 
 import m3u8
 import requests
 
+from .hls import HlsVariant, variants_from_playlist
+
+if TYPE_CHECKING:
+    from .async_engine import AsyncEngine
+
 LogFn = Callable[[str], None]
 
 M3U8_URL_RE = re.compile(r"https?://[^\"'\s<>]+\.m3u8[^\"'\s<>]*", re.I)
@@ -177,13 +183,6 @@ def build_media_entries(
     return entries
 
 
-@dataclass
-class HlsVariant:
-    bandwidth_kbps: int | None
-    resolution: tuple[int, int] | None
-    uri: str
-
-
 @dataclass
 class HlsScanResult:
     playlist_url: str
@@ -191,66 +190,213 @@ class HlsScanResult:
     variants: list[HlsVariant]
 
 
-def scan_direct_m3u8(page_url: str, log: LogFn | None = None) -> HlsScanResult | None:
-    logger = log or (lambda _msg: None)
-    logger("[HLS] Scanning page for .m3u8 …")
+def hls_result_entries(page_url: str, result: HlsScanResult) -> list[dict]:
+    """Card entries for a direct HLS hit (one entry carrying its variants)."""
+    entries = build_media_entries(
+        [result.playlist_url],
+        page_title=title_from_page_url(page_url),
+        headers=result.headers,
+    )
+    for entry in entries:
+        entry["_hls_variants"] = list(result.variants)
+    return entries
+
+
+# Page fetching is written "sans-IO" so the blocking scanners below and the
+# asyncio ones in ``async_engine`` share it: a plan yields ``(urls, required)``
+# and is sent back one text per URL (``None`` for failed optional fetches).
+FetchPlan = Generator[tuple[list[str], bool], list[str | None], str]
+
+BLAZESTREAMING_IFRAME_RE = re.compile(r"<iframe[^>]+src=[\"']([^\"']+blazestreaming[^\"']+)[\"']", re.I)
+SCRIPT_SRC_RE = re.compile(r"<script[^>]+src=[\"']([^\"']+\.js)[\"']", re.I)
+
+
+def scan_headers(page_url: str) -> dict[str, str]:
+    return {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0)",
+        "Referer": page_url,
+    }
+
+
+def page_with_player_scripts(page_url: str) -> FetchPlan:
+    """Page HTML; for blazestreaming embeds, the iframe plus its scripts with ``videoId`` inlined."""
+    (html,) = yield [page_url], True
+    iframe = BLAZESTREAMING_IFRAME_RE.search(html)
+    if not iframe:
+        return html
+    iframe_url = urllib.parse.urljoin(page_url, iframe.group(1))
+    (html,) = yield [iframe_url], True
+
+    qs = urllib.parse.parse_qs(urllib.parse.urlparse(iframe_url).query)
+    video_id = qs.get("id", [""])[0]
+
+    script_urls = [urllib.parse.urljoin(iframe_url, src) for src in SCRIPT_SRC_RE.findall(html)]
+    if script_urls:
+        scripts = yield script_urls, False
+        for script_js in scripts:
+            if script_js is not None:
+                html += "\n" + script_js
+
+    if video_id:
+        html = re.sub(r"'\s*\+\s*videoId\s*\+\s*'", video_id, html)
+        html = re.sub(r"\"\s*\+\s*videoId\s*\+\s*\"", video_id, html)
+    return html
+
+
+def run_fetch_plan(plan: FetchPlan, get_text: Callable[[str], str]) -> str:
+    """Drive ``plan`` with blocking ``get_text`` calls, one URL at a time."""
     try:
-        sess = requests.Session()
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0)",
-            "Referer": page_url,
-        }
-        html = sess.get(page_url, headers=headers, timeout=15).text
-
-        iframe = re.search(r"<iframe[^>]+src=[\"']([^\"']+blazestreaming[^\"']+)[\"']", html, re.I)
-        if iframe:
-            iframe_url = urllib.parse.urljoin(page_url, iframe.group(1))
-            html = sess.get(iframe_url, headers=headers, timeout=15).text
-            
-            parsed_url = urllib.parse.urlparse(iframe_url)
-            qs = urllib.parse.parse_qs(parsed_url.query)
-            video_id = qs.get("id", [""])[0]
-
-            script_matches = re.findall(r"<script[^>]+src=[\"']([^\"']+\.js)[\"']", html, re.I)
-            for script_src in script_matches:
+        urls, required = next(plan)
+        while True:
+            texts: list[str | None] = []
+            for url in urls:
                 try:
-                    script_url = urllib.parse.urljoin(iframe_url, script_src)
-                    script_js = sess.get(script_url, headers=headers, timeout=15).text
-                    html += "\n" + script_js
+                    texts.append(get_text(url))
                 except Exception:
-                    pass
+                    if required:
+                        raise
+                    texts.append(None)
+            urls, required = plan.send(texts)
+    except StopIteration as stop:
+        return stop.value
 
-            if video_id:
-                html = re.sub(r"'\s*\+\s*videoId\s*\+\s*'", video_id, html)
-                html = re.sub(r"\"\s*\+\s*videoId\s*\+\s*\"", video_id, html)
 
-        playlist_urls = _dedupe_preserve_order(M3U8_URL_RE.findall(html))
-        if not playlist_urls:
-            logger("[HLS] No playlist text found.")
-            return None
+async def run_fetch_plan_async(plan: FetchPlan, get_text: Callable[[str], Awaitable[str]]) -> str:
+    """Drive ``plan`` on an event loop; each batch of URLs is fetched concurrently."""
+    try:
+        urls, required = next(plan)
+        while True:
+            results = await asyncio.gather(*(get_text(url) for url in urls), return_exceptions=True)
+            texts: list[str | None] = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    if required:
+                        raise result
+                    texts.append(None)
+                else:
+                    texts.append(result)
+            urls, required = plan.send(texts)
+    except StopIteration as stop:
+        return stop.value
+
+
+def first_playlist_url(html: str, logger: LogFn) -> str | None:
+    playlist_urls = _dedupe_preserve_order(M3U8_URL_RE.findall(html))
+    if not playlist_urls:
+        logger("[HLS] No playlist text found.")
+        return None
+
+    playlist_url = playlist_urls[0]
+    logger(f"[HLS] Found playlist:\n{playlist_url}")
+    if len(playlist_urls) > 1:
+        logger(f"[HLS] Found {len(playlist_urls)} playlist(s) on page.")
+    return playlist_url
+
+
+def hls_scan_result(playlist_url: str, headers: dict[str, str], playlist, logger: LogFn) -> HlsScanResult:
+    variants: list[HlsVariant] = []
+    if playlist.is_variant:
+        logger("Available variants:")
+        variants = variants_from_playlist(playlist, playlist_url)
+        for variant in variants:
+            logger(f" • {variant.bandwidth_kbps} kbps  {variant.resolution}  ->  {variant.uri}")
+    return HlsScanResult(playlist_url=playlist_url, headers=headers, variants=variants)
+
+
+def direct_media_entries_from_html(
+    page_url: str,
+    html: str,
+    headers: dict[str, str],
+    logger: LogFn,
+) -> list[dict]:
+    candidates: list[str] = []
+    candidates.extend(M3U8_URL_RE.findall(html))
+    candidates.extend(MUX_URL_RE.findall(html))
+    candidates.extend(MP4_URL_RE.findall(html))
+    media_urls = _dedupe_preserve_order(candidates)
+    if not media_urls:
+        logger("[Media] No direct media URLs found.")
+        return []
+
+    logger(f"[Media] Found {len(media_urls)} direct media URL(s).")
+    for idx, media_url in enumerate(media_urls, start=1):
+        logger(f" • {idx}: {media_url}")
+    page_title = extract_page_title(html) or title_from_page_url(page_url)
+    video_titles = guess_video_titles(html, media_urls)
+    if page_title:
+        logger(f"[Media] Page title: {page_title}")
+    return build_media_entries(
+        media_urls,
+        page_title=page_title,
+        video_titles=video_titles,
+        headers=headers,
+    )
+
+
+def embedded_entries_from_html(html: str, logger: LogFn) -> list[dict]:
+    html = bytes(html, "utf-8").decode("unicode_escape", errors="ignore")
+
+    candidates: list[str] = []
+    og_matches = re.findall(
+        r"<meta[^>]+property=\"og:video(?:[:_][^\"]+)?\"[^>]+content=\"([^\"]+)\"",
+        html,
+        re.I,
+    )
+    candidates.extend(og_matches)
+
+    json_matches = re.findall(
+        r"\"(?:progressiveUrl|playbackUrl)\":\"(https:[^\"]+?\.mp4[^\"]*)\"",
+        html,
+    )
+    candidates.extend(json_matches)
+
+    m3u8_matches = re.findall(r"(https:[^\"]+?\.m3u8[^\"]*)", html)
+    candidates.extend(m3u8_matches)
+
+    video_urls: list[str] = []
+    for url in candidates:
+        url = url.replace("\\u002F", "/")
+        if url not in video_urls:
+            video_urls.append(url)
+
+    if not video_urls:
+        logger("[Media] No direct video links found.")
+        return []
+
+    entries: list[dict] = []
+    for idx, video_url in enumerate(video_urls):
+        ext = "m3u8" if video_url.endswith(".m3u8") else "mp4"
+        entries.append(
+            {
+                "title": f"Embedded video {idx + 1}",
+                "formats": [
+                    {
+                        "format_id": "best",
+                        "ext": ext,
+                        "filesize_approx": "N/A",
+                    }
+                ],
+                "webpage_url": video_url,
+            }
+        )
+    return entries
 
-        playlist_url = playlist_urls[0]
-        logger(f"[HLS] Found playlist:\n{playlist_url}")
-        if len(playlist_urls) > 1:
-            logger(f"[HLS] Found {len(playlist_urls)} playlist(s) on page.")
 
-        variants: list[HlsVariant] = []
+def scan_direct_m3u8(page_url: str, log: LogFn | None = None) -> HlsScanResult | None:
+    logger = log or (lambda _msg: None)
+    logger("[HLS] Scanning page for .m3u8 …")
+    try:
+        sess = requests.Session()
+        headers = scan_headers(page_url)
+        html = run_fetch_plan(
+            page_with_player_scripts(page_url),
+            lambda url: sess.get(url, headers=headers, timeout=15).text,
+        )
+        playlist_url = first_playlist_url(html, logger)
+        if not playlist_url:
+            return None
         playlist = m3u8.load(playlist_url, headers=headers)
-        if playlist.is_variant:
-            logger("Available variants:")
-            for variant in playlist.playlists:
-                bandwidth = variant.stream_info.bandwidth
-                bandwidth_kbps = bandwidth // 1000 if bandwidth else None
-                resolution = variant.stream_info.resolution
-                logger(f" • {bandwidth_kbps} kbps  {resolution}  ->  {variant.uri}")
-                variants.append(
-                    HlsVariant(
-                        bandwidth_kbps=bandwidth_kbps,
-                        resolution=resolution,
-                        uri=variant.uri,
-                    )
-                )
-        return HlsScanResult(playlist_url=playlist_url, headers=headers, variants=variants)
+        return hls_scan_result(playlist_url, headers, playlist, logger)
     except Exception as exc:
         logger(f"[HLS] {exc}")
         return None
@@ -261,56 +407,12 @@ def scan_direct_media_entries(page_url: str, log: LogFn | None = None) -> list[d
     logger("[Media] Scanning page for direct media URLs …")
     try:
         sess = requests.Session()
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0)",
-            "Referer": page_url,
-        }
-        html = sess.get(page_url, headers=headers, timeout=15).text
-
-        iframe = re.search(r"<iframe[^>]+src=[\"']([^\"']+blazestreaming[^\"']+)[\"']", html, re.I)
-        if iframe:
-            iframe_url = urllib.parse.urljoin(page_url, iframe.group(1))
-            html = sess.get(iframe_url, headers=headers, timeout=15).text
-
-            parsed_url = urllib.parse.urlparse(iframe_url)
-            qs = urllib.parse.parse_qs(parsed_url.query)
-            video_id = qs.get("id", [""])[0]
-
-            script_matches = re.findall(r"<script[^>]+src=[\"']([^\"']+\.js)[\"']", html, re.I)
-            for script_src in script_matches:
-                try:
-                    script_url = urllib.parse.urljoin(iframe_url, script_src)
-                    script_js = sess.get(script_url, headers=headers, timeout=15).text
-                    html += "\n" + script_js
-                except Exception:
-                    pass
-
-            if video_id:
-                html = re.sub(r"'\s*\+\s*videoId\s*\+\s*'", video_id, html)
-                html = re.sub(r"\"\s*\+\s*videoId\s*\+\s*\"", video_id, html)
-
-        candidates: list[str] = []
-        candidates.extend(M3U8_URL_RE.findall(html))
-        candidates.extend(MUX_URL_RE.findall(html))
-        candidates.extend(MP4_URL_RE.findall(html))
-        media_urls = _dedupe_preserve_order(candidates)
-        if not media_urls:
-            logger("[Media] No direct media URLs found.")
-            return []
-
-        logger(f"[Media] Found {len(media_urls)} direct media URL(s).")
-        for idx, media_url in enumerate(media_urls, start=1):
-            logger(f" • {idx}: {media_url}")
-        page_title = extract_page_title(html) or title_from_page_url(page_url)
-        video_titles = guess_video_titles(html, media_urls)
-        if page_title:
-            logger(f"[Media] Page title: {page_title}")
-        return build_media_entries(
-            media_urls,
-            page_title=page_title,
-            video_titles=video_titles,
-            headers=headers,
+        headers = scan_headers(page_url)
+        html = run_fetch_plan(
+            page_with_player_scripts(page_url),
+            lambda url: sess.get(url, headers=headers, timeout=15).text,
         )
+        return direct_media_entries_from_html(page_url, html, headers, logger)
     except Exception as exc:
         logger(f"[Media] {exc}")
         return []
@@ -322,53 +424,59 @@ def extract_embedded_page_videos(page_url: str, log: LogFn | None = None) -> lis
     try:
         headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0)"}
         html = requests.get(page_url, headers=headers, timeout=15).text
+        return embedded_entries_from_html(html, logger)
+    except Exception as exc:
+        logger(f"[Media] {exc}")
+        return []
 
-        html = bytes(html, "utf-8").decode("unicode_escape", errors="ignore")
-
-        candidates: list[str] = []
-        og_matches = re.findall(
-            r"<meta[^>]+property=\"og:video(?:[:_][^\"]+)?\"[^>]+content=\"([^\"]+)\"",
-            html,
-            re.I,
-        )
-        candidates.extend(og_matches)
 
-        json_matches = re.findall(
-            r"\"(?:progressiveUrl|playbackUrl)\":\"(https:[^\"]+?\.mp4[^\"]*)\"",
-            html,
-        )
-        candidates.extend(json_matches)
+async def scan_direct_m3u8_async(engine: AsyncEngine, page_url: str, log: LogFn | None = None) -> HlsScanResult | None:
+    """``scan_direct_m3u8`` on an ``AsyncEngine``."""
+    logger = log or (lambda _msg: None)
+    logger("[HLS] Scanning page for .m3u8 …")
+    try:
+        headers = scan_headers(page_url)
+        async with engine.session() as session:
+            html = await run_fetch_plan_async(
+                page_with_player_scripts(page_url),
+                lambda url: session.get_text(url, headers),
+            )
+            playlist_url = await engine.in_executor(first_playlist_url, html, logger)
+            if not playlist_url:
+                return None
+            playlist_text = await session.get_text(playlist_url, headers)
+        playlist = await engine.in_executor(lambda: m3u8.loads(playlist_text, uri=playlist_url))
+        return await engine.in_executor(hls_scan_result, playlist_url, headers, playlist, logger)
+    except Exception as exc:
+        logger(f"[HLS] {exc}")
+        return None
 
-        m3u8_matches = re.findall(r"(https:[^\"]+?\.m3u8[^\"]*)", html)
-        candidates.extend(m3u8_matches)
 
-        video_urls: list[str] = []
-        for url in candidates:
-            url = url.replace("\\u002F", "/")
-            if url not in video_urls:
-                video_urls.append(url)
+async def scan_direct_media_entries_async(engine: AsyncEngine, page_url: str, log: LogFn | None = None) -> list[dict]:
+    """``scan_direct_media_entries`` on an ``AsyncEngine``."""
+    logger = log or (lambda _msg: None)
+    logger("[Media] Scanning page for direct media URLs …")
+    try:
+        headers = scan_headers(page_url)
+        async with engine.session() as session:
+            html = await run_fetch_plan_async(
+                page_with_player_scripts(page_url),
+                lambda url: session.get_text(url, headers),
+            )
+        return await engine.in_executor(direct_media_entries_from_html, page_url, html, headers, logger)
+    except Exception as exc:
+        logger(f"[Media] {exc}")
+        return []
 
-        if not video_urls:
-            logger("[Media] No direct video links found.")
-            return []
 
-        entries: list[dict] = []
-        for idx, video_url in enumerate(video_urls):
-            ext = "m3u8" if video_url.endswith(".m3u8") else "mp4"
-            entries.append(
-                {
-                    "title": f"Embedded video {idx + 1}",
-                    "formats": [
-                        {
-                            "format_id": "best",
-                            "ext": ext,
-                            "filesize_approx": "N/A",
-                        }
-                    ],
-                    "webpage_url": video_url,
-                }
-            )
-        return entries
+async def extract_embedded_page_videos_async(engine: AsyncEngine, page_url: str, log: LogFn | None = None) -> list[dict]:
+    """``extract_embedded_page_videos`` on an ``AsyncEngine``."""
+    logger = log or (lambda _msg: None)
+    logger("[Media] Scanning page for embedded video links ...")
+    try:
+        async with engine.session() as session:
+            html = await session.get_text(page_url, {"User-Agent": "Mozilla/5.0 (Windows NT 10.0)"})
+        return await engine.in_executor(embedded_entries_from_html, html, logger)
     except Exception as exc:
         logger(f"[Media] {exc}")
         return []
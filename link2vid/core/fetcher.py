@@ -4,10 +4,30 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Callable
+import time
 
 from .errors import CookiesRequiredError
 from .dev_defaults import dev_domain_for_url
-from .extractors import HlsScanResult, extract_embedded_page_videos, scan_direct_media_entries, scan_direct_m3u8
+from .error_classification import is_auth_error, is_no_video_error
+from .async_engine import AsyncEngine
+from .extractors import (
+    HlsScanResult,
+    extract_embedded_page_videos,
+    extract_embedded_page_videos_async,
+    scan_direct_media_entries,
+    scan_direct_media_entries_async,
+    scan_direct_m3u8,
+    scan_direct_m3u8_async,
+)
+from .site_profiles import (
+    STRATEGY_DIRECT_MEDIA,
+    STRATEGY_EMBEDDED,
+    STRATEGY_HLS,
+    STRATEGY_SELENIUM,
+    STRATEGY_YTDLP,
+    SiteProfileStore,
+)
+from .telemetry import Telemetry, maybe_span
 
 LogFn = Callable[[str], None]
 GetVideoInfoFn = Callable[[str, str | None, str | None], list[dict]]
@@ -17,6 +37,7 @@ GetVideoInfoFn = Callable[[str, str | None, str | None], list[dict]]
 class FetchResults:
     entries: list[dict]
     error: Exception | None = None
+    strategy: str = STRATEGY_YTDLP
 
 
 @dataclass
@@ -28,6 +49,8 @@ class DirectHlsFound:
 @dataclass
 class NeedsSelenium:
     error: Exception | None = None
+    # Set when the site profile says Selenium is what worked last time.
+    remembered: bool = False
 
 
 @dataclass
@@ -50,15 +73,59 @@ class VideoFetcher:
         get_video_info: GetVideoInfoFn,
         log: LogFn | None = None,
         dev_defaults: dict | None = None,
+        telemetry: Telemetry | None = None,
+        site_profiles: SiteProfileStore | None = None,
+        cookie_source: Callable[[], str] | None = None,
+        engine: AsyncEngine | None = None,
     ) -> None:
         self.get_video_info = get_video_info
         self.log = log or (lambda _msg: None)
         self.dev_defaults = dev_defaults or {}
+        self.telemetry = telemetry
+        self.site_profiles = site_profiles
+        # Must describe the calling thread's last get_video_info call
+        # (DownloadManager.cookie_source keeps per-thread state), since
+        # fetch_batch runs several fetches at once.
+        self.cookie_source = cookie_source or (lambda: "none")
+        # Scanner HTTP runs on the engine's event loop when one is given.
+        self.engine = engine
 
     def fetch(self, url: str, username: str | None = None, password: str | None = None) -> FetchOutcome:
+        with maybe_span(self.telemetry, "fetch", url=url) as span:
+            started = time.monotonic()
+            outcome = self._fetch(url, username, password)
+            span["outcome"] = type(outcome).__name__
+            self._record_profile(url, outcome, time.monotonic() - started)
+            return outcome
+
+    def _record_profile(self, url: str, outcome: FetchOutcome, seconds: float) -> None:
+        if self.site_profiles is None:
+            return
+        if isinstance(outcome, FetchResults):
+            cookie_source = self.cookie_source() if outcome.strategy == STRATEGY_YTDLP else None
+            self.site_profiles.record_success(url, outcome.strategy, seconds, cookie_source)
+        elif isinstance(outcome, DirectHlsFound):
+            self.site_profiles.record_success(url, STRATEGY_HLS, seconds)
+
+    def _fetch(self, url: str, username: str | None, password: str | None) -> FetchOutcome:
+        profile = self.site_profiles.get(url) if self.site_profiles is not None else None
+        skip = ""
+        if profile is not None and profile.strategy != STRATEGY_YTDLP:
+            self.log(f"[profile] {profile.domain} last worked via {profile.strategy} ({profile.seconds:.1f}s); trying it first.")
+            if profile.strategy == STRATEGY_SELENIUM:
+                return NeedsSelenium(remembered=True)
+            outcome = self._run_scanner(profile.strategy, url, None)
+            if outcome is not None:
+                return outcome
+            self.log(f"[profile] {profile.strategy} found nothing this time; using the full fetch chain.")
+            self.site_profiles.forget(url)
+            skip = profile.strategy
+
         ytdlp_error: Exception | None = None
         try:
-            entries = self.get_video_info(url, username, password)
+            with maybe_span(self.telemetry, "fetch.ytdlp_extract") as span:
+                entries = self.get_video_info(url, username, password)
+                span["entries"] = len(entries)
             return FetchResults(entries=entries)
         except CookiesRequiredError as exc:
             return NeedsCookies(error=exc)
@@ -69,52 +136,58 @@ class VideoFetcher:
             if self._is_no_video_error(exc):
                 return FetchError(error=exc)
 
-        if dev_domain_for_url(url, self.dev_defaults):
-            entries = extract_embedded_page_videos(url, log=self.log)
-            if entries:
-                return FetchResults(entries=entries, error=ytdlp_error)
-
-        media_entries = scan_direct_media_entries(url, log=self.log)
-        if media_entries:
-            return FetchResults(entries=media_entries, error=ytdlp_error)
-
-        hls_result = scan_direct_m3u8(url, log=self.log)
-        if hls_result:
-            return DirectHlsFound(result=hls_result, error=ytdlp_error)
+        for strategy in (STRATEGY_EMBEDDED, STRATEGY_DIRECT_MEDIA, STRATEGY_HLS):
+            if strategy == skip:
+                continue
+            outcome = self._run_scanner(strategy, url, ytdlp_error)
+            if outcome is not None:
+                return outcome
 
         if ytdlp_error:
             return NeedsSelenium(error=ytdlp_error)
 
         return FetchError(error=RuntimeError("Fetch failed without details"))
 
+    def _run_scanner(self, strategy: str, url: str, ytdlp_error: Exception | None) -> FetchOutcome | None:
+        if strategy == STRATEGY_EMBEDDED:
+            if not dev_domain_for_url(url, self.dev_defaults):
+                return None
+            with maybe_span(self.telemetry, "fetch.scan_embedded") as span:
+                if self.engine is not None:
+                    entries = self.engine.run(extract_embedded_page_videos_async(self.engine, url, log=self.log))
+                else:
+                    entries = extract_embedded_page_videos(url, log=self.log)
+                span["entries"] = len(entries)
+            if entries:
+                return FetchResults(entries=entries, error=ytdlp_error, strategy=STRATEGY_EMBEDDED)
+            return None
+
+        if strategy == STRATEGY_DIRECT_MEDIA:
+            with maybe_span(self.telemetry, "fetch.scan_direct_media") as span:
+                if self.engine is not None:
+                    media_entries = self.engine.run(scan_direct_media_entries_async(self.engine, url, log=self.log))
+                else:
+                    media_entries = scan_direct_media_entries(url, log=self.log)
+                span["entries"] = len(media_entries)
+            if media_entries:
+                return FetchResults(entries=media_entries, error=ytdlp_error, strategy=STRATEGY_DIRECT_MEDIA)
+            return None
+
+        if strategy == STRATEGY_HLS:
+            with maybe_span(self.telemetry, "fetch.scan_hls") as span:
+                if self.engine is not None:
+                    hls_result = self.engine.run(scan_direct_m3u8_async(self.engine, url, log=self.log))
+                else:
+                    hls_result = scan_direct_m3u8(url, log=self.log)
+                span["found"] = bool(hls_result)
+            if hls_result:
+                return DirectHlsFound(result=hls_result, error=ytdlp_error)
+            return None
+
+        return None
+
     def _is_no_video_error(self, exc: Exception) -> bool:
-        message = str(exc).lower()
-        signals = (
-            "no video could be found",
-            "no video found",
-            "no media could be found",
-            "no video formats found",
-        )
-        return any(token in message for token in signals)
+        return is_no_video_error(exc)
 
     def _needs_cookies(self, url: str, exc: Exception) -> bool:
-        message = str(exc).lower()
-        signals = (
-            "account",
-            "dpapi",
-            "cookie",
-            "cookies",
-            "consent",
-            "sign in",
-            "signin",
-            "login",
-            "age-restricted",
-            "age restricted",
-            "age verification",
-            "403",
-            "forbidden",
-            "bot",
-            "verify",
-            "verification",
-        )
-        return any(token in message for token in signals)
+        return is_auth_error(exc, include_cookie_store=True)
@@ -0,0 +1,138 @@
+"""Cached, incrementally refreshed listing of an output folder."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+import os
+import threading
+
+
+@dataclass(frozen=True)
+class FolderEntry:
+    path: str
+    size: int
+    mtime: float
+    inode: int
+
+
+class FolderIndex:
+    """Answers "what changed recently" and "is this name taken" for one folder.
+
+    The folder itself is stat'ed on each query and only re-listed when its
+    mtime changes (files added, removed or renamed). Re-listing uses
+    ``os.scandir`` and only stats names that are new or whose inode changed,
+    so a folder with thousands of finished videos costs one ``readdir``.
+    Files written by Link2Vid itself are pushed in with ``record_write``.
+
+    A file rewritten in place by another program does not touch the
+    directory mtime; ``refresh(force=True)`` re-lists and re-stats every
+    known file for callers that need to see such changes.
+    """
+
+    def __init__(self, folder: str) -> None:
+        self.folder = os.path.abspath(folder)
+        self._entries: dict[str, FolderEntry] = {}
+        self._by_mtime: list[tuple[float, str]] = []
+        self._dir_mtime: int | None = None
+        self._lock = threading.Lock()
+
+    def refresh(self, *, force: bool = False) -> None:
+        try:
+            dir_mtime = os.stat(self.folder).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._entries.clear()
+                self._by_mtime.clear()
+                self._dir_mtime = None
+            return
+        with self._lock:
+            if not force and dir_mtime == self._dir_mtime:
+                return
+            self._dir_mtime = dir_mtime
+            self._rescan(restat=force)
+
+    def _rescan(self, *, restat: bool) -> None:
+        seen: set[str] = set()
+        try:
+            with os.scandir(self.folder) as iterator:
+                for item in iterator:
+                    key = os.path.normcase(item.name)
+                    try:
+                        if not item.is_file():
+                            continue
+                        known = self._entries.get(key)
+                        if known is not None and known.inode == item.inode() and not restat:
+                            seen.add(key)
+                            continue
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    seen.add(key)
+                    if known is not None and (known.inode, known.size, known.mtime) == (
+                        stat.st_ino,
+                        stat.st_size,
+                        stat.st_mtime,
+                    ):
+                        continue
+                    self._store(key, FolderEntry(item.path, stat.st_size, stat.st_mtime, stat.st_ino))
+        except OSError:
+            return
+        for key in [key for key in self._entries if key not in seen]:
+            self._discard(key)
+
+    def _store(self, key: str, entry: FolderEntry) -> None:
+        self._discard(key)
+        self._entries[key] = entry
+        insort(self._by_mtime, (entry.mtime, key))
+
+    def _discard(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is None:
+            return
+        position = bisect_left(self._by_mtime, (old.mtime, key))
+        if position < len(self._by_mtime) and self._by_mtime[position] == (old.mtime, key):
+            del self._by_mtime[position]
+
+    def record_write(self, path: str) -> FolderEntry | None:
+        """Update the index for a file Link2Vid just wrote (or removed)."""
+        path = os.path.abspath(path)
+        if os.path.dirname(path) != self.folder:
+            return None
+        key = os.path.normcase(os.path.basename(path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._discard(key)
+            return None
+        entry = FolderEntry(path, stat.st_size, stat.st_mtime, stat.st_ino)
+        with self._lock:
+            self._store(key, entry)
+        return entry
+
+    def exists(self, path: str) -> bool:
+        path = os.path.abspath(path)
+        if os.path.dirname(path) != self.folder:
+            return os.path.exists(path)
+        self.refresh()
+        with self._lock:
+            return os.path.normcase(os.path.basename(path)) in self._entries
+
+    def recent(self, since: float) -> list[FolderEntry]:
+        """Files modified at or after ``since``, oldest first."""
+        self.refresh()
+        with self._lock:
+            position = bisect_left(self._by_mtime, (since, ""))
+            return [self._entries[key] for _mtime, key in self._by_mtime[position:]]
+
+    def newest(self, limit: int = 10) -> list[FolderEntry]:
+        self.refresh()
+        with self._lock:
+            tail = self._by_mtime[-limit:] if limit > 0 else []
+            return [self._entries[key] for _mtime, key in reversed(tail)]
+
+    def __len__(self) -> int:
+        self.refresh()
+        with self._lock:
+            return len(self._entries)
@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import os
 import re
+import signal
 import subprocess
+import time
+from collections import deque
 from collections.abc import Callable
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 import m3u8
-import yt_dlp
+
+from .cancellation import CancelToken
+from .errors import DownloadCancelledError
+from .hls import HlsPlaylistCache, HlsVariantPolicy
+from .telemetry import Telemetry, maybe_span
 
 _URL_IN_TEXT = re.compile(r"https?://\S+", re.IGNORECASE)
 _FFMPEG_TIME_RE = re.compile(r"time=(\d+):(\d+):(\d+(?:\.\d+)?)")
@@ -17,6 +24,10 @@ _FFMPEG_PROGRESS_MS_RE = re.compile(r"^out_time_ms=(\d+(?:\.\d+)?)$")
 
 ProgressHook = Callable[[float, float | None, float | None], None]
 
+# Shared by probe_media_duration and download_with_ffmpeg so a direct-HLS
+# download loads the master and media playlists once.
+hls_playlist_cache = HlsPlaylistCache(lambda url, headers: m3u8.load(url, headers=headers))
+
 
 def normalize_url(raw_url: str | None) -> str:
     """Normalize known URL variants and enforce https."""
@@ -70,14 +81,21 @@ def sanitize_filename(name: str, *, max_length: int = 120) -> str:
     return cleaned or "video"
 
 
-def unique_output_path(folder: str, base_name: str, ext: str = "mp4") -> str:
+def unique_output_path(
+    folder: str,
+    base_name: str,
+    ext: str = "mp4",
+    exists: Callable[[str], bool] | None = None,
+) -> str:
+    """First free ``name.ext`` / ``name (N).ext``; pass ``FolderIndex.exists`` to avoid disk probes."""
+    exists = exists or os.path.exists
     safe = sanitize_filename(base_name)
     candidate = os.path.join(folder, f"{safe}.{ext}")
-    if not os.path.exists(candidate):
+    if not exists(candidate):
         return candidate
     for number in range(2, 100):
         numbered = os.path.join(folder, f"{safe} ({number}).{ext}")
-        if not os.path.exists(numbered):
+        if not exists(numbered):
             return numbered
     return os.path.join(folder, f"{safe} ({os.getpid()}).{ext}")
 
@@ -91,6 +109,8 @@ def get_format_options() -> list[dict[str, str]]:
 
 
 def get_yt_dlp_version() -> str:
+    import yt_dlp
+
     version = getattr(yt_dlp, "__version__", None)
     if version:
         return version
@@ -117,6 +137,60 @@ def parse_ffmpeg_progress_ms(line: str) -> float | None:
     return float(match.group(1)) / 1000.0
 
 
+class FfmpegProgressReader:
+    """Incremental reader for ``ffmpeg -progress pipe:1`` output.
+
+    ffmpeg writes ``key=value`` lines in blocks terminated by ``progress=...``.
+    Lines are split once on ``=``, only the time keys are kept, and a value
+    is reported once per block. Everything else just lands in a bounded tail
+    used for error messages, so memory stays flat on multi-hour downloads.
+    """
+
+    def __init__(self, tail_lines: int = 20) -> None:
+        self.tail: deque[str] = deque(maxlen=tail_lines)
+        self.finished = False
+        self._out_time_us: str | None = None
+        self._out_time_ms: str | None = None
+        self._out_time: str | None = None
+
+    def feed(self, line: str) -> float | None:
+        """Consume one line; elapsed seconds when it closes a progress block."""
+        self.tail.append(line)
+        key, sep, value = line.partition("=")
+        if not sep:
+            return None
+        if key == "out_time_us":
+            self._out_time_us = value
+        elif key == "out_time_ms":
+            self._out_time_ms = value
+        elif key == "out_time":
+            self._out_time = value
+        elif key == "progress":
+            self.finished = value.strip() == "end"
+            elapsed = self._block_seconds()
+            self._out_time_us = self._out_time_ms = self._out_time = None
+            return elapsed
+        return None
+
+    def _block_seconds(self) -> float | None:
+        try:
+            if self._out_time_us is not None:
+                return int(self._out_time_us) / 1_000_000
+            if self._out_time is not None:
+                hours, minutes, seconds = self._out_time.split(":")
+                return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+            if self._out_time_ms is not None:
+                # Same unit as parse_ffmpeg_progress_ms.
+                return float(self._out_time_ms) / 1000.0
+        except ValueError:
+            # "N/A" before the first packet is muxed.
+            return None
+        return None
+
+    def tail_text(self) -> str:
+        return "".join(self.tail).strip()
+
+
 def _ffmpeg_header_args(headers: dict | None) -> tuple[str, str | None]:
     ua = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     header_block = None
@@ -126,20 +200,26 @@ def _ffmpeg_header_args(headers: dict | None) -> tuple[str, str | None]:
     return ua, header_block
 
 
-def probe_media_duration(media_url: str, headers: dict | None = None) -> float | None:
-    if media_url.lower().endswith(".m3u8") or "m3u8" in media_url.lower():
+def _is_hls_url(media_url: str) -> bool:
+    return "m3u8" in media_url.lower()
+
+
+def probe_media_duration(
+    media_url: str,
+    headers: dict | None = None,
+    *,
+    telemetry: Telemetry | None = None,
+    variant_policy: HlsVariantPolicy | None = None,
+) -> float | None:
+    if _is_hls_url(media_url):
         try:
-            playlist = m3u8.load(media_url, headers=headers or {})
-            if playlist.is_variant and playlist.playlists:
-                best = max(
-                    playlist.playlists,
-                    key=lambda variant: variant.stream_info.bandwidth or 0,
-                )
-                media_url = urljoin(media_url, best.uri)
-                playlist = m3u8.load(media_url, headers=headers or {})
-            duration = sum(segment.duration or 0 for segment in playlist.segments)
-            if duration > 0:
-                return duration
+            with maybe_span(telemetry, "hls.playlist_probe") as span:
+                span["cached"] = hls_playlist_cache.get(media_url, headers, variant_policy) is not None
+                resolved = hls_playlist_cache.resolve(media_url, headers, variant_policy)
+                span["duration_s"] = resolved.duration or 0
+            if resolved.duration:
+                return resolved.duration
+            media_url = resolved.media_url
         except Exception:
             pass
 
@@ -157,7 +237,9 @@ def probe_media_duration(media_url: str, headers: dict | None = None) -> float |
         cmd.extend(["-headers", header_block])
     cmd.extend(["-user_agent", ua, media_url])
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        with maybe_span(telemetry, "ffprobe") as span:
+            proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            span["returncode"] = proc.returncode
         if proc.returncode != 0:
             return None
         value = (proc.stdout or "").strip()
@@ -186,6 +268,32 @@ def _emit_progress(
     return last_fraction
 
 
+def _process_group_kwargs() -> dict:
+    # Own process group/session so cancellation can stop ffmpeg and anything it spawned.
+    if os.name == "nt":
+        return {"creationflags": getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)}
+    return {"start_new_session": True}
+
+
+def terminate_process_group(proc: subprocess.Popen, timeout: float = 5.0) -> None:
+    """Terminate a child started with ``_process_group_kwargs``, then kill it if it lingers."""
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "nt":
+            proc.terminate()
+        else:
+            os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if os.name == "nt":
+            proc.kill()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (OSError, ProcessLookupError):
+        pass
+
+
 def download_with_ffmpeg(
     m3u8_url: str,
     output_file: str,
@@ -193,10 +301,40 @@ def download_with_ffmpeg(
     *,
     progress_hook: ProgressHook | None = None,
     duration_seconds: float | None = None,
+    telemetry: Telemetry | None = None,
+    variant_policy: HlsVariantPolicy | None = None,
+    cancel_token: CancelToken | None = None,
 ) -> None:
+    """Remux ``m3u8_url`` to ``output_file`` with ffmpeg.
+
+    HLS input is resolved through ``hls_playlist_cache`` (usually already
+    filled by the duration probe), and ffmpeg is handed the chosen media
+    playlist rather than the master, e.g. 720p instead of 4K under a
+    ``variant_policy``. Without a policy the highest variant is used.
+
+    Setting ``cancel_token`` terminates ffmpeg's process group, removes the
+    partial output and raises ``DownloadCancelledError``.
+    """
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
     ua, header_block = _ffmpeg_header_args(headers)
     if duration_seconds is None:
-        duration_seconds = probe_media_duration(m3u8_url, headers)
+        duration_seconds = probe_media_duration(
+            m3u8_url,
+            headers,
+            telemetry=telemetry,
+            variant_policy=variant_policy,
+        )
+    input_url, map_args = m3u8_url, []
+    if _is_hls_url(m3u8_url):
+        resolved = hls_playlist_cache.get(m3u8_url, headers, variant_policy)
+        if resolved is None and variant_policy is not None:
+            try:
+                resolved = hls_playlist_cache.resolve(m3u8_url, headers, variant_policy)
+            except Exception:
+                resolved = None
+        if resolved is not None:
+            input_url, map_args = resolved.ffmpeg_input()
 
     cmd = [
         "ffmpeg",
@@ -210,7 +348,8 @@ def download_with_ffmpeg(
         "-user_agent",
         ua,
         "-i",
-        m3u8_url,
+        input_url,
+        *map_args,
         "-c",
         "copy",
         "-bsf:a",
@@ -218,26 +357,48 @@ def download_with_ffmpeg(
         output_file,
     ]
     cmd = [c for c in cmd if c]
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    output_lines: list[str] = []
-    last_fraction = 0.0
-    for line in proc.stdout:
-        output_lines.append(line)
-        elapsed_seconds = parse_ffmpeg_progress_ms(line)
-        if elapsed_seconds is None:
-            elapsed_seconds = parse_ffmpeg_time_seconds(line)
-        if elapsed_seconds is not None:
-            last_fraction = _emit_progress(
-                progress_hook,
-                elapsed_seconds=elapsed_seconds,
-                duration_seconds=duration_seconds,
-                last_fraction=last_fraction,
-            )
-    proc.wait()
-    if proc.returncode != 0:
-        tail = "".join(output_lines[-20:]).strip()
-        raise RuntimeError(f"ffmpeg failed (exit {proc.returncode}): {tail}")
-    if not os.path.isfile(output_file) or os.path.getsize(output_file) == 0:
-        raise RuntimeError(f"ffmpeg produced no output at {output_file}")
+    with maybe_span(telemetry, "ffmpeg.download", media_seconds=duration_seconds) as span:
+        started = time.perf_counter()
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            **_process_group_kwargs(),
+        )
+        unregister = cancel_token.on_cancel(lambda: terminate_process_group(proc)) if cancel_token else None
+        reader = FfmpegProgressReader()
+        last_fraction = 0.0
+        try:
+            for line in proc.stdout:
+                elapsed_seconds = reader.feed(line)
+                if elapsed_seconds is not None:
+                    last_fraction = _emit_progress(
+                        progress_hook,
+                        elapsed_seconds=elapsed_seconds,
+                        duration_seconds=duration_seconds,
+                        last_fraction=last_fraction,
+                    )
+            proc.wait()
+        finally:
+            if unregister is not None:
+                unregister()
+            terminate_process_group(proc)
+        if cancel_token is not None and cancel_token.cancelled:
+            span["cancelled"] = True
+            try:
+                os.remove(output_file)
+            except OSError:
+                pass
+            raise DownloadCancelledError()
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed (exit {proc.returncode}): {reader.tail_text()}")
+        if not os.path.isfile(output_file) or os.path.getsize(output_file) == 0:
+            raise RuntimeError(f"ffmpeg produced no output at {output_file}")
+        size = os.path.getsize(output_file)
+        span["bytes"] = size
+        span["bytes_per_s"] = round(size / max(time.perf_counter() - started, 1e-6))
+    if telemetry is not None:
+        telemetry.count("download.bytes", size)
     if progress_hook is not None:
         progress_hook(1.0, duration_seconds, duration_seconds)
@@ -0,0 +1,211 @@
+"""HLS variant metadata, the policy used to pick one, and a resolved-playlist cache."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+from urllib.parse import urljoin
+import re
+import threading
+import time
+
+HLS_BEST_FORMAT = "hls-best"
+HLS_HEIGHT_CAPS = (1080, 720, 480, 360)
+
+_HLS_FORMAT_RE = re.compile(r"^hls-(?:(?P<height>\d+)p?|(?P<kbps>\d+)k)$", re.I)
+
+
+@dataclass
+class HlsVariant:
+    bandwidth_kbps: int | None
+    resolution: tuple[int, int] | None
+    uri: str
+    # True when audio comes from a separate EXT-X-MEDIA rendition playlist.
+    separate_audio: bool = False
+
+    @property
+    def height(self) -> int | None:
+        return self.resolution[1] if self.resolution else None
+
+
+@dataclass(frozen=True)
+class HlsVariantPolicy:
+    """Caps for variant selection; ``None`` means uncapped."""
+
+    max_height: int | None = None
+    max_bandwidth_kbps: int | None = None
+
+
+def parse_hls_format(format_id: str | None) -> HlsVariantPolicy | None:
+    """``hls-best`` / ``hls-720`` / ``hls-2500k`` to a policy; ``None`` for other ids."""
+    if not format_id:
+        return None
+    if format_id == HLS_BEST_FORMAT:
+        return HlsVariantPolicy()
+    match = _HLS_FORMAT_RE.match(format_id)
+    if match is None:
+        return None
+    if match.group("height"):
+        return HlsVariantPolicy(max_height=int(match.group("height")))
+    return HlsVariantPolicy(max_bandwidth_kbps=int(match.group("kbps")))
+
+
+def _fits(variant: HlsVariant, policy: HlsVariantPolicy) -> bool:
+    if policy.max_height and variant.height and variant.height > policy.max_height:
+        return False
+    if policy.max_bandwidth_kbps and variant.bandwidth_kbps and variant.bandwidth_kbps > policy.max_bandwidth_kbps:
+        return False
+    return True
+
+
+def _rank(variant: HlsVariant) -> tuple[int, int]:
+    return (variant.height or 0, variant.bandwidth_kbps or 0)
+
+
+def select_hls_variant(variants: Sequence[HlsVariant], policy: HlsVariantPolicy | None = None) -> HlsVariant | None:
+    """Best variant within the caps, or the smallest one when nothing fits."""
+    if not variants:
+        return None
+    policy = policy or HlsVariantPolicy()
+    fitting = [variant for variant in variants if _fits(variant, policy)]
+    if fitting:
+        return max(fitting, key=_rank)
+    return min(variants, key=_rank)
+
+
+def variants_from_playlist(playlist, base_url: str) -> list[HlsVariant]:
+    """HlsVariant list (absolute URIs) from a parsed ``m3u8`` master playlist."""
+    variants: list[HlsVariant] = []
+    for item in getattr(playlist, "playlists", None) or []:
+        stream_info = item.stream_info
+        bandwidth = stream_info.bandwidth
+        renditions = getattr(item, "media", None) or []
+        variants.append(
+            HlsVariant(
+                bandwidth_kbps=bandwidth // 1000 if bandwidth else None,
+                resolution=tuple(stream_info.resolution) if stream_info.resolution else None,
+                uri=urljoin(base_url, item.uri),
+                separate_audio=any(media.type == "AUDIO" and media.uri for media in renditions),
+            )
+        )
+    return variants
+
+
+def hls_format_options(variants: Sequence[HlsVariant] | None) -> list[dict[str, str]]:
+    """Card format options for a direct HLS entry.
+
+    With known variants each distinct height becomes an option; otherwise the
+    usual resolution caps are offered and resolved when the download starts.
+    """
+    options = [{"label": "HLS: Best", "format": HLS_BEST_FORMAT}]
+    if variants:
+        heights = sorted({variant.height for variant in variants if variant.height}, reverse=True)
+        for height in heights[1:]:
+            best = select_hls_variant(variants, HlsVariantPolicy(max_height=height))
+            rate = f" (~{best.bandwidth_kbps:,} kbps)" if best and best.bandwidth_kbps else ""
+            options.append({"label": f"HLS: {height}p{rate}", "format": f"hls-{height}"})
+        return options
+    for height in HLS_HEIGHT_CAPS:
+        options.append({"label": f"HLS: up to {height}p", "format": f"hls-{height}"})
+    return options
+
+
+@dataclass(frozen=True)
+class ResolvedHlsPlaylist:
+    """A master playlist resolved down to the media playlist that will be fetched."""
+
+    url: str
+    media_url: str
+    program_index: int | None = None
+    duration: float | None = None
+    separate_audio: bool = False
+
+    def ffmpeg_input(self) -> tuple[str, list[str]]:
+        """``-i`` URL and extra ``-map`` args for ffmpeg.
+
+        The media playlist is handed over directly so ffmpeg skips the master
+        and the variants it would not use. With separate audio renditions the
+        master is kept and the program mapped, so ffmpeg still muxes the audio.
+        """
+        if self.program_index is not None and self.separate_audio:
+            return self.url, ["-map", f"0:p:{self.program_index}"]
+        return self.media_url, []
+
+
+PlaylistLoader = Callable[[str, dict], Any]
+
+
+class HlsPlaylistCache:
+    """Short-lived cache of resolved playlists shared by the probe and the downloader.
+
+    Entries are keyed by URL, headers and policy and expire after ``ttl``
+    seconds, since media URLs are often signed and live playlists move on.
+    """
+
+    def __init__(self, load: PlaylistLoader, *, ttl: float = 120.0, max_entries: int = 32) -> None:
+        self.load = load
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, ResolvedHlsPlaylist]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str, headers: dict | None, policy: HlsVariantPolicy | None) -> tuple:
+        return (url, tuple(sorted((headers or {}).items())), policy)
+
+    def get(
+        self,
+        url: str,
+        headers: dict | None = None,
+        policy: HlsVariantPolicy | None = None,
+    ) -> ResolvedHlsPlaylist | None:
+        """Cached resolution, without touching the network."""
+        key = self._key(url, headers, policy)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                return None
+            if time.monotonic() - cached[0] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return cached[1]
+
+    def resolve(
+        self,
+        url: str,
+        headers: dict | None = None,
+        policy: HlsVariantPolicy | None = None,
+    ) -> ResolvedHlsPlaylist:
+        """Load (at most) the master and one media playlist, then cache the result."""
+        cached = self.get(url, headers, policy)
+        if cached is not None:
+            return cached
+        headers = headers or {}
+        playlist = self.load(url, headers)
+        media_url, program_index, separate_audio = url, None, False
+        if playlist.is_variant and playlist.playlists:
+            variants = variants_from_playlist(playlist, url)
+            chosen = select_hls_variant(variants, policy)
+            media_url, program_index, separate_audio = chosen.uri, variants.index(chosen), chosen.separate_audio
+            playlist = self.load(media_url, headers)
+        duration = sum(segment.duration or 0 for segment in playlist.segments)
+        resolved = ResolvedHlsPlaylist(
+            url=url,
+            media_url=media_url,
+            program_index=program_index,
+            duration=duration if duration > 0 else None,
+            separate_audio=separate_audio,
+        )
+        key = self._key(url, headers, policy)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), resolved)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return resolved
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,104 @@
+"""Background file writer for high-volume log lines."""
+
+from __future__ import annotations
+
+from collections import deque
+import os
+import threading
+
+
+class BufferedLogWriter:
+    """Buffers lines in memory and appends them to a file from a worker thread.
+
+    ``write`` never touches the filesystem, so it is safe to call from the Tk
+    thread. When the buffer is full the oldest pending lines are dropped and a
+    marker line records how many were lost. The file is rotated to ``<path>.1``
+    once it grows past ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_buffered_lines: int = 5000,
+        flush_interval: float = 0.5,
+        max_bytes: int = 5 * 1024 * 1024,
+    ) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self._pending: deque[str] = deque(maxlen=max_buffered_lines)
+        self._dropped = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flushed = threading.Condition(self._lock)
+        self._generation = 0
+        self._written_generation = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="link2vid-log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+            self._pending.append(line)
+            self._generation += 1
+
+    __call__ = write
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Block until everything written so far has reached the file."""
+        with self._lock:
+            target = self._generation
+            self._wake.set()
+            return self._flushed.wait_for(lambda: self._written_generation >= target, timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                lines = list(self._pending)
+                self._pending.clear()
+                dropped, self._dropped = self._dropped, 0
+                generation = self._generation
+                closed = self._closed
+            if dropped:
+                lines.insert(0, f"[log] {dropped} line(s) dropped; writer buffer was full.")
+            if lines:
+                self._append(lines)
+            with self._lock:
+                self._written_generation = generation
+                self._flushed.notify_all()
+            if closed:
+                return
+
+    def _append(self, lines: list[str]) -> None:
+        try:
+            self._rotate_if_needed()
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write("\n".join(lines) + "\n")
+        except Exception:
+            return
+
+    def _rotate_if_needed(self) -> None:
+        if self.max_bytes <= 0:
+            return
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size < self.max_bytes:
+            return
+        os.replace(self.path, f"{self.path}.1")
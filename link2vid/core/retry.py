@@ -0,0 +1,174 @@
+"""Retry with backoff for transient (network / rate-limit) failures."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, TypeVar
+import random
+import re
+import threading
+import time
+
+from .bandwidth import host_for_url
+from .cancellation import CancelToken
+from .error_classification import classify_error, iter_error_chain
+from .errors import DownloadCancelledError
+
+T = TypeVar("T")
+
+_RETRY_AFTER_TEXT = re.compile(r"retry-after:\s*(\d+)", re.I)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 4
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+    # Fraction of each backoff step that is randomized (0 disables jitter).
+    jitter: float = 0.5
+    # Longest server-requested wait honoured; longer Retry-After values give up.
+    max_retry_after: float = 300.0
+    retry_reasons: tuple[str, ...] = ("network/rate-limit",)
+
+    def backoff(self, attempt: int, rng: Callable[[], float] = random.random) -> float:
+        """Delay before retry number ``attempt`` (1-based)."""
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * (1 - self.jitter * rng())
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Seconds from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+def retry_after_seconds(err: BaseException) -> float | None:
+    """``Retry-After`` from ``err`` or anything it wraps (yt-dlp, requests, urllib errors)."""
+    for current in iter_error_chain(err):
+        for holder in (getattr(current, "response", None), current):
+            headers = getattr(holder, "headers", None)
+            getter = getattr(headers, "get", None)
+            if callable(getter):
+                seconds = parse_retry_after(getter("Retry-After"))
+                if seconds is not None:
+                    return seconds
+    match = _RETRY_AFTER_TEXT.search(str(err))
+    return float(match.group(1)) if match else None
+
+
+class HostCooldowns:
+    """Per-host "do not contact before" times, shared by every retrying caller."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def remaining(self, url: str | None) -> float:
+        host = host_for_url(url)
+        with self._lock:
+            until = self._until.get(host)
+            if until is None:
+                return 0.0
+            left = until - self._clock()
+            if left <= 0:
+                del self._until[host]
+                return 0.0
+            return left
+
+    def extend(self, url: str | None, seconds: float) -> None:
+        host = host_for_url(url)
+        if not host or seconds <= 0:
+            return
+        with self._lock:
+            until = self._clock() + seconds
+            self._until[host] = max(until, self._until.get(host, 0.0))
+
+    def clear(self, url: str | None) -> None:
+        with self._lock:
+            self._until.pop(host_for_url(url), None)
+
+
+class RetryScheduler:
+    """Runs a callable, retrying errors that ``classify_error`` marks as transient.
+
+    Backoff is exponential with jitter; a server ``Retry-After`` takes
+    precedence. Each failure puts the host into a cool-down that every other
+    call through the same scheduler (fetches and downloads alike) waits out
+    before contacting that host again.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        *,
+        cooldowns: HostCooldowns | None = None,
+        log: Callable[[str], None] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.cooldowns = cooldowns or HostCooldowns()
+        self.log = log or (lambda _msg: None)
+        self._sleep = sleep
+        self._rng = rng
+
+    def _wait(self, seconds: float, cancel_token: CancelToken | None) -> None:
+        if seconds <= 0:
+            return
+        if cancel_token is None:
+            self._sleep(seconds)
+        elif cancel_token.wait(seconds):
+            raise DownloadCancelledError()
+
+    def run(
+        self,
+        func: Callable[[], T],
+        *,
+        url: str | None,
+        stage: str = "Request",
+        cancel_token: CancelToken | None = None,
+    ) -> T:
+        policy = self.policy
+        attempt = 1
+        while True:
+            cooldown = self.cooldowns.remaining(url)
+            if cooldown > 0:
+                self.log(f"[retry] {host_for_url(url)} is cooling down; waiting {cooldown:.0f}s before {stage.lower()}.")
+                self._wait(cooldown, cancel_token)
+            try:
+                return func()
+            except DownloadCancelledError:
+                raise
+            except Exception as err:
+                if cancel_token is not None and cancel_token.cancelled:
+                    raise DownloadCancelledError() from err
+                reason, _hint = classify_error(err)
+                if reason not in policy.retry_reasons or attempt >= policy.max_attempts:
+                    raise
+                server_delay = retry_after_seconds(err)
+                if server_delay is not None and server_delay > policy.max_retry_after:
+                    self.log(f"[retry] {stage}: server asked to wait {server_delay:.0f}s; not retrying.")
+                    raise
+                delay = server_delay if server_delay is not None else policy.backoff(attempt, self._rng)
+                self.log(
+                    f"[retry] {stage} failed ({reason}), attempt {attempt}/{policy.max_attempts}; "
+                    f"retrying in {delay:.1f}s."
+                )
+                if host_for_url(url):
+                    self.cooldowns.extend(url, delay)
+                else:
+                    # No host to cool down: wait here so the retry is not immediate.
+                    self._wait(delay, cancel_token)
+                attempt += 1
@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import importlib
 import os
 import sys
+import time
 from pathlib import Path
 
 _bootstrap_done = False
+_startup_started = time.perf_counter()
+_startup_phases: list[tuple[str, float]] = []
+_import_times: list[tuple[str, float]] = []
+
+STARTUP_PROFILE_MODULES = (
+    "customtkinter",
+    "PIL",
+    "requests",
+    "m3u8",
+    "yt_dlp",
+    "yt_dlp_ejs",
+    "link2vid.core.selenium_fallback",
+    "link2vid.ui.main_window",
+)
 
 
 def is_frozen() -> bool:
@@ -24,6 +40,19 @@ def _appdata_developer_json() -> Path:
     return Path(appdata) / "Link2Vid" / "developer.json"
 
 
+def user_data_dir() -> Path:
+    """Per-user directory for Link2Vid state (archive, profiles); not created here."""
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA")
+        if base:
+            return Path(base) / "Link2Vid"
+        return Path.home() / "AppData" / "Local" / "Link2Vid"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Application Support" / "Link2Vid"
+    base = os.environ.get("XDG_DATA_HOME")
+    return (Path(base) if base else Path.home() / ".local" / "share") / "link2vid"
+
+
 def resolve_developer_json() -> Path | None:
     if is_frozen():
         candidates = [
@@ -56,3 +85,31 @@ def startup_summary() -> str:
     dev_json = resolve_developer_json()
     dev_part = str(dev_json) if dev_json else "none"
     return f"runtime: frozen={is_frozen()} app_dir={app_dir()} developer.json={dev_part}"
+
+
+def mark_startup_phase(name: str) -> float:
+    elapsed = time.perf_counter() - _startup_started
+    _startup_phases.append((name, elapsed))
+    return elapsed
+
+
+def timed_import(module_name: str) -> float:
+    """Import a module and record how long it took beyond already-loaded dependencies."""
+    started = time.perf_counter()
+    importlib.import_module(module_name)
+    elapsed = time.perf_counter() - started
+    _import_times.append((module_name, elapsed))
+    return elapsed
+
+
+def startup_report() -> list[str]:
+    lines = ["startup phases:"]
+    previous = 0.0
+    for name, elapsed in _startup_phases:
+        lines.append(f"  {name}: +{(elapsed - previous) * 1000:.0f} ms (at {elapsed * 1000:.0f} ms)")
+        previous = elapsed
+    if _import_times:
+        lines.append("import times:")
+        for name, elapsed in sorted(_import_times, key=lambda item: item[1], reverse=True):
+            lines.append(f"  {name}: {elapsed * 1000:.0f} ms")
+    return lines
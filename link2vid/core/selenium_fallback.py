@@ -16,6 +16,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from .dev_defaults import LoginPlan
+from .telemetry import Telemetry, maybe_span
 from .extractors import (
     _clean_page_title,
     build_media_entries,
@@ -581,27 +582,45 @@ def _video_titles_for_urls(media_urls: list[str], labels: list[str]) -> list[str
     return titles
 
 
+def _login_with_plan(
+    driver,
+    page_url: str,
+    username: str,
+    password: str,
+    login_plan: LoginPlan | None,
+    log: LogFn,
+    telemetry: Telemetry | None,
+) -> bool:
+    plan = login_plan or LoginPlan(login_url=f"{page_url.rstrip('/')}/login")
+    with maybe_span(telemetry, "selenium.login", mode=plan.login_mode) as span:
+        if plan.login_mode == "form":
+            ok = _login_form_page(driver, plan.login_url, page_url, username, password, log)
+        else:
+            ok = _login_generic(driver, page_url, username, password, log)
+        span["ok"] = ok
+    return ok
+
+
 def selenium_fetch_media_entries(
     page_url: str,
     username: str,
     password: str,
     login_plan: LoginPlan | None = None,
     log: LogFn | None = None,
+    telemetry: Telemetry | None = None,
 ) -> list[dict]:
     logger = log or (lambda _msg: None)
     logger(f"[Selenium] Starting browser fallback for {page_url}")
     driver = None
     try:
-        driver = _create_driver()
-        plan = login_plan or LoginPlan(login_url=f"{page_url.rstrip('/')}/login")
-        if plan.login_mode == "form":
-            ok = _login_form_page(driver, plan.login_url, page_url, username, password, logger)
-        else:
-            ok = _login_generic(driver, page_url, username, password, logger)
-        if not ok:
+        with maybe_span(telemetry, "selenium.start_driver"):
+            driver = _create_driver()
+        if not _login_with_plan(driver, page_url, username, password, login_plan, logger, telemetry):
             return []
 
-        media_urls = discover_media_urls(driver, logger, page_url=page_url)
+        with maybe_span(telemetry, "selenium.discovery") as span:
+            media_urls = discover_media_urls(driver, logger, page_url=page_url)
+            span["media_urls"] = len(media_urls)
         if not media_urls:
             logger("[Selenium] No media URL found in page after login.")
             return []
@@ -639,21 +658,20 @@ def selenium_fetch_m3u8(
     password: str,
     login_plan: LoginPlan | None = None,
     log: LogFn | None = None,
+    telemetry: Telemetry | None = None,
 ) -> SeleniumMediaResult | None:
     logger = log or (lambda _msg: None)
     logger(f"[Selenium] Starting browser fallback for {page_url}")
     driver = None
     try:
-        driver = _create_driver()
-        plan = login_plan or LoginPlan(login_url=f"{page_url.rstrip('/')}/login")
-        if plan.login_mode == "form":
-            ok = _login_form_page(driver, plan.login_url, page_url, username, password, logger)
-        else:
-            ok = _login_generic(driver, page_url, username, password, logger)
-        if not ok:
+        with maybe_span(telemetry, "selenium.start_driver"):
+            driver = _create_driver()
+        if not _login_with_plan(driver, page_url, username, password, login_plan, logger, telemetry):
             return None
 
-        media_url = discover_media_url(driver, logger, page_url=page_url)
+        with maybe_span(telemetry, "selenium.discovery") as span:
+            media_url = discover_media_url(driver, logger, page_url=page_url)
+            span["media_urls"] = int(bool(media_url))
         if media_url:
             headers = build_download_headers(driver, page_url, media_url)
             logger(f"[Selenium] Selected media URL: {media_url}")
@@ -0,0 +1,129 @@
+"""Per-domain record of the fetch strategy that last worked, persisted as JSON."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlparse
+import json
+import os
+import threading
+import time
+
+from .dev_defaults import normalize_domain
+
+SITE_PROFILES_FILENAME = "site-profiles.json"
+
+STRATEGY_YTDLP = "ytdlp"
+STRATEGY_EMBEDDED = "embedded"
+STRATEGY_DIRECT_MEDIA = "direct_media"
+STRATEGY_HLS = "hls"
+STRATEGY_SELENIUM = "selenium"
+STRATEGIES = (STRATEGY_YTDLP, STRATEGY_EMBEDDED, STRATEGY_DIRECT_MEDIA, STRATEGY_HLS, STRATEGY_SELENIUM)
+
+_VERSION = 1
+
+
+@dataclass
+class SiteProfile:
+    domain: str
+    strategy: str
+    seconds: float
+    # "none", "cookies.txt" or "browser:<name>" (see DownloadManager.cookie_source).
+    cookie_source: str = "none"
+    successes: int = 1
+    updated_at: float = 0.0
+
+    @property
+    def cookie_browser(self) -> str | None:
+        prefix, _, browser = self.cookie_source.partition(":")
+        return (browser or None) if prefix == "browser" else None
+
+
+def profile_domain(url: str) -> str:
+    return normalize_domain(urlparse(url).netloc)
+
+
+class SiteProfileStore:
+    """Loads lazily, rewrites the whole file (atomically) on every change.
+
+    A profile is replaced whenever another strategy wins and dropped with
+    ``forget`` when its strategy stops working, so a stale entry costs at
+    most one wasted attempt.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        log: Callable[[str], None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.log = log or (lambda _msg: None)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._profiles: dict[str, SiteProfile] | None = None
+
+    def _load(self) -> dict[str, SiteProfile]:
+        if self._profiles is not None:
+            return self._profiles
+        self._profiles = {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return self._profiles
+        except (OSError, ValueError) as exc:
+            self.log(f"[profiles] Ignoring unreadable {self.path.name}: {exc}")
+            return self._profiles
+        known = {item.name for item in fields(SiteProfile)}
+        for domain, raw in (payload.get("sites") or {}).items() if isinstance(payload, dict) else ():
+            if not isinstance(raw, dict) or raw.get("strategy") not in STRATEGIES:
+                continue
+            try:
+                self._profiles[domain] = SiteProfile(**{key: value for key, value in raw.items() if key in known})
+            except TypeError:
+                continue
+        return self._profiles
+
+    def _save(self) -> None:
+        payload = {"version": _VERSION, "sites": {domain: asdict(p) for domain, p in self._profiles.items()}}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            self.log(f"[profiles] Could not save {self.path.name}: {exc}")
+
+    def get(self, url: str) -> SiteProfile | None:
+        domain = profile_domain(url)
+        if not domain:
+            return None
+        with self._lock:
+            return self._load().get(domain)
+
+    def record_success(self, url: str, strategy: str, seconds: float, cookie_source: str | None = None) -> None:
+        domain = profile_domain(url)
+        if not domain or strategy not in STRATEGIES:
+            return
+        with self._lock:
+            profiles = self._load()
+            previous = profiles.get(domain)
+            successes = previous.successes + 1 if previous and previous.strategy == strategy else 1
+            profiles[domain] = SiteProfile(
+                domain=domain,
+                strategy=strategy,
+                seconds=round(seconds, 2),
+                cookie_source=cookie_source or "none",
+                successes=successes,
+                updated_at=self._clock(),
+            )
+            self._save()
+
+    def forget(self, url: str) -> None:
+        domain = profile_domain(url)
+        with self._lock:
+            if self._load().pop(domain, None) is not None:
+                self._save()
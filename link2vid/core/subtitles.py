@@ -0,0 +1,320 @@
+"""Streaming subtitle conversion (WebVTT/SRT/SRV3/JSON3 to SRT or plain text).
+
+Readers yield cues one at a time from an open file, and ``collapse_rolling_cues``
+folds YouTube-style rolling auto-captions (each cue repeating the previous
+line, word-by-word growth, 10 ms "hold" cues) into one cue per spoken line.
+Memory stays constant regardless of transcript length.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import IO, Iterable, Iterator
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+
+SUBTITLE_OUTPUT_FORMATS = ("srt", "txt")
+SUBTITLE_INPUT_FORMATS = ("vtt", "srt", "srv3", "json3")
+
+_TIMING_RE = re.compile(
+    r"(?P<start>(?:\d+:)?\d{1,2}:\d{2}[.,]\d{3})\s*-->\s*(?P<end>(?:\d+:)?\d{1,2}:\d{2}[.,]\d{3})"
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_ENTITIES = {"&amp;": "&", "&lt;": "<", "&gt;": ">", "&nbsp;": " ", "&lrm;": "", "&rlm;": ""}
+_JSON_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class Cue:
+    start_ms: int
+    end_ms: int
+    text: str
+
+
+def parse_timestamp_ms(value: str) -> int:
+    parts = value.replace(",", ".").split(":")
+    seconds = float(parts[-1])
+    minutes = int(parts[-2]) if len(parts) > 1 else 0
+    hours = int(parts[-3]) if len(parts) > 2 else 0
+    return int(round(((hours * 60 + minutes) * 60 + seconds) * 1000))
+
+
+def format_srt_timestamp(ms: int) -> str:
+    hours, rest = divmod(max(0, ms), 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    seconds, millis = divmod(rest, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
+
+
+def clean_cue_text(text: str) -> str:
+    text = _TAG_RE.sub("", text)
+    for entity, replacement in _ENTITIES.items():
+        text = text.replace(entity, replacement)
+    lines = [" ".join(line.split()) for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _make_cue(start_ms: int, end_ms: int, raw_text: str) -> Cue | None:
+    text = clean_cue_text(raw_text)
+    if not text:
+        return None
+    return Cue(start_ms=start_ms, end_ms=max(start_ms, end_ms), text=text)
+
+
+def iter_vtt_cues(lines: Iterable[str]) -> Iterator[Cue]:
+    """Yield cues from WebVTT or SRT lines (header, NOTE and STYLE blocks are skipped)."""
+    timing: re.Match | None = None
+    body: list[str] = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if timing is None:
+            timing = _TIMING_RE.search(line)
+            continue
+        if line:
+            body.append(line)
+            continue
+        cue = _make_cue(
+            parse_timestamp_ms(timing.group("start")),
+            parse_timestamp_ms(timing.group("end")),
+            "\n".join(body),
+        )
+        timing, body = None, []
+        if cue is not None:
+            yield cue
+    if timing is not None:
+        cue = _make_cue(
+            parse_timestamp_ms(timing.group("start")),
+            parse_timestamp_ms(timing.group("end")),
+            "\n".join(body),
+        )
+        if cue is not None:
+            yield cue
+
+
+def iter_srv3_cues(handle: IO) -> Iterator[Cue]:
+    """Yield cues from YouTube SRV3 (timedtext format 3) XML."""
+    for _event, elem in ET.iterparse(handle, events=("end",)):
+        if elem.tag != "p":
+            continue
+        start_ms = int(elem.get("t") or 0)
+        duration_ms = int(elem.get("d") or 0)
+        text = "".join(elem.itertext())
+        elem.clear()
+        cue = _make_cue(start_ms, start_ms + duration_ms, text)
+        if cue is not None:
+            yield cue
+
+
+def _iter_json_array_items(handle: IO, key: str) -> Iterator[dict]:
+    """Decode the objects of the top-level ``key`` array one by one."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, eof
+        if eof:
+            return False
+        chunk = handle.read(_JSON_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            return False
+        buffer += chunk
+        return True
+
+    marker = f'"{key}"'
+    while True:
+        index = buffer.find(marker)
+        if index >= 0:
+            buffer = buffer[index + len(marker):]
+            break
+        buffer = buffer[-len(marker):]
+        if not fill():
+            return
+    while True:
+        stripped = buffer.lstrip(" \t\r\n:")
+        if stripped.startswith("["):
+            buffer = stripped[1:]
+            break
+        if stripped:
+            return
+        buffer = ""
+        if not fill():
+            return
+    position = 0
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position >= len(buffer):
+            buffer, position = "", 0
+            if not fill():
+                return
+            continue
+        if buffer[position] == "]":
+            return
+        try:
+            item, position = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            buffer, position = buffer[position:], 0
+            if not fill():
+                return
+            continue
+        if isinstance(item, dict):
+            yield item
+
+
+def iter_json3_cues(handle: IO) -> Iterator[Cue]:
+    """Yield cues from YouTube JSON3 timedtext without loading the whole document."""
+    for event in _iter_json_array_items(handle, "events"):
+        segs = event.get("segs")
+        if not segs:
+            continue
+        start_ms = int(event.get("tStartMs") or 0)
+        duration_ms = int(event.get("dDurationMs") or 0)
+        text = "".join(str(seg.get("utf8") or "") for seg in segs if isinstance(seg, dict))
+        cue = _make_cue(start_ms, start_ms + duration_ms, text)
+        if cue is not None:
+            yield cue
+
+
+def collapse_rolling_cues(cues: Iterable[Cue]) -> Iterator[Cue]:
+    """Fold rolling auto-caption cues so each spoken line is emitted once.
+
+    Leading lines that repeat the tail of the previous cue are dropped, a line
+    that only grows the pending one word by word replaces it, and identical
+    text just extends the pending cue's end time. Only one cue is held back.
+    """
+    pending: Cue | None = None
+    previous_lines: list[str] = []
+    for cue in cues:
+        lines = cue.text.split("\n")
+        overlap = _line_overlap(previous_lines, lines)
+        previous_lines = lines
+        new_lines = lines[overlap:]
+        if not new_lines:
+            if pending is not None:
+                pending.end_ms = max(pending.end_ms, cue.end_ms)
+            continue
+        text = "\n".join(new_lines)
+        if pending is not None:
+            if text == pending.text:
+                pending.end_ms = max(pending.end_ms, cue.end_ms)
+                continue
+            if text.startswith(pending.text + " "):
+                pending.text = text
+                pending.end_ms = max(pending.end_ms, cue.end_ms)
+                continue
+            if cue.start_ms > pending.start_ms:
+                pending.end_ms = min(pending.end_ms, cue.start_ms)
+            yield pending
+        pending = Cue(start_ms=cue.start_ms, end_ms=cue.end_ms, text=text)
+    if pending is not None:
+        yield pending
+
+
+def _line_overlap(previous: list[str], current: list[str]) -> int:
+    for size in range(min(len(previous), len(current)), 0, -1):
+        if previous[-size:] == current[:size]:
+            return size
+    return 0
+
+
+def write_srt(cues: Iterable[Cue], out: IO) -> int:
+    count = 0
+    for count, cue in enumerate(cues, start=1):
+        if count > 1:
+            out.write("\n")
+        out.write(
+            f"{count}\n{format_srt_timestamp(cue.start_ms)} --> {format_srt_timestamp(cue.end_ms)}\n{cue.text}\n"
+        )
+    return count
+
+
+def write_text(cues: Iterable[Cue], out: IO) -> int:
+    count = 0
+    for count, cue in enumerate(cues, start=1):
+        out.write(f"{cue.text}\n")
+    return count
+
+
+def parse_cues(text: str) -> list[Cue]:
+    """Parse WebVTT or SRT text into cues with markup stripped."""
+    return list(iter_vtt_cues(text.splitlines()))
+
+
+def cues_to_srt(cues: Iterable[Cue]) -> str:
+    lines: list[str] = []
+    write_srt(cues, _ListWriter(lines))
+    return "".join(lines)
+
+
+def cues_to_text(cues: Iterable[Cue]) -> str:
+    return "".join(f"{cue.text}\n" for cue in cues)
+
+
+class _ListWriter:
+    def __init__(self, parts: list[str]) -> None:
+        self.write = parts.append
+
+
+def detect_subtitle_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext in SUBTITLE_INPUT_FORMATS:
+        return ext
+    if ext in ("xml", "ttml"):
+        return "srv3"
+    with open(path, encoding="utf-8-sig", errors="replace") as handle:
+        head = handle.read(256).lstrip()
+    if head.startswith("{"):
+        return "json3"
+    if head.startswith("<"):
+        return "srv3"
+    return "vtt"
+
+
+def iter_subtitle_file_cues(handle: IO, input_format: str) -> Iterator[Cue]:
+    if input_format == "json3":
+        return iter_json3_cues(handle)
+    if input_format == "srv3":
+        return iter_srv3_cues(handle)
+    return iter_vtt_cues(handle)
+
+
+def convert_subtitle_file(
+    path: str,
+    output_format: str,
+    *,
+    remove_source: bool = False,
+    collapse_rolling: bool = False,
+) -> str:
+    """Stream ``path`` into ``output_format`` next to it and return the new path.
+
+    ``collapse_rolling`` is for automatic captions only: on manual subtitles it
+    would drop deliberately repeated lines and lines shared by adjacent cues.
+    """
+    if output_format not in SUBTITLE_OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported subtitle format: {output_format}")
+    input_format = detect_subtitle_format(path)
+    base, ext = os.path.splitext(path)
+    target = f"{base}.{output_format}"
+    if ext.lower() == f".{output_format}":
+        target = f"{base}.converted.{output_format}"
+    binary = input_format == "srv3"
+    with open(path, "rb") if binary else open(path, encoding="utf-8-sig", errors="replace") as source:
+        cues = iter_subtitle_file_cues(source, input_format)
+        if collapse_rolling:
+            cues = collapse_rolling_cues(cues)
+        with open(target, "w", encoding="utf-8") as out:
+            if output_format == "srt":
+                write_srt(cues, out)
+            else:
+                write_text(cues, out)
+    if remove_source:
+        final = f"{base}.{output_format}"
+        if target != final:
+            os.replace(target, final)
+            return final
+        os.remove(path)
+    return target
@@ -0,0 +1,129 @@
+"""Structured timing spans and counters for fetch/download stages."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+import json
+import threading
+import time
+
+SpanSink = Callable[[str], None]
+
+
+@dataclass
+class StageStats:
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, duration: float, failed: bool) -> None:
+        self.count += 1
+        self.errors += int(failed)
+        self.total_seconds += duration
+        self.max_seconds = max(self.max_seconds, duration)
+
+
+@dataclass
+class SpanRecord:
+    name: str
+    started_at: float
+    duration: float
+    attrs: dict = field(default_factory=dict)
+    error: str | None = None
+
+    def to_json(self) -> str:
+        payload = {
+            "span": self.name,
+            "ts": round(self.started_at, 3),
+            "duration_ms": round(self.duration * 1000, 1),
+            **self.attrs,
+        }
+        if self.error:
+            payload["error"] = self.error
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class Telemetry:
+    def __init__(self, *, sink: SpanSink | None = None, max_recent: int = 200) -> None:
+        self.sink = sink
+        self.recent: deque[SpanRecord] = deque(maxlen=max_recent)
+        self._stages: dict[str, StageStats] = {}
+        self._counters: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[dict]:
+        """Time a block; the yielded dict can be updated with extra attributes."""
+        started_at = time.time()
+        started = time.perf_counter()
+        error: str | None = None
+        try:
+            yield attrs
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            self.record(name, time.perf_counter() - started, started_at=started_at, error=error, **attrs)
+
+    def record(
+        self,
+        name: str,
+        duration: float,
+        *,
+        started_at: float | None = None,
+        error: str | None = None,
+        **attrs,
+    ) -> SpanRecord:
+        record = SpanRecord(
+            name=name,
+            started_at=started_at if started_at is not None else time.time() - duration,
+            duration=duration,
+            attrs=attrs,
+            error=error,
+        )
+        with self._lock:
+            self._stages.setdefault(name, StageStats()).add(duration, bool(error))
+            self.recent.append(record)
+        if self.sink is not None:
+            self.sink(record.to_json())
+        return record
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counters(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def stages(self) -> dict[str, StageStats]:
+        with self._lock:
+            return {name: StageStats(**vars(stats)) for name, stats in self._stages.items()}
+
+    def summary_lines(self) -> list[str]:
+        stages = self.stages()
+        counters = self.counters()
+        if not stages and not counters:
+            return ["no timings recorded"]
+        lines: list[str] = []
+        for name, stats in sorted(stages.items(), key=lambda item: item[1].total_seconds, reverse=True):
+            average_ms = stats.total_seconds / stats.count * 1000
+            errors = f", {stats.errors} failed" if stats.errors else ""
+            lines.append(
+                f"{name}: {stats.count}x avg {average_ms:.0f} ms, "
+                f"max {stats.max_seconds * 1000:.0f} ms, total {stats.total_seconds:.1f} s{errors}"
+            )
+        for name, value in sorted(counters.items()):
+            lines.append(f"{name} = {value:,.0f}")
+        return lines
+
+
+def maybe_span(telemetry: Telemetry | None, name: str, **attrs):
+    """``telemetry.span`` when telemetry is configured, otherwise a no-op context."""
+    if telemetry is None:
+        return nullcontext(attrs)
+    return telemetry.span(name, **attrs)
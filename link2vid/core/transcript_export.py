@@ -0,0 +1,99 @@
+"""Bulk transcript export over fetched entries."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable
+import os
+
+from .errors import NoTranscriptAvailableError
+from .subtitles import SUBTITLE_OUTPUT_FORMATS, convert_subtitle_file
+
+TRANSCRIPT_EXPORT_FORMATS = (*SUBTITLE_OUTPUT_FORMATS, "original")
+# The id keeps two videos with the same title from overwriting each other's file.
+TRANSCRIPT_OUTTMPL = "%(title)s [%(id)s].transcript.%(ext)s"
+
+
+@dataclass
+class TranscriptExportItem:
+    title: str
+    url: str
+    status: str
+    path: str | None = None
+    error: str | None = None
+
+
+def has_transcript_metadata(entry: dict) -> bool:
+    return "subtitles" in entry or "automatic_captions" in entry
+
+
+def exportable_entries(entries: list[dict]) -> list[dict]:
+    """Entries yt-dlp can fetch transcripts for; direct media (ffmpeg) entries have none."""
+    return [
+        entry
+        for entry in entries
+        if isinstance(entry, dict) and entry.get("webpage_url") and "_ffmpeg_headers" not in entry
+    ]
+
+
+def export_transcripts(
+    download_transcript: Callable[..., object],
+    entries: list[dict],
+    folder: str,
+    *,
+    output_format: str = "srt",
+    max_workers: int = 4,
+    on_item: Callable[[TranscriptExportItem, int, int], None] | None = None,
+    log: Callable[[str], None] | None = None,
+) -> list[TranscriptExportItem]:
+    """Download and convert one transcript per entry with bounded parallelism.
+
+    ``download_transcript`` is ``DownloadManager.download_transcript``; entries
+    that already carry subtitle metadata are passed as ``info`` so no
+    re-extraction happens. ``on_item`` is called from worker threads with
+    ``(item, done, total)``.
+    """
+    if output_format not in TRANSCRIPT_EXPORT_FORMATS:
+        raise ValueError(f"Unsupported transcript format: {output_format}")
+    logger = log or (lambda _msg: None)
+    selected = exportable_entries(entries)
+    outtmpl = os.path.join(folder, TRANSCRIPT_OUTTMPL)
+
+    def export_one(entry: dict) -> TranscriptExportItem:
+        url = str(entry["webpage_url"])
+        title = str(entry.get("title") or url)
+        info = entry if has_transcript_metadata(entry) else None
+        try:
+            result = download_transcript(url, outtmpl, info=info)
+        except NoTranscriptAvailableError as exc:
+            return TranscriptExportItem(title=title, url=url, status="unavailable", error=str(exc))
+        except Exception as exc:
+            return TranscriptExportItem(title=title, url=url, status="failed", error=str(exc))
+        path = getattr(result, "path", None)
+        if path and output_format != "original":
+            try:
+                path = convert_subtitle_file(
+                    path,
+                    output_format,
+                    remove_source=True,
+                    collapse_rolling=getattr(result, "source", None) == "automatic captions",
+                )
+            except Exception as exc:
+                logger(f"[transcripts] Conversion failed for {title}: {exc}")
+        return TranscriptExportItem(title=title, url=url, status="saved", path=path)
+
+    items: list[TranscriptExportItem] = []
+    total = len(selected)
+    if not total:
+        return items
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total)), thread_name_prefix="link2vid-transcripts") as pool:
+        futures = [pool.submit(export_one, entry) for entry in selected]
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = future.result()
+            items.append(item)
+            if on_item is not None:
+                on_item(item, done, total)
+    saved = sum(1 for item in items if item.status == "saved")
+    logger(f"[transcripts] Exported {saved}/{total} transcript(s) as {output_format}.")
+    return items
@@ -0,0 +1,168 @@
+"""Background integrity checks for finished downloads (ffprobe + sha256)."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+import hashlib
+import json
+import os
+import subprocess
+
+from .archive import DownloadArchive
+from .telemetry import Telemetry, maybe_span
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class VerificationResult:
+    path: str
+    ok: bool
+    size: int | None = None
+    sha256: str | None = None
+    duration: float | None = None
+    streams: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+def sha256_file(path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while chunk := handle.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def probe_streams(path: str, ffprobe: str = "ffprobe") -> tuple[float | None, list[str]]:
+    """Container duration and the codec types of its streams, via ffprobe."""
+    proc = subprocess.run(
+        [
+            ffprobe,
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration:stream=codec_type",
+            "-of",
+            "json",
+            path,
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if proc.returncode != 0:
+        message = (proc.stderr or "").strip().splitlines()
+        raise RuntimeError(message[-1] if message else f"ffprobe exited with {proc.returncode}")
+    payload = json.loads(proc.stdout or "{}")
+    streams = [str(stream.get("codec_type")) for stream in payload.get("streams") or [] if stream.get("codec_type")]
+    try:
+        duration = float((payload.get("format") or {}).get("duration"))
+    except (TypeError, ValueError):
+        duration = None
+    return duration, streams
+
+
+def verify_media_file(
+    path: str,
+    *,
+    ffprobe: str | None = None,
+    expected_duration: float | None = None,
+    telemetry: Telemetry | None = None,
+) -> VerificationResult:
+    """Hash ``path`` and, when ffprobe is available, check it has media streams.
+
+    A file is rejected when it is empty, has no audio/video stream, or is more
+    than 5% (and at least 3 s) shorter than ``expected_duration``.
+    """
+    with maybe_span(telemetry, "verify.download") as span:
+        try:
+            size = os.path.getsize(path)
+        except OSError as exc:
+            return VerificationResult(path=path, ok=False, error=str(exc))
+        span["bytes"] = size
+        result = VerificationResult(path=path, ok=size > 0, size=size)
+        if not size:
+            result.error = "file is empty"
+            return result
+        try:
+            result.sha256 = sha256_file(path)
+        except OSError as exc:
+            result.ok = False
+            result.error = f"hash failed: {exc}"
+            return result
+        if not ffprobe:
+            return result
+        try:
+            result.duration, result.streams = probe_streams(path, ffprobe)
+        except Exception as exc:
+            result.ok = False
+            result.error = f"ffprobe: {exc}"
+            return result
+        if not {"video", "audio"} & set(result.streams):
+            result.ok = False
+            result.error = "no audio or video streams"
+        elif expected_duration and result.duration is not None:
+            shortfall = expected_duration - result.duration
+            if shortfall > max(3.0, expected_duration * 0.05):
+                result.ok = False
+                result.error = f"duration {result.duration:.0f}s, expected about {expected_duration:.0f}s"
+        span["ok"] = result.ok
+        return result
+
+
+class DownloadVerifier:
+    """Runs ``verify_media_file`` on a small pool and stores results in the archive."""
+
+    def __init__(
+        self,
+        archive: DownloadArchive,
+        *,
+        get_ffprobe: Callable[[], str | None] | None = None,
+        max_workers: int = 2,
+        telemetry: Telemetry | None = None,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self.archive = archive
+        self.get_ffprobe = get_ffprobe or (lambda: None)
+        self.telemetry = telemetry
+        self.log = log or (lambda _msg: None)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="link2vid-verify")
+
+    def submit(
+        self,
+        path: str,
+        keys: list[str],
+        format_id: str,
+        *,
+        expected_duration: float | None = None,
+        on_result: Callable[[VerificationResult], None] | None = None,
+    ) -> Future:
+        def run() -> VerificationResult:
+            result = verify_media_file(
+                path,
+                ffprobe=self.get_ffprobe(),
+                expected_duration=expected_duration,
+                telemetry=self.telemetry,
+            )
+            self.archive.record_verification(
+                keys,
+                format_id,
+                ok=result.ok,
+                sha256=result.sha256,
+                duration=result.duration,
+                error=result.error,
+            )
+            if result.ok:
+                self.log(f"[verify] OK: {path} (sha256 {result.sha256[:12] if result.sha256 else 'n/a'})")
+            else:
+                self.log(f"[verify] FAILED: {path}: {result.error}")
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        return self._pool.submit(run)
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -2,13 +2,68 @@
 
 from __future__ import annotations
 
+from collections import deque
+from dataclasses import dataclass
+
 import customtkinter as ctk
 
 
+@dataclass
+class LogBatch:
+    text: str
+    replace: bool = False
+    trim_lines: int = 0
+
+
+class LogBuffer:
+    """Ring buffer of log lines plus the lines not yet shown in the widget.
+
+    ``take_batch`` returns what the textbox needs to catch up in one insert:
+    either the new lines (and how many old lines to trim from the top), or a
+    full replacement when more lines arrived than the widget may hold.
+    """
+
+    def __init__(self, max_lines: int = 500) -> None:
+        self.max_lines = max_lines
+        self.lines: deque[str] = deque(maxlen=max_lines)
+        self._pending: deque[str] = deque(maxlen=max_lines)
+        self._visible = 0
+        self._stale = True
+
+    def append(self, line: str) -> None:
+        if len(self._pending) == self.max_lines:
+            self._stale = True
+        self.lines.append(line)
+        self._pending.append(line)
+
+    def take_batch(self) -> LogBatch | None:
+        if self._stale:
+            self._stale = False
+            self._pending.clear()
+            self._visible = len(self.lines)
+            return LogBatch(text=_join_lines(self.lines), replace=True)
+        if not self._pending:
+            return None
+        lines = list(self._pending)
+        self._pending.clear()
+        self._visible += len(lines)
+        trim = max(0, self._visible - self.max_lines)
+        self._visible -= trim
+        return LogBatch(text=_join_lines(lines), trim_lines=trim)
+
+
+def _join_lines(lines) -> str:
+    return "".join(f"{line}\n" for line in lines)
+
+
 class LogDrawer(ctk.CTkFrame):
-    def __init__(self, master, collapsed: bool = True, **kwargs) -> None:
+    FLUSH_DELAY_MS = 100
+
+    def __init__(self, master, collapsed: bool = True, max_lines: int = 500, **kwargs) -> None:
         super().__init__(master, **kwargs)
         self.expanded = not collapsed
+        self.buffer = LogBuffer(max_lines)
+        self._flush_job = None
 
         header = ctk.CTkFrame(self, fg_color="transparent")
         header.grid(row=0, column=0, sticky="ew", padx=12, pady=(8, 0))
@@ -42,14 +97,31 @@ class LogDrawer(ctk.CTkFrame):
         self.expanded = True
         self.textbox.grid()
         self.toggle_button.configure(text="Hide logs")
+        self._flush()
 
     def collapse(self) -> None:
         self.expanded = False
         self.textbox.grid_remove()
         self.toggle_button.configure(text="Show logs")
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
 
     def append(self, message: str) -> None:
+        self.buffer.append(message)
+        if self.expanded and self._flush_job is None:
+            self._flush_job = self.after(self.FLUSH_DELAY_MS, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_job = None
+        batch = self.buffer.take_batch()
+        if batch is None:
+            return
         self.textbox.configure(state="normal")
-        self.textbox.insert("end", message + "\n")
+        if batch.replace:
+            self.textbox.delete("1.0", "end")
+        self.textbox.insert("end", batch.text)
+        if batch.trim_lines:
+            self.textbox.delete("1.0", f"{batch.trim_lines + 1}.0")
         self.textbox.see("end")
         self.textbox.configure(state="disabled")
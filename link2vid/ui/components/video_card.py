@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import Callable, Sequence
 
 import customtkinter as ctk
@@ -9,6 +10,7 @@ import customtkinter as ctk
 FormatOption = tuple[str, str]
 OnDownload = Callable[["VideoCard", str], None]
 OnTranscript = Callable[["VideoCard", object | None], None]
+OnCancel = Callable[["VideoCard"], None]
 
 STATUS_COLORS = {
     "ready": ("#6b7280", "#9ca3af"),
@@ -26,6 +28,36 @@ def _default_format_options() -> list[FormatOption]:
     ]
 
 
+class TranscriptIndex:
+    """Lowercased, prefix-sorted view of a card's transcript options.
+
+    Built once per card; ``match`` returns option indices with prefix matches
+    (found by bisection) ahead of substring matches, both in option order.
+    """
+
+    def __init__(self, options: Sequence[tuple[str, object | None]]) -> None:
+        self.keys = [getattr(value, "search_key", "") or label.lower() for label, value in options]
+        self._sorted = sorted((key, index) for index, key in enumerate(self.keys))
+
+    def match(self, query: str) -> list[int]:
+        lowered = query.strip().lower()
+        if not lowered:
+            return list(range(len(self.keys)))
+        starts: list[int] = []
+        position = bisect_left(self._sorted, (lowered, -1))
+        while position < len(self._sorted) and self._sorted[position][0].startswith(lowered):
+            starts.append(self._sorted[position][1])
+            position += 1
+        starts.sort()
+        prefixed = set(starts)
+        contains = [
+            index
+            for index, key in enumerate(self.keys)
+            if index not in prefixed and lowered in key
+        ]
+        return [*starts, *contains]
+
+
 class VideoCard(ctk.CTkFrame):
     def __init__(
         self,
@@ -36,11 +68,13 @@ class VideoCard(ctk.CTkFrame):
         transcript_options: Sequence[object] | None = None,
         on_download: OnDownload | None = None,
         on_transcript: OnTranscript | None = None,
+        on_cancel: OnCancel | None = None,
         **kwargs,
     ) -> None:
         super().__init__(master, **kwargs)
         self.on_download = on_download
         self.on_transcript = on_transcript
+        self.on_cancel = on_cancel
         self.title_text = title
         self.selected_format = ""
         self.selected_transcript = None
@@ -111,6 +145,7 @@ class VideoCard(ctk.CTkFrame):
 
         self.transcript_options, self.transcript_available = self._normalize_transcript_options(transcript_options)
         self.transcript_map = {label: value for label, value in self.transcript_options}
+        self.transcript_index = TranscriptIndex(self.transcript_options)
         self.transcript_button_label = ctk.CTkButton(
             action_frame,
             text=self.transcript_options[0][0],
@@ -124,6 +159,17 @@ class VideoCard(ctk.CTkFrame):
         self.download_button = ctk.CTkButton(action_frame, text="Download", command=self._handle_download)
         self.download_button.grid(row=2, column=0, pady=(8, 0), sticky="ew")
 
+        # Takes the Download button's slot while a cancellable download runs.
+        self.cancel_button = ctk.CTkButton(
+            action_frame,
+            text="Cancel",
+            command=self._handle_cancel,
+            fg_color="#7f1d1d",
+            hover_color="#991b1b",
+        )
+        self.cancel_button.grid(row=2, column=0, pady=(8, 0), sticky="ew")
+        self.cancel_button.grid_remove()
+
         self.transcript_button = ctk.CTkButton(
             action_frame,
             text="Transcript",
@@ -211,54 +257,45 @@ class VideoCard(ctk.CTkFrame):
             self._on_transcript_change(label)
             top.destroy()
 
-        visible_labels: list[str] = []
+        buttons = [
+            ctk.CTkButton(
+                list_frame,
+                text=label,
+                anchor="w",
+                command=lambda selected_label=label: select(selected_label),
+                fg_color="#1f2937" if value == self.selected_transcript else "#334155",
+                hover_color="#475569",
+            )
+            for label, value in self.transcript_options
+        ]
+        empty_label = ctk.CTkLabel(list_frame, text="No matching languages", anchor="w")
+        visible: list[int] = []
 
         def render(filter_text: str = "") -> None:
-            visible_labels.clear()
-            for child in list_frame.winfo_children():
-                child.destroy()
-            lowered = filter_text.strip().lower()
-            if lowered:
-                starts = [
-                    (label, value)
-                    for label, value in self.transcript_options
-                    if label.lower().startswith(lowered)
-                ]
-                contains = [
-                    (label, value)
-                    for label, value in self.transcript_options
-                    if lowered in label.lower() and not label.lower().startswith(lowered)
-                ]
-                rows = [*starts, *contains]
-            else:
-                rows = list(self.transcript_options)
-            visible_labels.extend(label for label, _value in rows)
-            if not rows:
-                ctk.CTkLabel(list_frame, text="No matching languages", anchor="w").grid(
-                    row=0,
-                    column=0,
-                    sticky="ew",
-                    padx=4,
-                    pady=4,
-                )
+            matches = self.transcript_index.match(filter_text)
+            if matches == visible:
                 return
-            for index, (label, _value) in enumerate(rows):
-                button = ctk.CTkButton(
-                    list_frame,
-                    text=label,
-                    anchor="w",
-                    command=lambda selected_label=label: select(selected_label),
-                    fg_color="#1f2937" if self.transcript_map[label] == self.selected_transcript else "#334155",
-                    hover_color="#475569",
-                )
-                button.grid(row=index, column=0, sticky="ew", padx=4, pady=3)
+            keep = set(matches)
+            for index in visible:
+                if index not in keep:
+                    buttons[index].grid_remove()
+            for row, index in enumerate(matches):
+                buttons[index].grid(row=row, column=0, sticky="ew", padx=4, pady=3)
+            visible[:] = matches
+            if matches:
+                empty_label.grid_remove()
+            else:
+                empty_label.grid(row=0, column=0, sticky="ew", padx=4, pady=4)
 
         def on_search(_event=None) -> None:
             render(search.get())
 
         search.bind("<KeyRelease>", on_search)
         top.bind("<Escape>", lambda _event: top.destroy())
-        top.bind("<Return>", lambda _event: select(visible_labels[0]) if visible_labels else None)
+        top.bind(
+            "<Return>",
+            lambda _event: select(self.transcript_options[visible[0]][0]) if visible else None,
+        )
         render()
         search.focus_set()
 
@@ -266,6 +303,20 @@ class VideoCard(ctk.CTkFrame):
         if self.on_download:
             self.on_download(self, self.selected_format)
 
+    def _handle_cancel(self) -> None:
+        if self.on_cancel:
+            self.cancel_button.configure(state="disabled")
+            self.on_cancel(self)
+
+    def set_cancellable(self, cancellable: bool) -> None:
+        if cancellable and self.on_cancel:
+            self.download_button.grid_remove()
+            self.cancel_button.configure(state="normal")
+            self.cancel_button.grid()
+        else:
+            self.cancel_button.grid_remove()
+            self.download_button.grid()
+
     def _handle_transcript(self) -> None:
         if self.on_transcript:
             self.on_transcript(self, self.selected_transcript)
@@ -1,10 +1,10 @@
 import customtkinter as ctk
 from tkinter import TclError, filedialog, messagebox, simpledialog
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 import threading
 import queue
 import os
-import shutil
 import json
 import time
 import sys
@@ -12,12 +12,20 @@ import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
+from ..core.archive import ARCHIVE_FILENAME, DownloadArchive, archive_keys
+from ..core.async_engine import AsyncEngine
+from ..core.bandwidth import governor_from_config
+from ..core.batch_fetch import fetch_batch, parse_url_list
+from ..core.cancellation import CancelToken
 from ..core.dev_defaults import dev_credentials_for_url, dev_domain_for_url, resolve_login_plan
+from ..core.environment import EnvironmentProbe
+from ..core.folder_index import FolderIndex
+from ..core.hls import HLS_BEST_FORMAT, hls_format_options, parse_hls_format
 from ..core import (
     CookiesRequiredError,
     DirectHlsFound,
+    DownloadCancelledError,
     DownloadManager,
     NoTranscriptAvailableError,
     FetchError,
@@ -34,11 +42,18 @@ from ..core import (
     normalize_url,
     sanitize_filename,
     unique_output_path,
-    selenium_fetch_media_entries,
     url_from_clipboard_text,
 )
-from ..core.extractors import build_media_entries, title_from_page_url
+from ..core.extractors import hls_result_entries
+from ..core.log_writer import BufferedLogWriter
+from ..core.runtime import user_data_dir
+from ..core.site_profiles import SITE_PROFILES_FILENAME, STRATEGY_SELENIUM, SiteProfileStore
+from ..core.subtitles import SUBTITLE_OUTPUT_FORMATS, convert_subtitle_file
+from ..core.telemetry import Telemetry
+from ..core.transcript_export import export_transcripts, exportable_entries
+from ..core.verification import DownloadVerifier
 from .components import FooterBar, LogDrawer, VideoCard
+from .placeholders import PlaceholderCache
 from .thumbnail_loader import ThumbnailLoader
 
 ctk.set_appearance_mode("dark")
@@ -110,9 +125,13 @@ class VideoDownloaderApp:
         self.dev_defaults = self.load_dev_defaults()
         self.main_thread_id = threading.get_ident()
         self.ui_queue = queue.Queue()
-        self.log_history = []
         self.log_max = 200
+        self.log_history = deque(maxlen=self.log_max)
         self.debug_log_path = self._default_debug_log_path()
+        self.debug_log_writer = BufferedLogWriter(self.debug_log_path)
+        self.telemetry_path = str(Path(self.debug_log_path).with_name("link2vid-telemetry.jsonl"))
+        self.telemetry_writer = BufferedLogWriter(self.telemetry_path)
+        self.telemetry = Telemetry(sink=self.telemetry_writer.write)
         self.last_error = None
         self.last_error_reason = None
         self.last_action_kind = None
@@ -126,6 +145,16 @@ class VideoDownloaderApp:
         self.executor = ThreadPoolExecutor(max_workers=4)
         self.fetch_future = None
         self.is_fetching = False
+        self.is_exporting_transcripts = False
+        self.transcript_export_formats = {"SRT": "srt", "Plain text": "txt", "Original": "original"}
+        self.speed_limits = {
+            "No speed limit": None,
+            "10 MB/s": 10 * 1024 * 1024,
+            "5 MB/s": 5 * 1024 * 1024,
+            "2 MB/s": 2 * 1024 * 1024,
+            "1 MB/s": 1024 * 1024,
+            "500 KB/s": 500 * 1024,
+        }
         self.batch_size = 20
         self.rendered_count = 0
         self.thumbnail_size = (120, 72)
@@ -135,11 +164,35 @@ class VideoDownloaderApp:
             "site_c": ("Media", ("#4b5563", "#f59e0b")),
             "default": ("Video", ("#4b5563", "#9ca3af")),
         }
-        self.placeholder_cache = {}
-        self.placeholder_font = None
+        self.placeholder_cache = PlaceholderCache(
+            self.thumbnail_styles,
+            make_image=lambda image, size: ctk.CTkImage(light_image=image, dark_image=image, size=size),
+            get_theme=ctk.get_appearance_mode,
+        )
         self.busy_cards = set()
+        self.cancel_tokens = {}
+        self.folder_indexes = {}
+        self.folder_indexes_lock = threading.Lock()
         self.output_path = self.get_default_output_path()
         self.cookies_path = None
+        self.ffmpeg_path = None
+        self.ffmpeg_available = False
+        self.js_runtimes = []
+        self.js_runtime_available = False
+        self.environment_snapshot = None
+        self.environment = EnvironmentProbe(log=self.log)
+        self.download_archive = DownloadArchive(user_data_dir() / ARCHIVE_FILENAME, log=self.log)
+        self.site_profiles = SiteProfileStore(user_data_dir() / SITE_PROFILES_FILENAME, log=self.log)
+        self.download_verifier = None
+        if self.dev_defaults.get("verify_downloads"):
+            self.download_verifier = DownloadVerifier(
+                self.download_archive,
+                get_ffprobe=lambda: self.environment.which("ffprobe"),
+                telemetry=self.telemetry,
+                log=self.log,
+            )
+        self.bandwidth = governor_from_config(self.dev_defaults)
+        self.async_engine = AsyncEngine(log=self.log)
         self.ydl_logger = YtDlpLogger(self)
         self.download_manager = DownloadManager(
             ydl_logger=self.ydl_logger,
@@ -147,13 +200,31 @@ class VideoDownloaderApp:
             log_error=self.log_error,
             dev_defaults=self.dev_defaults,
             get_cookies_path=lambda: self.cookies_path,
+            environment=self.environment,
+            telemetry=self.telemetry,
+            bandwidth=self.bandwidth,
+            site_profiles=self.site_profiles,
         )
         self.fetcher = VideoFetcher(
             get_video_info=self.download_manager.get_video_info,
             log=self.log,
             dev_defaults=self.dev_defaults,
+            telemetry=self.telemetry,
+            site_profiles=self.site_profiles,
+            cookie_source=self.download_manager.cookie_source,
+            engine=self.async_engine,
+        )
+        self.thumbnail_loader = ThumbnailLoader(
+            self.executor,
+            log=self.log,
+            bandwidth=self.bandwidth,
+            engine=self.async_engine,
+        )
+        self.executor.submit(
+            self.placeholder_cache.prewarm,
+            self.thumbnail_size,
+            ctk.get_appearance_mode(),
         )
-        self.thumbnail_loader = ThumbnailLoader(self.executor, log=self.log)
 
         font_big = ("Arial", 22)
         font_med = ("Arial", 16)
@@ -171,7 +242,7 @@ class VideoDownloaderApp:
         self.url_entry = ctk.CTkEntry(
             action_bar,
             font=font_med,
-            placeholder_text="Paste a video or playlist URL…",
+            placeholder_text="Paste a video or playlist URL (or several)…",
         )
         self.url_entry.pack(side="left", fill="x", expand=True, padx=(0, 12), pady=10)
         self.url_entry.bind('<KeyRelease>', self.update_button_states)
@@ -186,6 +257,46 @@ class VideoDownloaderApp:
             state="disabled",
         )
         self.fetch_btn.pack(side="right", padx=(0, 10))
+        self.load_list_btn = ctk.CTkButton(
+            action_bar,
+            text='Load list…',
+            command=self.load_url_list,
+            font=font_med,
+            height=36,
+            width=120,
+        )
+        self.load_list_btn.pack(side="right", padx=(0, 10))
+
+        bulk_bar = ctk.CTkFrame(main_frame, fg_color="transparent")
+        bulk_bar.pack(fill="x", pady=(0, 8))
+        self.export_transcripts_btn = ctk.CTkButton(
+            bulk_bar,
+            text="Export all transcripts",
+            command=self.export_all_transcripts,
+            height=30,
+            width=180,
+            state="disabled",
+        )
+        self.export_transcripts_btn.pack(side="right")
+        self.transcript_format_var = ctk.StringVar(value="SRT")
+        ctk.CTkOptionMenu(
+            bulk_bar,
+            values=list(self.transcript_export_formats),
+            variable=self.transcript_format_var,
+            width=120,
+        ).pack(side="right", padx=(0, 8))
+        configured_limit = self.bandwidth.global_limit
+        if configured_limit and configured_limit not in self.speed_limits.values():
+            self.speed_limits[f"{configured_limit / 1024:,.0f} KB/s"] = configured_limit
+        speed_label = next(label for label, bps in self.speed_limits.items() if bps == configured_limit)
+        self.speed_limit_var = ctk.StringVar(value=speed_label)
+        ctk.CTkOptionMenu(
+            bulk_bar,
+            values=list(self.speed_limits),
+            variable=self.speed_limit_var,
+            command=self.set_speed_limit,
+            width=140,
+        ).pack(side="left")
 
         results_frame = ctk.CTkFrame(main_frame)
         results_frame.pack(fill="both", expand=True, pady=(0, 16))
@@ -243,9 +354,10 @@ class VideoDownloaderApp:
         self.root.after(100, self.process_ui_queue)
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.update_button_states()
-        self.log(f"yt-dlp version: {get_yt_dlp_version()}")
-        self.check_ffmpeg()
-        self.check_js_runtime()
+        # Reading the version imports yt-dlp; do it off the UI thread so the window appears first.
+        self.executor.submit(lambda: self.log(f"yt-dlp version: {get_yt_dlp_version()}"))
+        self.environment.subscribe(lambda snapshot: self.ui_queue.put(("environment", snapshot)))
+        self.environment.start()
         self.log("Tip: Link2Vid tries browser cookies automatically for auth-like failures before asking for cookies.txt.")
 
     def _populate_url_from_clipboard_if_valid(self) -> None:
@@ -267,8 +379,6 @@ class VideoDownloaderApp:
         if not message:
             return
         self.log_history.append(message)
-        if len(self.log_history) > self.log_max:
-            self.log_history = self.log_history[-self.log_max:]
         self._append_debug_log(message)
         if hasattr(self, "log_drawer"):
             self.log_drawer.append(message)
@@ -279,12 +389,8 @@ class VideoDownloaderApp:
         return str(parent / "link2vid-debug.log")
 
     def _append_debug_log(self, message: str) -> None:
-        try:
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
-            with open(self.debug_log_path, "a", encoding="utf-8") as log_file:
-                log_file.write(f"{timestamp} {message}\n")
-        except Exception:
-            return
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+        self.debug_log_writer.write(f"{timestamp} {message}")
 
     def log(self, message):
         if threading.get_ident() != self.main_thread_id:
@@ -362,6 +468,7 @@ class VideoDownloaderApp:
                 elif action == "results":
                     self.video_entries = payload
                     self.populate_cards()
+                    self.update_bulk_transcript_button()
                 elif action == "results_state":
                     self.set_results_state(payload)
                 elif action == "card_status":
@@ -373,9 +480,14 @@ class VideoDownloaderApp:
                 elif action == "card_busy":
                     card, busy = payload
                     self._set_card_busy(card, busy)
+                elif action == "environment":
+                    self.apply_environment(payload)
                 elif action == "fetch_done":
                     self.is_fetching = False
                     self.update_button_states()
+                elif action == "transcript_export_done":
+                    self.is_exporting_transcripts = False
+                    self.update_bulk_transcript_button()
                 elif action == "thumbnail":
                     card, image = payload
                     if not card.winfo_exists():
@@ -385,8 +497,7 @@ class VideoDownloaderApp:
                     else:
                         entry = self.card_entries.get(card)
                         source_label = self.get_source_label(entry) if entry else "default"
-                        placeholder = self.get_placeholder_image(source_label)
-                        card.set_thumbnail_image(self.make_ctk_image(placeholder))
+                        card.set_thumbnail_image(self.get_placeholder_ctk_image(source_label))
         except queue.Empty:
             pass
         self.root.after(100, self.process_ui_queue)
@@ -426,6 +537,7 @@ class VideoDownloaderApp:
         else:
             self.busy_cards.discard(card)
         card.set_actions_enabled(bool(self.output_path) and card not in self.busy_cards)
+        card.set_cancellable(busy and card in self.cancel_tokens)
 
     def queue_card_busy(self, card, busy: bool):
         if threading.get_ident() != self.main_thread_id:
@@ -435,7 +547,7 @@ class VideoDownloaderApp:
 
     def format_error(self, stage, err):
         err_text = str(err) or "Unknown error"
-        reason, hint = classify_error(err_text)
+        reason, hint = classify_error(err if isinstance(err, BaseException) else err_text)
         self.last_error_reason = reason
         reason_text = f" (Reason: {reason})" if reason else ""
         return f"[{stage}] {type(err).__name__}: {err_text}{reason_text}{hint}"
@@ -462,15 +574,30 @@ class VideoDownloaderApp:
         if self.ui_offer_copy_diagnostics():
             self.run_on_ui_thread(self.copy_diagnostics)
 
-    def check_ffmpeg(self):
-        self.ffmpeg_path = shutil.which("ffmpeg")
+    def apply_environment(self, snapshot) -> None:
+        if snapshot is None or snapshot is self.environment_snapshot:
+            return
+        self.environment_snapshot = snapshot
+        self.check_ffmpeg(snapshot)
+        self.check_js_runtime(snapshot)
+
+    def ensure_environment(self) -> bool:
+        """Worker-thread only: wait for the startup probe; True when ffmpeg is available."""
+        snapshot = self.environment_snapshot or self.environment.snapshot(wait=True)
+        if snapshot is None:
+            return self.ffmpeg_available
+        if snapshot is not self.environment_snapshot:
+            self.ui_queue.put(("environment", snapshot))
+        return bool(snapshot.ffmpeg_path)
+
+    def check_ffmpeg(self, snapshot):
+        self.ffmpeg_path = snapshot.ffmpeg_path
         self.ffmpeg_available = bool(self.ffmpeg_path)
         if not self.ffmpeg_available:
             self.log("ffmpeg not found on PATH. Some formats may fail or be video-only.")
 
-    def check_js_runtime(self):
-        runtimes = ["deno", "node", "bun"]
-        self.js_runtimes = [rt for rt in runtimes if shutil.which(rt)]
+    def check_js_runtime(self, snapshot):
+        self.js_runtimes = snapshot.js_runtime_names
         self.js_runtime_available = bool(self.js_runtimes)
         if not self.js_runtimes:
             self.log(
@@ -486,6 +613,7 @@ class VideoDownloaderApp:
         js_runtime_path = getattr(self.download_manager, "last_js_runtime_path", None) or "n/a"
         remote_components = getattr(self.download_manager, "last_remote_components", None) or []
         js_runtime = ", ".join(self.js_runtimes) if getattr(self, "js_runtimes", None) else None
+        snapshot = self.environment.snapshot(wait=False)
         lines = build_diagnostics(
             url=url,
             action_kind=self.last_action_kind,
@@ -496,7 +624,7 @@ class VideoDownloaderApp:
             transcript_source=self.last_transcript_source,
             transcript_languages=self.last_transcript_languages,
             yt_dlp_version=get_yt_dlp_version(),
-            ffmpeg_path=self.ffmpeg_path,
+            ffmpeg_path=snapshot.ffmpeg_path if snapshot else None,
             js_runtime=js_runtime,
             js_runtime_used=js_runtime_used,
             js_runtime_path=js_runtime_path,
@@ -506,6 +634,10 @@ class VideoDownloaderApp:
             last_error=self.last_error,
             last_error_reason=self.last_error_reason,
             log_history=self.log_history,
+            ffprobe_path=snapshot.ffprobe_path if snapshot else None,
+            running_browsers=snapshot.running_browsers if snapshot else None,
+            environment_probed=snapshot is not None,
+            performance_summary=[*self.telemetry.summary_lines(), f"Spans: {self.telemetry_path}"],
         )
         self.root.clipboard_clear()
         self.root.clipboard_append("\n".join(lines))
@@ -520,7 +652,18 @@ class VideoDownloaderApp:
             state=fetch_state,
             text="Fetching..." if self.is_fetching else "Fetch",
         )
+        self.load_list_btn.configure(state="disabled" if self.is_fetching else "normal")
         self.update_card_buttons(has_folder)
+        self.update_bulk_transcript_button()
+
+    def update_bulk_transcript_button(self):
+        if not hasattr(self, "export_transcripts_btn"):
+            return
+        ready = bool(self.output_path) and bool(exportable_entries(self.video_entries))
+        self.export_transcripts_btn.configure(
+            state="normal" if ready and not self.is_exporting_transcripts else "disabled",
+            text="Exporting..." if self.is_exporting_transcripts else "Export all transcripts",
+        )
 
     # ──────────────────────────────────────────────────────────
     # Core flow
@@ -529,6 +672,10 @@ class VideoDownloaderApp:
         if self.is_fetching:
             return
         url = self.url_entry.get().strip()
+        urls = parse_url_list(url)
+        if len(urls) > 1:
+            self.start_batch_fetch(urls)
+            return
         # Normalize and trim URL text before fetch.
         norm_url = normalize_url(url)
         if norm_url != url:
@@ -551,6 +698,16 @@ class VideoDownloaderApp:
             username, password = dev_credentials_for_url(url, self.dev_defaults)
 
             outcome = self.fetcher.fetch(url, username, password)
+            if isinstance(outcome, NeedsSelenium) and outcome.remembered:
+                entries = self._run_selenium_fallback(url)
+                if entries:
+                    self.ui_queue.put(("results", entries))
+                    return
+                # Declined or empty: drop the profile so the domain is not stuck on Selenium.
+                self.site_profiles.forget(url)
+                self.log("[profile] Remembered Selenium strategy did not finish; using the full fetch chain.")
+                outcome = self.fetcher.fetch(url, username, password)
+
             if isinstance(outcome, NeedsCookies):
                 error_to_log = outcome.error
                 if isinstance(outcome.error, CookiesRequiredError) and outcome.error.original:
@@ -587,12 +744,7 @@ class VideoDownloaderApp:
             if isinstance(outcome, DirectHlsFound):
                 if outcome.error:
                     self.log("[Fallback] yt-dlp native extraction failed; using direct HLS fallback.")
-                entries = build_media_entries(
-                    [outcome.result.playlist_url],
-                    page_title=title_from_page_url(url),
-                    headers=outcome.result.headers,
-                )
-                self.ui_queue.put(("results", entries))
+                self.ui_queue.put(("results", hls_result_entries(url, outcome.result)))
                 return
 
             if isinstance(outcome, NeedsSelenium):
@@ -604,16 +756,8 @@ class VideoDownloaderApp:
                     "Link2Vid will open the target site in Chrome, log in with the "
                     "credentials you provide, then look for a playable media URL.",
                 ):
-                    username, password = self.ui_prompt_for_credentials(url)
-                    if not username or not password:
-                        self.log("No credentials provided.")
-                        self.ui_queue.put(("results", []))
-                        return
-                    entries = self.selenium_fallback(url, username, password)
-                    if entries:
-                        self.ui_queue.put(("results", entries))
-                        return
-                    self.log("No media found with Selenium.")
+                    self.ui_queue.put(("results", self._run_selenium_fallback(url)))
+                    return
 
                 self.ui_queue.put(("results", []))
                 return
@@ -625,6 +769,75 @@ class VideoDownloaderApp:
         finally:
             self.ui_queue.put(("fetch_done", None))
 
+    def _run_selenium_fallback(self, url: str) -> list[dict]:
+        """Prompt for credentials and run Selenium; records the site profile on success."""
+        username, password = self.ui_prompt_for_credentials(url)
+        if not username or not password:
+            self.log("No credentials provided.")
+            return []
+        started = time.monotonic()
+        entries = self.selenium_fallback(url, username, password)
+        if entries:
+            self.site_profiles.record_success(url, STRATEGY_SELENIUM, time.monotonic() - started)
+            return entries
+        self.log("No media found with Selenium.")
+        return []
+
+    def load_url_list(self):
+        if self.is_fetching:
+            return
+        path = filedialog.askopenfilename(title='Select URL list',
+                                          filetypes=[('Text files', '*.txt'), ('All files', '*.*')])
+        if not path:
+            return
+        try:
+            text = Path(path).read_text(encoding="utf-8", errors="replace")
+        except OSError as exc:
+            self.ui_warn("URL list", f"Could not read {path}:\n{exc}")
+            return
+        urls = parse_url_list(text)
+        if not urls:
+            self.ui_warn("URL list", "No http(s) URLs found in that file.")
+            return
+        self.start_batch_fetch(urls)
+
+    def start_batch_fetch(self, urls: list[str]):
+        self.log(f"[batch] Fetching {len(urls)} URL(s).")
+        self.last_url = urls[0]
+        self.is_fetching = True
+        self.clear_results()
+        self.set_results_state(f"Fetching 0/{len(urls)}...")
+        self.update_button_states()
+        self.fetch_future = self.executor.submit(self._fetch_batch_worker, urls)
+
+    def _fetch_batch_worker(self, urls: list[str]) -> None:
+        skipped = {
+            "needs_cookies": "needs cookies; fetch it on its own to pick a cookies.txt",
+            "needs_selenium": "needs browser automation; fetch it on its own",
+        }
+
+        def on_item(item, done: int, total: int) -> None:
+            self.queue_results_state(f"Fetching {done}/{total}...")
+            if item.status in skipped:
+                self.log(f"[batch] Skipped {item.url}: {skipped[item.status]}.")
+            elif item.status == "failed":
+                self.log_error(f"Fetch {item.url}", item.error)
+
+        try:
+            result = fetch_batch(
+                self.fetcher,
+                urls,
+                credentials_for=lambda url: dev_credentials_for_url(url, self.dev_defaults),
+                on_item=on_item,
+                log=self.log,
+            )
+            self.ui_queue.put(("results", result.entries))
+        except Exception as exc:
+            self.log_error("Batch fetch", exc)
+            self.ui_queue.put(("results", []))
+        finally:
+            self.ui_queue.put(("fetch_done", None))
+
     # ──────────────────────────────────────────────────────────
     # Direct HLS helper
     # ──────────────────────────────────────────────────────────
@@ -718,18 +931,18 @@ class VideoDownloaderApp:
                 self.results_scroll,
                 title=title,
                 metadata=metadata,
-                format_options=self.format_options,
+                format_options=self.format_options_for_entry(entry),
                 transcript_options=transcript_options,
                 on_download=self.handle_card_download,
                 on_transcript=self.handle_card_transcript,
+                on_cancel=self.handle_card_cancel,
             )
             card.pack(fill="x", padx=8, pady=8)
             if transcript_options == []:
                 card.set_status("No transcript tracks", state="ready")
             self.cards.append(card)
             self.card_entries[card] = entry
-            placeholder = self.get_placeholder_image(source_label)
-            card.set_thumbnail_image(self.make_ctk_image(placeholder))
+            card.set_thumbnail_image(self.get_placeholder_ctk_image(source_label))
             self.queue_thumbnail(card, entry, source_label)
 
         self.rendered_count = end
@@ -738,6 +951,14 @@ class VideoDownloaderApp:
 
         self.update_card_buttons(bool(self.output_path))
 
+    def format_options_for_entry(self, entry):
+        if "_ffmpeg_headers" not in entry:
+            return self.format_options
+        formats = entry.get("formats") or [{}]
+        if formats[0].get("ext") != "m3u8":
+            return [{"label": "Direct media", "format": HLS_BEST_FORMAT}]
+        return hls_format_options(entry.get("_hls_variants"))
+
     def get_transcript_options(self, entry):
         if not isinstance(entry, dict):
             return None
@@ -752,8 +973,7 @@ class VideoDownloaderApp:
     def queue_thumbnail(self, card, entry, source_label: str) -> None:
         url = entry.get("thumbnail") or entry.get("thumbnail_url")
         if not url:
-            placeholder = self.get_placeholder_image(source_label)
-            card.set_thumbnail_image(self.make_ctk_image(placeholder))
+            card.set_thumbnail_image(self.get_placeholder_ctk_image(source_label))
             return
 
         def on_ready(image):
@@ -790,54 +1010,10 @@ class VideoDownloaderApp:
         return "default"
 
     def get_placeholder_image(self, source_label: str):
-        key = (source_label, self.thumbnail_size)
-        cached = self.placeholder_cache.get(key)
-        if cached is not None:
-            return cached
-
-        label, colors = self.thumbnail_styles.get(source_label, self.thumbnail_styles["default"])
-        image = Image.new("RGB", self.thumbnail_size, colors[0])
-        draw = ImageDraw.Draw(image)
-        self._draw_gradient(draw, self.thumbnail_size, colors)
-        image = image.filter(ImageFilter.GaussianBlur(radius=0.6))
-
-        draw = ImageDraw.Draw(image)
-        font = self._get_placeholder_font()
-        text = label.upper()
-        text_box = draw.textbbox((0, 0), text, font=font)
-        text_width = text_box[2] - text_box[0]
-        text_height = text_box[3] - text_box[1]
-        x = (self.thumbnail_size[0] - text_width) / 2
-        y = (self.thumbnail_size[1] - text_height) / 2
-        draw.text((x, y), text, fill="#ffffff", font=font)
-
-        self.placeholder_cache[key] = image
-        return image
-
-    def _draw_gradient(self, draw, size, colors):
-        width, height = size
-        start, end = colors
-        start_rgb = self._hex_to_rgb(start)
-        end_rgb = self._hex_to_rgb(end)
-        for y in range(height):
-            ratio = y / max(1, height - 1)
-            r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * ratio)
-            g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * ratio)
-            b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * ratio)
-            draw.line([(0, y), (width, y)], fill=(r, g, b))
-
-    def _hex_to_rgb(self, value: str):
-        value = value.lstrip("#")
-        return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
-
-    def _get_placeholder_font(self):
-        if self.placeholder_font is not None:
-            return self.placeholder_font
-        try:
-            self.placeholder_font = ImageFont.truetype("arial.ttf", 14)
-        except Exception:
-            self.placeholder_font = ImageFont.load_default()
-        return self.placeholder_font
+        return self.placeholder_cache.get_pil(source_label, self.thumbnail_size)
+
+    def get_placeholder_ctk_image(self, source_label: str):
+        return self.placeholder_cache.get(source_label, self.thumbnail_size)
 
     # ──────────────────────────────────────────────────────────
     # Tk callbacks / UI helpers
@@ -871,14 +1047,34 @@ class VideoDownloaderApp:
             return
         url = entry.get('webpage_url', self.url_entry.get().strip())
         ffmpeg_headers = entry.get("_ffmpeg_headers")
-        if ffmpeg_headers:
-            self._download_direct_media(card, url, ffmpeg_headers, entry.get('title', 'Video'))
+        if ffmpeg_headers is not None:
+            hls_format = format_id if parse_hls_format(format_id) else HLS_BEST_FORMAT
+            archive_format = "ffmpeg" if hls_format == HLS_BEST_FORMAT else hls_format
+            if self._skip_archived_download(card, archive_keys(url=url), archive_format):
+                return
+            self._download_direct_media(card, url, ffmpeg_headers, entry.get('title', 'Video'), hls_format)
             return
         fmt_id = format_id or self.format_options[0]["format"]
         fmt_label = self.format_label_map.get(fmt_id, fmt_id)
-        if not self.ffmpeg_available and '+' in fmt_id:
+        keys = archive_keys(entry, url=url)
+        archive_format = fmt_id
+        if self._skip_archived_download(card, keys, archive_format):
+            return
+        # The environment probe may still be running: wait for it off the Tk thread.
+        self.queue_card_busy(card, True)
+        self.queue_card_status(card, "Preparing...", state="downloading")
+        threading.Thread(
+            target=self._start_card_download,
+            args=(entry, url, fmt_id, fmt_label, folder, card, keys, archive_format),
+            daemon=True,
+        ).start()
+
+    def _start_card_download(self, entry, url, fmt_id, fmt_label, folder, card, keys, archive_format):
+        if not self.ensure_environment() and '+' in fmt_id:
             choice = self.ui_ffmpeg_fallback(fmt_label)
             if choice == "cancel":
+                self.queue_card_status(card, "Ready", state="ready")
+                self.queue_card_busy(card, False)
                 return
             if choice == "fallback":
                 fmt_id = "best"
@@ -893,15 +1089,72 @@ class VideoDownloaderApp:
         self.last_transcript_source = None
         self.last_transcript_languages = []
         self.set_progress(0)
+        cancel_token = self._start_cancellable(card)
         self.queue_card_busy(card, True)
         self.queue_card_status(card, f"Downloading ({fmt_label})", state="downloading")
         self.queue_card_progress(card, 0)
         self.log(f"Starting download: {entry.get('title', 'Video')} ({fmt_label})")
-        threading.Thread(
-            target=self.download_video,
-            args=(url, fmt_id, folder, card, fmt_label),
-            daemon=True,
-        ).start()
+        self.download_video(
+            url,
+            fmt_id,
+            folder,
+            card,
+            fmt_label,
+            archive_ids=keys,
+            archive_format=archive_format,
+            expected_duration=entry.get("duration"),
+            cancel_token=cancel_token,
+        )
+
+    def set_speed_limit(self, label):
+        bps = self.speed_limits.get(label)
+        self.bandwidth.set_global_limit(bps)
+        self.log(f"Speed limit: {label}" if bps else "Speed limit removed.")
+
+    def _start_cancellable(self, card) -> CancelToken:
+        token = self.cancel_tokens[card] = CancelToken()
+        return token
+
+    def handle_card_cancel(self, card):
+        token = self.cancel_tokens.get(card)
+        if token is None or token.cancelled:
+            return
+        self.log(f"Cancelling download: {self.card_entries.get(card, {}).get('title', 'Video')}")
+        self.queue_card_status(card, "Cancelling...", state="downloading")
+        token.cancel()
+
+    def _finish_cancellable(self, card, token) -> None:
+        if self.cancel_tokens.get(card) is token:
+            self.cancel_tokens.pop(card, None)
+
+    def _verify_in_background(self, card, path, keys, format_id, expected_duration=None):
+        if self.download_verifier is None:
+            return
+
+        def on_result(result):
+            if card is None:
+                return
+            if result.ok:
+                self.queue_card_status(card, "Complete (verified)", state="complete")
+            else:
+                self.queue_card_status(card, "Verification failed", state="failed")
+
+        self.download_verifier.submit(
+            path,
+            keys,
+            format_id,
+            expected_duration=expected_duration,
+            on_result=on_result,
+        )
+
+    def _skip_archived_download(self, card, keys, format_id) -> bool:
+        record = self.download_archive.lookup(keys, format_id)
+        if record is None:
+            return False
+        self.log(f"Already in download archive: {record.path} ({format_id})")
+        self.queue_card_progress(card, 1)
+        self.queue_card_status(card, "Already downloaded", state="complete")
+        return True
 
     def handle_card_transcript(self, card, selected_transcript=None):
         entry = self.card_entries.get(card)
@@ -927,26 +1180,96 @@ class VideoDownloaderApp:
             self.log(f"Starting transcript download: {title} [{selected_transcript.label}]")
         else:
             self.log(f"Starting transcript download: {title}")
+        info = entry if self.get_transcript_options(entry) is not None else None
+        convert_to = self.transcript_export_formats.get(self.transcript_format_var.get())
         threading.Thread(
             target=self.download_transcript,
-            args=(url, folder, card, selected_transcript),
+            args=(url, folder, card, selected_transcript, info, convert_to),
             daemon=True,
         ).start()
 
-    def _download_direct_media(self, card, media_url: str, headers: dict, title: str) -> None:
+    def export_all_transcripts(self):
+        if self.is_exporting_transcripts:
+            return
+        folder = self.output_path
+        if not folder:
+            self.ui_warn('Folder Error', 'Select a folder first.')
+            return
+        entries = exportable_entries(self.video_entries)
+        if not entries:
+            self.log("No entries with transcripts to export.")
+            return
+        output_format = self.transcript_export_formats.get(self.transcript_format_var.get(), "srt")
+        cards_by_entry = {id(entry): card for card, entry in self.card_entries.items()}
+        self.is_exporting_transcripts = True
+        self.update_bulk_transcript_button()
+        self.last_action_kind = "transcript"
+        self.set_progress(0)
+        self.log(f"Exporting transcripts for {len(entries)} video(s) as {output_format}…")
+        threading.Thread(
+            target=self._run_transcript_export,
+            args=(entries, folder, output_format, cards_by_entry),
+            daemon=True,
+        ).start()
+
+    def _run_transcript_export(self, entries, folder, output_format, cards_by_entry):
+        entry_by_url = {entry["webpage_url"]: entry for entry in entries}
+        status_text = {
+            "saved": ("Transcript saved", "complete"),
+            "unavailable": ("Transcript unavailable", "failed"),
+            "failed": ("Transcript failed", "failed"),
+        }
+
+        def on_item(item, done, total):
+            self.set_progress(done / total)
+            self.queue_results_state(f"Transcripts: {done}/{total}")
+            if item.status != "saved":
+                self.log(f"[transcripts] {item.title}: {item.status} ({item.error})")
+            card = cards_by_entry.get(id(entry_by_url.get(item.url)))
+            if card is not None:
+                status, state = status_text[item.status]
+                self.queue_card_status(card, status, state=state)
+
+        try:
+            export_transcripts(
+                self.download_manager.download_transcript,
+                entries,
+                folder,
+                output_format=output_format,
+                on_item=on_item,
+                log=self.log,
+            )
+        except Exception as exc:
+            self.log_error("Transcript export", exc)
+        finally:
+            self.queue_results_state("")
+            self.ui_queue.put(("transcript_export_done", None))
+
+    def _download_direct_media(
+        self,
+        card,
+        media_url: str,
+        headers: dict,
+        title: str,
+        format_id: str = HLS_BEST_FORMAT,
+    ) -> None:
         folder = self.output_path
         if not folder:
             self.ui_warn('Folder Error', 'Select a folder first.')
             return
         safe_title = sanitize_filename(title)
-        outfile = unique_output_path(folder, safe_title, "mp4")
+        folder_index = self.get_folder_index(folder)
+        outfile = unique_output_path(folder, safe_title, "mp4", exists=folder_index.exists)
         self.last_action_kind = "media"
-        self.last_selected_format = "ffmpeg"
+        variant_policy = parse_hls_format(format_id)
+        archive_format = "ffmpeg" if format_id == HLS_BEST_FORMAT else format_id
+        self.last_selected_format = archive_format
         self.last_selected_label = "Direct HLS"
         self.last_selected_title = title
         self.last_transcript_source = None
         self.last_transcript_languages = []
         self.set_progress(0)
+        cancel_token = self._start_cancellable(card)
         self.queue_card_busy(card, True)
         self.queue_card_status(card, "Downloading (Direct HLS)", state="downloading")
         self.queue_card_progress(card, 0)
@@ -970,21 +1293,52 @@ class VideoDownloaderApp:
                     outfile,
                     headers or {},
                     progress_hook=on_progress,
+                    telemetry=self.telemetry,
+                    variant_policy=variant_policy,
+                    cancel_token=cancel_token,
                 )
                 self.set_progress(1)
                 self.queue_card_progress(card, 1)
                 self.queue_card_status(card, "Complete", state="complete")
                 self.log(f"ffmpeg download complete: {outfile}")
+                written = folder_index.record_write(outfile)
+                if written is not None:
+                    keys = archive_keys(url=media_url)
+                    self.download_archive.record(
+                        keys,
+                        archive_format,
+                        outfile,
+                        size=written.size,
+                        title=title,
+                        url=media_url,
+                    )
+                    self._verify_in_background(card, outfile, keys, archive_format)
+            except DownloadCancelledError:
+                self.set_progress(0)
+                self.queue_card_status(card, "Cancelled", state="failed")
+                self.log(f"ffmpeg download cancelled: {title}")
             except Exception as exc:
                 self.set_progress(0)
                 self.queue_card_status(card, "Failed (Direct HLS)", state="failed")
                 self.log_error("ffmpeg", exc)
             finally:
+                self._finish_cancellable(card, cancel_token)
                 self.queue_card_busy(card, False)
 
         threading.Thread(target=run_ffmpeg, daemon=True).start()
 
-    def download_video(self, url, format_id, out_path, card=None, fmt_label=None):
+    def download_video(
+        self,
+        url,
+        format_id,
+        out_path,
+        card=None,
+        fmt_label=None,
+        archive_ids=None,
+        archive_format=None,
+        expected_duration=None,
+        cancel_token=None,
+    ):
         finished_logged = False
         saved_files = []
 
@@ -1003,10 +1357,13 @@ class VideoDownloaderApp:
                 if card:
                     self.queue_card_status(card, "Finalizing", state="downloading")
 
+        folder_index = self.get_folder_index(out_path)
+
         def post_hook(filepath):
             if filepath:
                 final_path = os.path.abspath(filepath)
                 saved_files.append(final_path)
+                folder_index.record_write(final_path)
                 self.log(f"yt-dlp reported final path: {final_path}")
 
         outtmpl = os.path.join(out_path, '%(title)s.%(ext)s')
@@ -1019,7 +1376,14 @@ class VideoDownloaderApp:
             )
             self.log(f"Output folder before download: {self._folder_snapshot(out_path)}")
             try:
-                ok = self.download_manager.download(url, format_id, outtmpl, progress_hook=hook, post_hook=post_hook)
+                ok = self.download_manager.download(
+                    url,
+                    format_id,
+                    outtmpl,
+                    progress_hook=hook,
+                    post_hook=post_hook,
+                    cancel_token=cancel_token,
+                )
             except CookiesRequiredError as exc:
                 self.log_error("Download", exc.original or exc)
                 if self.ui_confirm(
@@ -1034,7 +1398,14 @@ class VideoDownloaderApp:
                         ok = False
                     else:
                         try:
-                            ok = self.download_manager.download(url, format_id, outtmpl, progress_hook=hook, post_hook=post_hook)
+                            ok = self.download_manager.download(
+                                url,
+                                format_id,
+                                outtmpl,
+                                progress_hook=hook,
+                                post_hook=post_hook,
+                                cancel_token=cancel_token,
+                            )
                         except CookiesRequiredError as retry_exc:
                             self.log_error("Download", retry_exc.original or retry_exc)
                             ok = False
@@ -1057,7 +1428,14 @@ class VideoDownloaderApp:
                         self.queue_card_progress(card, 0)
                         self.queue_card_status(card, f"Retrying ({fallback_label})", state="downloading")
                     try:
-                        ok = self.download_manager.download(url, fallback_id, outtmpl, progress_hook=hook, post_hook=post_hook)
+                        ok = self.download_manager.download(
+                            url,
+                            fallback_id,
+                            outtmpl,
+                            progress_hook=hook,
+                            post_hook=post_hook,
+                            cancel_token=cancel_token,
+                        )
                     except CookiesRequiredError as retry_exc:
                         self.log_error("Download", retry_exc.original or retry_exc)
                         ok = False
@@ -1073,11 +1451,29 @@ class VideoDownloaderApp:
                         all_preexisting = all_preexisting and was_preexisting
                         status = "already existed" if was_preexisting else "saved"
                         self.log(f"Download {status}: {output.path} ({output.size:,} bytes)")
+                    if archive_ids:
+                        final = verified_files[-1]
+                        self.download_archive.record(
+                            archive_ids,
+                            archive_format or format_id,
+                            final.path,
+                            size=final.size,
+                            title=self.last_selected_title,
+                            url=url,
+                        )
                     self.set_progress(1)
                     if card:
                         self.queue_card_progress(card, 1)
                         status = "Already downloaded" if all_preexisting else "Complete"
                         self.queue_card_status(card, status, state="complete")
+                    if archive_ids and not all_preexisting:
+                        self._verify_in_background(
+                            card,
+                            verified_files[-1].path,
+                            archive_ids,
+                            archive_format or format_id,
+                            expected_duration=expected_duration,
+                        )
                 else:
                     ok = False
                     self.log(
@@ -1093,10 +1489,24 @@ class VideoDownloaderApp:
             if not ok and card:
                 label = fmt_label or format_id
                 self.queue_card_status(card, f"Failed ({label})", state="failed")
+        except DownloadCancelledError:
+            self.set_progress(0)
+            self.log(f"Download cancelled: {self.last_selected_title or url}")
+            if card:
+                self.queue_card_status(card, "Cancelled", state="failed")
         finally:
             if card:
+                self._finish_cancellable(card, cancel_token)
                 self.queue_card_busy(card, False)
 
+    def get_folder_index(self, folder: str) -> FolderIndex:
+        key = os.path.abspath(folder)
+        with self.folder_indexes_lock:
+            index = self.folder_indexes.get(key)
+            if index is None:
+                index = self.folder_indexes[key] = FolderIndex(key)
+            return index
+
     def _recent_download_outputs(self, folder: str, started_at: float) -> list[str]:
         ignored_suffixes = (
             ".part",
@@ -1107,17 +1517,11 @@ class VideoDownloaderApp:
             ".f251.webm",
         )
         try:
-            candidates = []
-            for entry in Path(folder).iterdir():
-                if not entry.is_file():
-                    continue
-                name = entry.name.lower()
-                if any(name.endswith(suffix) for suffix in ignored_suffixes):
-                    continue
-                stat = entry.stat()
-                if stat.st_mtime >= started_at - 1:
-                    candidates.append((stat.st_mtime, str(entry)))
-            return [path for _mtime, path in sorted(candidates)]
+            return [
+                entry.path
+                for entry in self.get_folder_index(folder).recent(started_at - 1)
+                if not entry.path.lower().endswith(ignored_suffixes)
+            ]
         except Exception:
             return []
 
@@ -1152,24 +1556,33 @@ class VideoDownloaderApp:
 
     def _folder_snapshot(self, folder: str, limit: int = 10) -> str:
         try:
-            entries = []
-            for entry in Path(folder).iterdir():
-                if not entry.is_file():
-                    continue
-                stat = entry.stat()
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(stat.st_mtime))
-                entries.append((stat.st_mtime, f"{entry.name} ({stat.st_size:,} bytes, {timestamp})"))
+            index = self.get_folder_index(folder)
+            entries = index.newest(limit)
             if not entries:
                 return "no files"
-            newest = [description for _mtime, description in sorted(entries, reverse=True)[:limit]]
+            newest = []
+            for entry in entries:
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.mtime))
+                newest.append(f"{os.path.basename(entry.path)} ({entry.size:,} bytes, {timestamp})")
             return "; ".join(newest)
         except Exception as exc:
             return f"unavailable ({type(exc).__name__}: {exc})"
 
-    def download_transcript(self, url, out_path, card=None, selected_transcript=None):
+    def download_transcript(self, url, out_path, card=None, selected_transcript=None, info=None, convert_to=None):
         outtmpl = os.path.join(out_path, '%(title)s.transcript.%(ext)s')
 
         def mark_success(result):
+            # Auto-captions arrive as rolling, heavily duplicated cues; collapse them.
+            if result.path and result.source == "automatic captions" and convert_to in SUBTITLE_OUTPUT_FORMATS:
+                try:
+                    result.path = convert_subtitle_file(
+                        result.path,
+                        convert_to,
+                        remove_source=True,
+                        collapse_rolling=True,
+                    )
+                except Exception as exc:
+                    self.log(f"[transcripts] Could not convert {result.path}: {exc}")
             self.last_transcript_source = result.source
             self.last_transcript_languages = list(result.languages)
             self.set_progress(1)
@@ -1180,10 +1593,17 @@ class VideoDownloaderApp:
             if len(result.languages) > 5:
                 languages += ", ..."
             detail = f" [{languages}]" if languages else ""
+            if result.path:
+                detail += f" -> {result.path}"
             self.log(f"Transcript download complete ({result.source}){detail}")
 
         try:
-            result = self.download_manager.download_transcript(url, outtmpl, selected_track=selected_transcript)
+            result = self.download_manager.download_transcript(
+                url,
+                outtmpl,
+                selected_track=selected_transcript,
+                info=info,
+            )
             mark_success(result)
         except CookiesRequiredError as exc:
             self.log_error("Transcript", exc.original or exc)
@@ -1204,6 +1624,7 @@ class VideoDownloaderApp:
                             url,
                             outtmpl,
                             selected_track=selected_transcript,
+                            info=info,
                         )
                         mark_success(result)
                         return
@@ -1236,9 +1657,18 @@ class VideoDownloaderApp:
                 self.queue_card_busy(card, False)
 
     def on_close(self):
+        # Stop downloads first so ffmpeg children do not outlive the window.
+        for token in list(self.cancel_tokens.values()):
+            token.cancel()
         try:
             self.thumbnail_loader.clear_cache(remove_dir=False)
         finally:
+            if self.download_verifier is not None:
+                self.download_verifier.shutdown()
+            self.async_engine.close()
+            self.download_archive.close()
+            self.telemetry_writer.close()
+            self.debug_log_writer.close()
             self.root.destroy()
 
     # ──────────────────────────────────────────────────────────
@@ -1272,8 +1702,17 @@ class VideoDownloaderApp:
         if not username or not password:
             self.log("Selenium fallback skipped: no credentials provided.")
             return []
+        from ..core.selenium_fallback import selenium_fetch_media_entries
+
         login_plan = resolve_login_plan(page_url, self.dev_defaults)
-        entries = selenium_fetch_media_entries(page_url, username, password, login_plan=login_plan, log=self.log)
+        entries = selenium_fetch_media_entries(
+            page_url,
+            username,
+            password,
+            login_plan=login_plan,
+            log=self.log,
+            telemetry=self.telemetry,
+        )
         if entries:
             return entries
         self.log("Selenium fallback error: failed to find media URLs after login")
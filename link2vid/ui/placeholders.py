@@ -0,0 +1,109 @@
+"""Placeholder thumbnail rendering with a shared image cache."""
+
+from __future__ import annotations
+
+from typing import Callable
+import threading
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+PlaceholderStyle = tuple[str, tuple[str, str]]
+PlaceholderKey = tuple[str, tuple[int, int], str]
+
+
+def hex_to_rgb(value: str) -> tuple[int, int, int]:
+    value = value.lstrip("#")
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def load_placeholder_font():
+    try:
+        return ImageFont.truetype("arial.ttf", 14)
+    except Exception:
+        return ImageFont.load_default()
+
+
+def render_vertical_gradient(size: tuple[int, int], colors: tuple[str, str]) -> Image.Image:
+    width, height = size
+    start = Image.new("RGB", size, hex_to_rgb(colors[0]))
+    end = Image.new("RGB", size, hex_to_rgb(colors[1]))
+    mask = Image.linear_gradient("L").resize((width, height), Image.BILINEAR)
+    return Image.composite(end, start, mask)
+
+
+def render_placeholder(label: str, colors: tuple[str, str], size: tuple[int, int], font=None) -> Image.Image:
+    image = render_vertical_gradient(size, colors)
+    image = image.filter(ImageFilter.GaussianBlur(radius=0.6))
+
+    draw = ImageDraw.Draw(image)
+    font = font or load_placeholder_font()
+    text = label.upper()
+    text_box = draw.textbbox((0, 0), text, font=font)
+    text_width = text_box[2] - text_box[0]
+    text_height = text_box[3] - text_box[1]
+    x = (size[0] - text_width) / 2
+    y = (size[1] - text_height) / 2
+    draw.text((x, y), text, fill="#ffffff", font=font)
+    return image
+
+
+class PlaceholderCache:
+    """Renders each placeholder once per (source_label, size, theme) and keeps the ready UI image."""
+
+    def __init__(
+        self,
+        styles: dict[str, PlaceholderStyle],
+        *,
+        make_image: Callable[[Image.Image, tuple[int, int]], object],
+        get_theme: Callable[[], str] | None = None,
+    ) -> None:
+        self.styles = styles
+        self.make_image = make_image
+        self.get_theme = get_theme or (lambda: "default")
+        self._rendered: dict[PlaceholderKey, Image.Image] = {}
+        self._images: dict[PlaceholderKey, object] = {}
+        self._font = None
+        self._lock = threading.Lock()
+
+    def _key(self, source_label: str, size: tuple[int, int], theme: str | None) -> PlaceholderKey:
+        if source_label not in self.styles:
+            source_label = "default"
+        return source_label, tuple(size), theme or self.get_theme()
+
+    def _font_for_render(self):
+        if self._font is None:
+            self._font = load_placeholder_font()
+        return self._font
+
+    def get_pil(self, source_label: str, size: tuple[int, int], theme: str | None = None) -> Image.Image:
+        key = self._key(source_label, size, theme)
+        with self._lock:
+            cached = self._rendered.get(key)
+            if cached is not None:
+                return cached
+            label, colors = self.styles.get(key[0], self.styles["default"])
+            image = render_placeholder(label, colors, key[1], font=self._font_for_render())
+            self._rendered[key] = image
+            return image
+
+    def get(self, source_label: str, size: tuple[int, int]):
+        """Return the cached UI image for a placeholder. Call from the UI thread."""
+        key = self._key(source_label, size, None)
+        cached = self._images.get(key)
+        if cached is not None:
+            return cached
+        image = self.make_image(self.get_pil(source_label, size, key[2]), key[1])
+        self._images[key] = image
+        return image
+
+    def prewarm(self, size: tuple[int, int], theme: str | None = None) -> int:
+        """Render every style's bitmap ahead of time; safe to run on a worker thread."""
+        theme = theme or self.get_theme()
+        for source_label in self.styles:
+            self.get_pil(source_label, size, theme)
+        return len(self.styles)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rendered.clear()
+        self._images.clear()
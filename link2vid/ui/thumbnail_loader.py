@@ -13,6 +13,9 @@ import threading
 import requests
 from PIL import Image, ImageOps
 
+from ..core.async_engine import AsyncEngine
+from ..core.bandwidth import BandwidthGovernor
+
 ThumbnailCallback = Callable[[Image.Image | None], None]
 
 
@@ -49,8 +52,13 @@ class ThumbnailLoader:
         cache_max_items: int = 120,
         max_bytes: int = 5 * 1024 * 1024,
         log: Callable[[str], None] | None = None,
+        bandwidth: BandwidthGovernor | None = None,
+        engine: AsyncEngine | None = None,
     ) -> None:
         self.executor = executor
+        self.bandwidth = bandwidth
+        # With an engine, downloads run on its event loop; disk and decode stay on ``executor``.
+        self.engine = engine
         self.cache = LruCache(max_items=cache_max_items)
         self.max_bytes = max_bytes
         self.log = log
@@ -78,8 +86,7 @@ class ThumbnailLoader:
                 return
             self._inflight[key] = [on_ready]
 
-        def worker() -> None:
-            image = self._load_thumbnail(url, size)
+        def finish(image: Image.Image | None) -> None:
             if image is not None:
                 self.cache.set(key, image)
             callbacks: list[ThumbnailCallback]
@@ -91,6 +98,26 @@ class ThumbnailLoader:
                 except Exception as exc:
                     self._log(f"Thumbnail callback failed: {exc}")
 
+        def worker() -> None:
+            if self.engine is None:
+                finish(self._load_thumbnail(url, size))
+                return
+            image = self._load_from_disk(self._cache_path(key))
+            if image is not None:
+                finish(image)
+                return
+            download = self.engine.submit(self._download_bytes_async(url))
+            download.add_done_callback(lambda done: self.executor.submit(decode, done))
+
+        def decode(done) -> None:
+            try:
+                data = done.result()
+            except Exception as exc:
+                self._log(f"Thumbnail load failed: {exc}")
+                finish(None)
+                return
+            finish(self._decode_and_store(key, data, size))
+
         self.executor.submit(worker)
 
     def _make_key(self, url: str, size: tuple[int, int]) -> str:
@@ -108,13 +135,16 @@ class ThumbnailLoader:
             return image
         try:
             data = self._download_bytes(url)
-            image = self._decode_image(data, size)
-            if image is not None:
-                self._save_to_disk(path, image)
-            return image
         except Exception as exc:
             self._log(f"Thumbnail load failed: {exc}")
             return None
+        return self._decode_and_store(key, data, size)
+
+    def _decode_and_store(self, key: str, data: bytes, size: tuple[int, int]) -> Image.Image | None:
+        image = self._decode_image(data, size)
+        if image is not None:
+            self._save_to_disk(self._cache_path(key), image)
+        return image
 
     def _load_from_disk(self, path: Path) -> Image.Image | None:
         if not path.exists():
@@ -137,10 +167,20 @@ class ThumbnailLoader:
             if not chunk:
                 continue
             data.extend(chunk)
+            if self.bandwidth is not None:
+                self.bandwidth.throttle(url, len(chunk))
             if len(data) > self.max_bytes:
                 raise ValueError("Thumbnail too large")
         return bytes(data)
 
+    async def _download_bytes_async(self, url: str) -> bytes:
+        return await self.engine.get_bytes(
+            url,
+            timeout=10,
+            max_bytes=self.max_bytes,
+            throttle=(lambda nbytes: self.bandwidth.reserve(url, nbytes)) if self.bandwidth is not None else None,
+        )
+
     def _decode_image(self, data: bytes, size: tuple[int, int]) -> Image.Image | None:
         try:
             with Image.open(io.BytesIO(data)) as img:
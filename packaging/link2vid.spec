@@ -25,6 +25,7 @@ hiddenimports += [
     "m3u8",
     "selenium",
     "requests",
+    "httpx",
 ]
 
 a = Analysis(
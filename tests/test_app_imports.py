@@ -1,4 +1,9 @@
+import subprocess
+import sys
 import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
 
 
 class TestAppImports(unittest.TestCase):
@@ -7,6 +12,27 @@ class TestAppImports(unittest.TestCase):
 
         self.assertTrue(callable(VideoDownloaderApp))
 
+    def test_main_window_defers_heavy_imports(self):
+        script = (
+            "import sys; import link2vid.ui.main_window; "
+            "print(','.join(m for m in ('yt_dlp', 'link2vid.core.selenium_fallback') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            cwd=ROOT,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_core_resolves_selenium_exports_lazily(self):
+        import link2vid.core as core
+
+        self.assertTrue(callable(core.selenium_fetch_media_entries))
+        with self.assertRaises(AttributeError):
+            core.not_a_real_export
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+from link2vid.core.archive import DownloadArchive, archive_keys, url_archive_key
+
+
+class TestDownloadArchive(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.folder = self._tmpdir.name
+        self.archive = DownloadArchive(os.path.join(self.folder, "state", "archive.sqlite3"))
+
+    def tearDown(self):
+        self.archive.close()
+        self._tmpdir.cleanup()
+
+    def _make_file(self, name):
+        path = os.path.join(self.folder, name)
+        with open(path, "wb") as handle:
+            handle.write(b"data")
+        return path
+
+    def test_keys_use_extractor_id_and_url_hash(self):
+        keys = archive_keys({"extractor_key": "Youtube", "id": "abc", "webpage_url": "https://v.example/abc"})
+        self.assertEqual(keys, ["youtube:abc", url_archive_key("https://v.example/abc")])
+        self.assertEqual(archive_keys(url="https://cdn.example/a.m3u8"), [url_archive_key("https://cdn.example/a.m3u8")])
+
+    def test_lookup_matches_any_key_for_same_format(self):
+        path = self._make_file("clip.mp4")
+        self.archive.record(["youtube:abc", "url:1"], "best", path, size=4, title="Clip")
+        record = self.archive.lookup(["youtube:abc"], "best")
+        self.assertEqual((record.path, record.size, record.title), (path, 4, "Clip"))
+        self.assertIsNotNone(self.archive.lookup(["other", "url:1"], "best"))
+        self.assertIsNone(self.archive.lookup(["youtube:abc"], "bestaudio"))
+
+    def test_missing_output_file_is_not_archived(self):
+        path = self._make_file("gone.mp4")
+        self.archive.record(["youtube:gone"], "best", path)
+        os.remove(path)
+        self.assertIsNone(self.archive.lookup(["youtube:gone"], "best"))
+
+    def test_records_persist_across_instances(self):
+        path = self._make_file("kept.mp4")
+        self.archive.record(["youtube:kept"], "best", path)
+        self.archive.close()
+        reopened = DownloadArchive(self.archive.path)
+        try:
+            self.assertEqual(reopened.lookup(["youtube:kept"], "best").path, path)
+        finally:
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import asyncio
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+from link2vid.core.async_engine import AsyncEngine, RequestsTransport, default_transport
+from link2vid.core.extractors import (
+    page_with_player_scripts,
+    run_fetch_plan,
+    scan_direct_media_entries_async,
+)
+
+
+class FakeTransport:
+    name = "fake"
+
+    def __init__(self, pages=None, delay=0.01):
+        self.pages = pages or {}
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+        self.sessions_by_url = {}
+        self.opened = 0
+        self.closed = 0
+
+    def open_session(self):
+        self.opened += 1
+        return self.opened
+
+    async def close_session(self, _session):
+        self.closed += 1
+
+    async def get_text(self, url, _headers, _timeout, session=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.threads.add(threading.get_ident())
+        self.sessions_by_url[url] = session
+        try:
+            await asyncio.sleep(self.delay)
+            page = self.pages.get(url, "")
+            if isinstance(page, Exception):
+                raise page
+            return page
+        finally:
+            self.active -= 1
+
+    async def aclose(self):
+        return None
+
+
+BLAZE_PAGE = '<iframe src="https://player.blazestreaming.example/embed?id=abc123"></iframe>'
+BLAZE_IFRAME = '<script src="/a.js"></script><script src="/b.js"></script>'
+PAGES = {
+    "https://site.example/lesson": BLAZE_PAGE,
+    "https://player.blazestreaming.example/embed?id=abc123": BLAZE_IFRAME,
+    "https://player.blazestreaming.example/a.js": "var u = 'https://cdn.example/' + videoId + '/master.m3u8';",
+    "https://player.blazestreaming.example/b.js": RuntimeError("script 404"),
+}
+
+
+class TestAsyncEngine(unittest.TestCase):
+    def test_concurrent_requests_share_one_thread_and_respect_the_cap(self):
+        transport = FakeTransport()
+        engine = AsyncEngine(max_connections=5, transport_factory=lambda: transport)
+        try:
+
+            async def crawl():
+                return await asyncio.gather(*(engine.get_text(f"https://x.example/{i}") for i in range(40)))
+
+            self.assertEqual(len(engine.run(crawl())), 40)
+        finally:
+            engine.close()
+        self.assertEqual(transport.peak, 5)
+        self.assertEqual(len(transport.threads), 1)
+
+    def test_run_refuses_to_block_the_loop_thread(self):
+        engine = AsyncEngine(transport_factory=FakeTransport)
+        try:
+
+            async def nested():
+                return engine.run(asyncio.sleep(0))
+
+            with self.assertRaises(RuntimeError):
+                engine.run(nested())
+        finally:
+            engine.close()
+
+    def test_in_executor_runs_off_the_loop_thread(self):
+        engine = AsyncEngine(transport_factory=FakeTransport)
+        try:
+
+            async def parse():
+                return threading.current_thread().name, await engine.in_executor(
+                    lambda: threading.current_thread().name
+                )
+
+            loop_thread, parse_thread = engine.run(parse())
+        finally:
+            engine.close()
+        self.assertEqual(loop_thread, "link2vid-async")
+        self.assertTrue(parse_thread.startswith("link2vid-parse"))
+
+    def test_requests_fallback_without_httpx(self):
+        with patch.dict(sys.modules, {"httpx": None}):
+            transport = default_transport(max_connections=10, timeout=5, fallback_workers=2)
+        self.assertIsInstance(transport, RequestsTransport)
+        asyncio.run(transport.aclose())
+
+    def test_httpx_is_the_default_transport(self):
+        transport = default_transport(max_connections=10, timeout=5, fallback_workers=2)
+        try:
+            self.assertEqual(transport.name, "httpx")
+        finally:
+            asyncio.run(transport.aclose())
+
+    def test_async_scan_matches_blocking_plan(self):
+        def get_text(url):
+            page = PAGES[url]
+            if isinstance(page, Exception):
+                raise page
+            return page
+
+        blocking_html = run_fetch_plan(page_with_player_scripts("https://site.example/lesson"), get_text)
+        self.assertIn("https://cdn.example/abc123/master.m3u8", blocking_html)
+
+        transport = FakeTransport(PAGES)
+        engine = AsyncEngine(transport_factory=lambda: transport)
+        try:
+            entries = engine.run(scan_direct_media_entries_async(engine, "https://site.example/lesson"))
+        finally:
+            engine.close()
+        self.assertEqual([entry["webpage_url"] for entry in entries], ["https://cdn.example/abc123/master.m3u8"])
+        # Both player scripts were requested together.
+        self.assertEqual(transport.peak, 2)
+        # Page, iframe and scripts went through one session, closed afterwards.
+        self.assertEqual(set(transport.sessions_by_url.values()), {1})
+        self.assertEqual((transport.opened, transport.closed), (1, 1))
+
+    def test_concurrent_scans_get_separate_sessions(self):
+        pages = {"https://a.example/": "<p>a</p>", "https://b.example/": "<p>b</p>"}
+        transport = FakeTransport(pages)
+        engine = AsyncEngine(transport_factory=lambda: transport)
+
+        async def scan_both():
+            return await asyncio.gather(
+                *(scan_direct_media_entries_async(engine, url) for url in pages)
+            )
+
+        try:
+            engine.run(scan_both())
+        finally:
+            engine.close()
+        sessions = [transport.sessions_by_url[url] for url in pages]
+        self.assertNotEqual(sessions[0], sessions[1])
+        self.assertEqual(transport.closed, 2)
+
+    def test_httpx_sessions_keep_separate_cookies_and_share_the_pool(self):
+        transport = default_transport(max_connections=10, timeout=5, fallback_workers=2)
+
+        async def check():
+            first, second = transport.open_session(), transport.open_session()
+            try:
+                first.cookies.set("sid", "one")
+                self.assertIsNone(second.cookies.get("sid"))
+            finally:
+                await transport.close_session(first)
+                await transport.close_session(second)
+            # Closing sessions leaves the shared client usable.
+            self.assertFalse(transport._client.is_closed)
+            await transport.aclose()
+
+        asyncio.run(check())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from link2vid.core.bandwidth import BandwidthGovernor, TokenBucket, governor_from_config
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_debt(self):
+        clock = FakeClock()
+        bucket = TokenBucket(1000, clock=clock)
+        self.assertEqual(bucket.reserve(1000), 0.0)
+        self.assertAlmostEqual(bucket.reserve(500), 0.5)
+        clock.now += 1.5
+        self.assertEqual(bucket.reserve(500), 0.0)
+
+    def test_unlimited(self):
+        self.assertEqual(TokenBucket(None).reserve(10**9), 0.0)
+
+
+class TestBandwidthGovernor(unittest.TestCase):
+    def test_throttle_applies_tightest_of_global_and_host(self):
+        clock = FakeClock()
+        governor = BandwidthGovernor(10_000, {"example.com": 1_000}, clock=clock, sleep=clock.sleep)
+        for _ in range(4):
+            governor.throttle("https://cdn.example.com/a.jpg", 1_000)
+        self.assertAlmostEqual(clock.now, 3.0)
+        clock.now = 0.0
+        governor = BandwidthGovernor(10_000, {"example.com": 1_000}, clock=clock, sleep=clock.sleep)
+        governor.throttle("https://other.example/a.jpg", 1_000)
+        self.assertEqual(clock.now, 0.0)
+
+    def test_attach_splits_ratelimit_and_follows_runtime_changes(self):
+        governor = BandwidthGovernor(8_000, {"video.example": 2_000})
+        first, second, third = {}, {}, {}
+        detach_first = governor.attach("https://a.example/watch", first)
+        self.assertEqual(first["ratelimit"], 8_000)
+        governor.attach("https://b.example/watch", second)
+        governor.attach("https://www.video.example/watch", third)
+        self.assertEqual(first["ratelimit"], 2_666)
+        self.assertEqual(third["ratelimit"], 2_000)
+        detach_first()
+        self.assertEqual(second["ratelimit"], 4_000)
+        governor.set_global_limit(None)
+        self.assertNotIn("ratelimit", second)
+        self.assertEqual(third["ratelimit"], 2_000)
+        governor.set_host_limit("video.example", None)
+        self.assertNotIn("ratelimit", third)
+
+    def test_governor_from_config_uses_kib(self):
+        governor = governor_from_config({"bandwidth_limit_kbps": 512, "bandwidth_host_limits_kbps": {"example.com": "bad"}})
+        self.assertEqual(governor.global_limit, 512 * 1024)
+        params = {}
+        governor.attach("https://example.com/v", params)
+        self.assertEqual(params["ratelimit"], 512 * 1024)
+
+
+if __name__ == "__main__":
+    unittest.main()
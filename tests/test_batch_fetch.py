@@ -0,0 +1,164 @@
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from link2vid.core.batch_fetch import fetch_batch, merge_entries, parse_url_list
+from link2vid.core.downloader import DownloadManager
+from link2vid.core.extractors import HlsScanResult
+from link2vid.core.fetcher import DirectHlsFound, FetchResults, NeedsCookies, VideoFetcher
+from link2vid.core.site_profiles import SiteProfileStore
+from tests.fixtures.hosts import VIDEO_HOST_A, VIDEO_HOST_B
+
+
+class _FakeFetcher:
+    def __init__(self, outcomes, delay=0.02):
+        self.outcomes = outcomes
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch(self, url, username=None, password=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append((url, username))
+        try:
+            time.sleep(self.delay)
+            return self.outcomes[url]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestParseUrlList(unittest.TestCase):
+    def test_normalizes_and_dedupes_in_first_seen_order(self):
+        text = (
+            f"# course list\n"
+            f"http://{VIDEO_HOST_A}/watch/1\n"
+            f"https://{VIDEO_HOST_A.upper()}/watch/1/#t=30\n"
+            f"  https://{VIDEO_HOST_B}/v/2, https://{VIDEO_HOST_A}/watch/3).\n"
+            f"not a url\n"
+            f"# https://{VIDEO_HOST_B}/commented-out\n"
+        )
+        self.assertEqual(
+            parse_url_list(text),
+            [
+                f"https://{VIDEO_HOST_A}/watch/1",
+                f"https://{VIDEO_HOST_B}/v/2",
+                f"https://{VIDEO_HOST_A}/watch/3",
+            ],
+        )
+
+    def test_splits_comma_separated_urls_but_keeps_commas_inside_urls(self):
+        text = f"https://{VIDEO_HOST_A}/x,https://{VIDEO_HOST_B}/y, https://{VIDEO_HOST_A}/list?ids=1,2,3"
+        self.assertEqual(
+            parse_url_list(text),
+            [
+                f"https://{VIDEO_HOST_A}/x",
+                f"https://{VIDEO_HOST_B}/y",
+                f"https://{VIDEO_HOST_A}/list?ids=1,2,3",
+            ],
+        )
+
+    def test_empty_text(self):
+        self.assertEqual(parse_url_list(""), [])
+        self.assertEqual(parse_url_list(None), [])
+
+
+class TestMergeEntries(unittest.TestCase):
+    def test_dedupes_by_video_id_and_by_url(self):
+        first = [
+            {"id": "abc", "extractor_key": "Youtube", "webpage_url": f"https://{VIDEO_HOST_A}/watch/abc"},
+            {"title": "Clip", "webpage_url": f"https://{VIDEO_HOST_B}/media/clip.m3u8"},
+        ]
+        second = [
+            # Same video reached through another page URL.
+            {"id": "abc", "ie_key": "youtube", "url": f"https://{VIDEO_HOST_A}/shorts/abc"},
+            # Same media URL, http and a fragment.
+            {"title": "Clip again", "webpage_url": f"http://{VIDEO_HOST_B}/media/clip.m3u8#x"},
+            {"id": "xyz", "extractor_key": "Youtube", "webpage_url": f"https://{VIDEO_HOST_A}/watch/xyz"},
+        ]
+        merged, dropped = merge_entries([first, second])
+        self.assertEqual(dropped, 2)
+        self.assertEqual([entry.get("id") or entry["title"] for entry in merged], ["abc", "Clip", "xyz"])
+
+
+class TestFetchBatch(unittest.TestCase):
+    def test_bounded_concurrency_input_order_and_skips(self):
+        urls = [f"https://{VIDEO_HOST_A}/watch/{index}" for index in range(6)]
+        outcomes = {
+            url: FetchResults(entries=[{"id": str(index), "extractor_key": "Site", "webpage_url": url}])
+            for index, url in enumerate(urls)
+        }
+        # Playlist page overlapping an earlier video.
+        outcomes[urls[4]] = FetchResults(entries=[{"id": "0", "extractor_key": "Site", "url": urls[0]}])
+        outcomes[urls[5]] = NeedsCookies(error=RuntimeError("Sign in to confirm"))
+        fetcher = _FakeFetcher(outcomes)
+        progress = []
+
+        result = fetch_batch(
+            fetcher,
+            urls,
+            max_workers=2,
+            credentials_for=lambda url: ("user", "pw"),
+            on_item=lambda item, done, total: progress.append((done, total)),
+        )
+
+        self.assertLessEqual(fetcher.peak, 2)
+        self.assertEqual(sorted(progress), [(done, 6) for done in range(1, 7)])
+        self.assertEqual({username for _url, username in fetcher.calls}, {"user"})
+        self.assertEqual([entry["id"] for entry in result.entries], ["0", "1", "2", "3"])
+        self.assertEqual(result.duplicates, 1)
+        self.assertEqual([item.url for item in result.items], urls)
+        self.assertEqual([(item.url, item.status) for item in result.failures], [(urls[5], "needs_cookies")])
+
+    def test_direct_hls_outcome_becomes_entry_and_exceptions_are_failures(self):
+        hls_url = f"https://{VIDEO_HOST_B}/lesson/intro-video"
+        broken_url = f"https://{VIDEO_HOST_B}/broken"
+        playlist = f"https://{VIDEO_HOST_B}/master.m3u8"
+        outcomes = {hls_url: DirectHlsFound(result=HlsScanResult(playlist, {"Referer": hls_url}, []))}
+        fetcher = _FakeFetcher(outcomes, delay=0)
+
+        result = fetch_batch(fetcher, [hls_url, broken_url])
+
+        self.assertEqual(len(result.entries), 1)
+        self.assertEqual(result.entries[0]["webpage_url"], playlist)
+        self.assertEqual(result.entries[0]["title"], "Intro Video")
+        self.assertEqual(result.entries[0]["_hls_variants"], [])
+        self.assertEqual(result.failures[0].status, "failed")
+        self.assertIsInstance(result.failures[0].error, KeyError)
+
+    def test_concurrent_fetches_record_their_own_cookie_source(self):
+        manager = DownloadManager(ydl_logger=None)
+        both_extracting = threading.Barrier(2, timeout=5)
+        cookie_url = f"https://{VIDEO_HOST_A}/watch/1"
+        plain_url = f"https://{VIDEO_HOST_B}/v/2"
+
+        def get_video_info(url, _username=None, _password=None):
+            manager._begin_call()
+            if url == cookie_url:
+                manager._mark_browser_cookies("firefox")
+            # The other fetch starts (and resets its own state) before either returns.
+            both_extracting.wait()
+            return [{"id": url, "extractor_key": "Site", "webpage_url": url}]
+
+        with tempfile.TemporaryDirectory() as folder:
+            store = SiteProfileStore(Path(folder) / "site-profiles.json")
+            fetcher = VideoFetcher(
+                get_video_info=get_video_info,
+                site_profiles=store,
+                cookie_source=manager.cookie_source,
+            )
+            result = fetch_batch(fetcher, [cookie_url, plain_url], max_workers=2)
+
+            self.assertEqual(len(result.entries), 2)
+            self.assertEqual(store.get(cookie_url).cookie_source, "browser:firefox")
+            self.assertEqual(store.get(plain_url).cookie_source, "none")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import sys
+import unittest
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parents[1] / "benchmarks"
+if str(BENCH_DIR) not in sys.path:
+    sys.path.insert(0, str(BENCH_DIR))
+
+import run_benchmarks  # noqa: E402
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_every_case_finds_what_its_fixture_contains(self):
+        # Tiny inputs and no timing limits: only the correctness checks matter here.
+        results = run_benchmarks.run(repeat=1, scale=0.01, threshold_scale=1e6)
+
+        self.assertEqual(len(results), len(run_benchmarks.CASES) + 1)
+        for result in results:
+            with self.subTest(result.name):
+                self.assertIsNone(result.error)
+
+    def test_only_filters_cases(self):
+        results = run_benchmarks.run(only=["progressreader"], repeat=1, scale=0.01, threshold_scale=1e6)
+        self.assertEqual([result.name for result in results], ["FfmpegProgressReader (100k lines)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
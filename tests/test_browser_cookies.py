@@ -0,0 +1,78 @@
+import http.cookiejar
+import os
+import threading
+import unittest
+
+from link2vid.core.browser_cookies import (
+    BrowserCookieProber,
+    looks_like_login_url,
+    save_cookiefile,
+    site_cookie_count,
+)
+
+
+def make_jar(*domains):
+    jar = http.cookiejar.MozillaCookieJar()
+    for index, domain in enumerate(domains):
+        jar.set_cookie(
+            http.cookiejar.Cookie(
+                0, f"c{index}", "v", None, False, domain, True, domain.startswith("."), "/", True,
+                True, 2_000_000_000, False, None, None, {},
+            )
+        )
+    return jar
+
+
+class TestBrowserCookies(unittest.TestCase):
+    def test_site_cookie_count_matches_host_and_parent_domains(self):
+        jar = make_jar(".example.com", "video.example.com", "other.net")
+        self.assertEqual(site_cookie_count(jar, "https://video.example.com/watch/1"), 2)
+        self.assertEqual(site_cookie_count(jar, "https://elsewhere.org/"), 0)
+
+    def test_login_url_detection(self):
+        self.assertTrue(looks_like_login_url("https://accounts.example.com/ServiceLogin"))
+        self.assertTrue(looks_like_login_url("https://example.com/login?next=/watch"))
+        self.assertFalse(looks_like_login_url("https://example.com/watch/1"))
+
+    def test_probe_runs_concurrently_and_yields_in_candidate_order(self):
+        started = threading.Barrier(3, timeout=5)
+        jars = {"edge": make_jar(), "chrome": make_jar(".example.com"), "firefox": make_jar(".example.com")}
+
+        def load(browser):
+            started.wait()  # every probe must be in flight at once
+            return jars[browser]
+
+        def check(_url, jar):
+            if jar is jars["chrome"]:
+                raise RuntimeError("HTTP Error 403")
+
+        prober = BrowserCookieProber(load_jar=load, check=check)
+        results = list(prober.probe("https://example.com/watch/1", ["edge", "chrome", "firefox"]))
+        self.assertEqual([result.browser for result in results], ["edge", "chrome", "firefox"])
+        edge, chrome, firefox = results
+        self.assertFalse(edge.usable)
+        self.assertIn("no cookies", str(edge.error))
+        self.assertTrue(chrome.usable)
+        self.assertFalse(chrome.verified)
+        self.assertTrue(firefox.verified)
+
+    def test_probe_reports_jar_load_errors(self):
+        def load(_browser):
+            raise PermissionError("Failed to decrypt with DPAPI")
+
+        result = next(BrowserCookieProber(load_jar=load, check=lambda *_: None).probe("https://example.com", ["edge"]))
+        self.assertFalse(result.usable)
+        self.assertIsInstance(result.error, PermissionError)
+
+    def test_save_cookiefile_round_trips(self):
+        path = save_cookiefile(make_jar(".example.com"))
+        try:
+            loaded = http.cookiejar.MozillaCookieJar(path)
+            loaded.load(ignore_discard=True, ignore_expires=True)
+            self.assertEqual(site_cookie_count(loaded, "https://example.com/"), 1)
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from link2vid.core.cancellation import CancelToken
+from link2vid.core.errors import DownloadCancelledError
+
+
+class TestCancelToken(unittest.TestCase):
+    def test_callbacks_run_once_on_cancel(self):
+        token = CancelToken()
+        calls = []
+        token.on_cancel(lambda: calls.append("a"))
+        unregister = token.on_cancel(lambda: calls.append("b"))
+        unregister()
+        token.cancel()
+        token.cancel()
+        self.assertEqual(calls, ["a"])
+        self.assertTrue(token.cancelled)
+
+    def test_callback_registered_after_cancel_runs_immediately(self):
+        token = CancelToken()
+        token.cancel()
+        calls = []
+        token.on_cancel(lambda: calls.append("late"))
+        self.assertEqual(calls, ["late"])
+
+    def test_raise_if_cancelled(self):
+        token = CancelToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        with self.assertRaises(DownloadCancelledError):
+            token.raise_if_cancelled()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,7 @@ class TestDiagnostics(unittest.TestCase):
             last_error="Boom",
             last_error_reason="cookies/auth",
             log_history=["line1", "line2"],
+            performance_summary=["fetch: 1x avg 2500 ms, max 2500 ms, total 2.5 s"],
         )
         output = "\n".join(lines)
         self.assertIn("Link2Vid Diagnostics", output)
@@ -45,8 +46,40 @@ class TestDiagnostics(unittest.TestCase):
         self.assertIn("Cookies browser: brave", output)
         self.assertIn("Last error: Boom", output)
         self.assertIn("Last classified error: cookies/auth", output)
+        self.assertIn("ffprobe: not found", output)
+        self.assertIn("Running browsers: none", output)
+        performance_index = lines.index("-- Performance --")
+        self.assertEqual(lines[performance_index + 1], "fetch: 1x avg 2500 ms, max 2500 ms, total 2.5 s")
+        self.assertLess(performance_index, lines.index("-- Recent log --"))
         self.assertTrue(lines[-1].endswith("line2"))
 
+    def test_build_diagnostics_reports_pending_environment_probe(self):
+        lines = build_diagnostics(
+            url=None,
+            action_kind=None,
+            selected_title=None,
+            selected_format=None,
+            output_path=None,
+            debug_log_path=None,
+            transcript_source=None,
+            transcript_languages=None,
+            yt_dlp_version="1.2.3",
+            ffmpeg_path=None,
+            js_runtime=None,
+            js_runtime_used=None,
+            js_runtime_path=None,
+            remote_components=None,
+            cookies_mode=None,
+            cookies_browser=None,
+            last_error=None,
+            last_error_reason=None,
+            log_history=None,
+            environment_probed=False,
+        )
+        self.assertIn("ffmpeg: probe pending", lines)
+        self.assertNotIn("-- Performance --", lines)
+        self.assertIn("Running browsers: probe pending", lines)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,17 @@
+import io
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
+from link2vid.core.browser_cookies import CookieProbeResult
+from link2vid.core.cancellation import CancelToken
 from link2vid.core.downloader import DownloadManager, TranscriptTrack
-from link2vid.core.errors import NoTranscriptAvailableError
+from link2vid.core.environment import EnvironmentProbe
+from link2vid.core.errors import CookiesRequiredError, DownloadCancelledError, NoTranscriptAvailableError
+from link2vid.core.retry import RetryScheduler
+from link2vid.core.site_profiles import STRATEGY_YTDLP, SiteProfileStore
 from tests.fixtures.hosts import VIDEO_HOST_A
 
 
@@ -17,6 +26,33 @@ class DummyLogger:
         return None
 
 
+class FakeTranscriptYDL:
+    instances = []
+
+    def __init__(self, opts):
+        self.opts = opts
+        self.opened = []
+        self.extracted = False
+        FakeTranscriptYDL.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+    def prepare_filename(self, info):
+        return self.opts["outtmpl"].replace("%(title)s", info["title"]).replace("%(ext)s", info["ext"])
+
+    def urlopen(self, request):
+        self.opened.append(request.url)
+        return io.BytesIO(b"WEBVTT\n")
+
+    def extract_info(self, _url, download=False):
+        self.extracted = True
+        return {}
+
+
 class TestDownloaderPolicy(unittest.TestCase):
     def test_browser_candidates_ordering(self):
         manager = DownloadManager(ydl_logger=DummyLogger(), dev_defaults={"cookies_browser": "brave"})
@@ -24,6 +60,12 @@ class TestDownloaderPolicy(unittest.TestCase):
             candidates = manager._browser_candidates()
         self.assertEqual(candidates, ["brave", "chrome", "edge", "firefox"])
 
+    def test_js_runtime_comes_from_environment_probe(self):
+        environment = EnvironmentProbe(which={"bun": "/opt/bun"}.get, list_browsers=lambda: ["firefox"])
+        manager = DownloadManager(ydl_logger=DummyLogger(), environment=environment)
+        self.assertEqual(manager._select_js_runtime(), ("bun", "/opt/bun"))
+        self.assertEqual(manager._browser_candidates(), ["firefox", "edge", "chrome", "brave"])
+
     def test_should_try_browser_cookies(self):
         manager = DownloadManager(ydl_logger=DummyLogger())
         self.assertTrue(manager._should_try_browser_cookies(f"https://{VIDEO_HOST_A}/vid", Exception("login required")))
@@ -50,6 +92,39 @@ class TestDownloaderPolicy(unittest.TestCase):
         self.assertEqual(opts["js_runtimes"]["node"]["path"], "C:\\node.exe")
         self.assertEqual(opts["remote_components"], ["ejs:github"])
 
+    def test_concurrent_calls_keep_their_own_cookie_and_runtime_state(self):
+        manager = DownloadManager(ydl_logger=DummyLogger())
+        marked = threading.Event()
+        other_started = threading.Event()
+        seen = {}
+
+        def first():
+            manager._begin_call()
+            manager._mark_browser_cookies("chrome")
+            with patch.object(manager, "_select_js_runtime", return_value=("deno", "/bin/deno")):
+                manager._apply_js_runtime_opts({})
+            marked.set()
+            other_started.wait(5)
+            seen["first"] = manager.cookie_source()
+
+        def second():
+            marked.wait(5)
+            manager._begin_call()
+            with patch.object(manager, "_select_js_runtime", return_value=(None, None)):
+                manager._apply_js_runtime_opts({})
+            seen["second"] = manager.cookie_source()
+            other_started.set()
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(seen, {"first": "browser:chrome", "second": "none"})
+        # Diagnostics show the most recently started call as a whole.
+        self.assertEqual((manager.last_cookies_mode, manager.last_js_runtime), ("none", None))
+
     def test_apply_js_runtime_opts_deno_adds_npm(self):
         manager = DownloadManager(ydl_logger=DummyLogger())
         opts = {}
@@ -180,6 +255,173 @@ class TestDownloaderPolicy(unittest.TestCase):
                 selected_track=TranscriptTrack(source="subtitles", language="fr", label="French (fr) - Subtitles"),
             )
 
+    def test_subtitle_track_file_prefers_vtt(self):
+        manager = DownloadManager(ydl_logger=DummyLogger())
+        info = {"subtitles": {"en": [{"ext": "json3", "url": "j"}, {"ext": "srt", "url": "s"}, {"ext": "vtt", "url": "v"}]}}
+        config = manager._transcript_download_config(info)
+        self.assertEqual(manager._subtitle_track_file(info, config)["url"], "v")
+
+    def test_download_transcript_with_info_fetches_track_without_extracting(self):
+        manager = DownloadManager(ydl_logger=DummyLogger())
+        info = {
+            "title": "Clip",
+            "ext": "mp4",
+            "subtitles": {"en": [{"ext": "vtt", "url": "https://subs.example/en.vtt"}]},
+        }
+        FakeTranscriptYDL.instances = []
+        with tempfile.TemporaryDirectory() as folder:
+            outtmpl = os.path.join(folder, "%(title)s.transcript.%(ext)s")
+            with patch("yt_dlp.YoutubeDL", FakeTranscriptYDL):
+                result = manager.download_transcript("https://video.example/watch", outtmpl, info=info)
+            self.assertEqual(result.path, os.path.join(folder, "Clip.transcript.en.vtt"))
+            with open(result.path, "rb") as handle:
+                self.assertEqual(handle.read(), b"WEBVTT\n")
+        self.assertEqual(len(FakeTranscriptYDL.instances), 1)
+        self.assertEqual(FakeTranscriptYDL.instances[0].opened, ["https://subs.example/en.vtt"])
+        self.assertFalse(FakeTranscriptYDL.instances[0].extracted)
+
+    def test_download_raises_when_cancelled_mid_stream(self):
+        manager = DownloadManager(ydl_logger=DummyLogger())
+        token = CancelToken()
+        seen = []
+
+        class FakeDownloadYDL:
+            def __init__(self, opts):
+                self.opts = opts
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc):
+                return False
+
+            def download(self, _urls):
+                for downloaded in (10, 20, 30):
+                    for hook in self.opts["progress_hooks"]:
+                        hook({"status": "downloading", "downloaded_bytes": downloaded})
+                    if downloaded == 20:
+                        token.cancel()
+
+        with patch("yt_dlp.YoutubeDL", FakeDownloadYDL):
+            with self.assertRaises(DownloadCancelledError):
+                manager.download(
+                    "https://video.example/watch",
+                    "best",
+                    "%(title)s.%(ext)s",
+                    progress_hook=lambda d: seen.append(d["downloaded_bytes"]),
+                    cancel_token=token,
+                )
+        self.assertEqual(seen, [10, 20])
+
+    def test_get_video_info_retries_rate_limited_extraction(self):
+        delays = []
+        manager = DownloadManager(ydl_logger=DummyLogger(), retry=RetryScheduler(sleep=delays.append))
+        outcomes = [RuntimeError("HTTP Error 429: Too Many Requests"), {"id": "a", "title": "Clip"}]
+
+        class FlakyYDL:
+            def __init__(self, _opts):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc):
+                return False
+
+            def extract_info(self, _url, download=False):
+                outcome = outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+        with patch("yt_dlp.YoutubeDL", FlakyYDL):
+            entries = manager.get_video_info("https://video.example/watch")
+        self.assertEqual(entries, [{"id": "a", "title": "Clip"}])
+        self.assertEqual(len(delays), 1)
+
+    def _auth_walled_ydl(self, seen_opts):
+        class AuthWalledYDL:
+            def __init__(self, opts):
+                self.opts = opts
+                seen_opts.append(dict(opts))
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc):
+                return False
+
+            def extract_info(self, _url, download=False):
+                cookiefile = self.opts.get("cookiefile")
+                if cookiefile and os.path.isfile(cookiefile):
+                    return {"id": "a", "title": "Members clip"}
+                raise RuntimeError("Sign in to confirm you're not a bot")
+
+        return AuthWalledYDL
+
+    def test_get_video_info_extracts_only_with_probed_browser_jar(self):
+        class FakeJar:
+            def save(self, path):
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write("# Netscape HTTP Cookie File\n")
+
+        class FakeProber:
+            def probe(self, _url, browsers):
+                self.browsers = list(browsers)
+                yield CookieProbeResult("edge", error=PermissionError("DPAPI"))
+                yield CookieProbeResult("chrome", jar=FakeJar(), site_cookies=3, verified=True)
+
+        prober = FakeProber()
+        manager = DownloadManager(ydl_logger=DummyLogger(), cookie_prober=prober)
+        seen_opts = []
+        with patch.object(manager, "_running_browsers", return_value=[]), patch(
+            "yt_dlp.YoutubeDL", self._auth_walled_ydl(seen_opts)
+        ):
+            entries = manager.get_video_info("https://video.example/watch")
+        self.assertEqual(entries, [{"id": "a", "title": "Members clip"}])
+        self.assertEqual(prober.browsers, ["edge", "chrome", "brave", "firefox"])
+        # One plain attempt, then a single full extraction with the winning jar.
+        self.assertEqual(len(seen_opts), 2)
+        self.assertNotIn("cookiesfrombrowser", seen_opts[1])
+        self.assertFalse(os.path.exists(seen_opts[1]["cookiefile"]))
+        self.assertEqual(manager.last_cookies_browser, "chrome")
+
+    def test_sequential_cookie_probe_mode_tries_each_browser(self):
+        manager = DownloadManager(ydl_logger=DummyLogger(), dev_defaults={"browser_cookie_probe": "sequential"})
+        seen_opts = []
+        with patch.object(manager, "_running_browsers", return_value=[]), patch(
+            "yt_dlp.YoutubeDL", self._auth_walled_ydl(seen_opts)
+        ):
+            with self.assertRaises(CookiesRequiredError):
+                manager.get_video_info("https://video.example/watch")
+        browsers = [opts["cookiesfrombrowser"][0] for opts in seen_opts[1:]]
+        self.assertEqual(browsers, ["edge", "chrome", "brave", "firefox"])
+
+    def test_get_video_info_starts_with_remembered_browser_cookies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profiles = SiteProfileStore(os.path.join(tmp, "site-profiles.json"))
+            profiles.record_success("https://video.example/old", STRATEGY_YTDLP, 5.0, "browser:firefox")
+            manager = DownloadManager(ydl_logger=DummyLogger(), site_profiles=profiles)
+            seen_opts = []
+
+            class BrowserOnlyYDL:
+                def __init__(self, opts):
+                    seen_opts.append(opts)
+
+                def __enter__(self):
+                    return self
+
+                def __exit__(self, *_exc):
+                    return False
+
+                def extract_info(self, _url, download=False):
+                    return {"id": "a"}
+
+            with patch("yt_dlp.YoutubeDL", BrowserOnlyYDL):
+                manager.get_video_info("https://video.example/watch")
+        self.assertEqual([opts.get("cookiesfrombrowser") for opts in seen_opts], [("firefox",)])
+        self.assertEqual(manager.cookie_source(), "browser:firefox")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from link2vid.core.environment import EnvironmentProbe
+
+
+class TestEnvironmentProbe(unittest.TestCase):
+    def test_which_is_cached_until_binary_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            binary = Path(tmp) / "ffmpeg"
+            binary.write_text("stub", encoding="utf-8")
+            calls = []
+
+            def which(name):
+                calls.append(name)
+                return str(binary)
+
+            probe = EnvironmentProbe(which=which, list_browsers=lambda: [])
+            self.assertEqual(probe.which("ffmpeg"), str(binary))
+            self.assertEqual(probe.which("ffmpeg"), str(binary))
+            self.assertEqual(len(calls), 1)
+
+            stat = binary.stat()
+            os.utime(binary, (stat.st_atime, stat.st_mtime + 10))
+            probe.which("ffmpeg")
+            self.assertEqual(len(calls), 2)
+
+    def test_missing_binary_is_reprobed_when_path_changes(self):
+        calls = []
+
+        def which(name):
+            calls.append(name)
+            return None
+
+        probe = EnvironmentProbe(which=which, list_browsers=lambda: [])
+        with patch.dict(os.environ, {"PATH": "/a"}):
+            self.assertIsNone(probe.which("deno"))
+            self.assertIsNone(probe.which("deno"))
+        self.assertEqual(len(calls), 1)
+        with patch.dict(os.environ, {"PATH": "/b"}):
+            probe.which("deno")
+        self.assertEqual(len(calls), 2)
+
+    def test_start_publishes_snapshot_to_subscribers(self):
+        paths = {"ffmpeg": "/bin/ffmpeg", "node": "/bin/node", "qjs": "/bin/qjs"}
+        probe = EnvironmentProbe(which=paths.get, list_browsers=lambda: ["firefox"])
+        seen = []
+        probe.subscribe(seen.append)
+        probe.start()
+        snapshot = probe.snapshot(wait=True, timeout=5)
+
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(snapshot.ffmpeg_path, "/bin/ffmpeg")
+        self.assertIsNone(snapshot.ffprobe_path)
+        self.assertEqual(snapshot.js_runtime_names, ["node", "quickjs"])
+        self.assertEqual(snapshot.preferred_js_runtime(), ("node", "/bin/node"))
+        self.assertEqual(snapshot.running_browsers, ("firefox",))
+        self.assertEqual(seen, [snapshot])
+
+    def test_browser_list_is_cached_for_ttl(self):
+        calls = []
+        probe = EnvironmentProbe(which=lambda _name: None, list_browsers=lambda: calls.append(1) or ["edge"])
+        self.assertEqual(probe.browsers(), ["edge"])
+        self.assertEqual(probe.browsers(), ["edge"])
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,22 @@
 import unittest
 
-from link2vid.core.error_classification import classify_error, get_error_guidance
+from link2vid.core.error_classification import (
+    classify_error,
+    get_error_guidance,
+    is_auth_error,
+    is_no_video_error,
+)
+
+
+class _HttpError(Exception):
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.status = status
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
 
 
 class TestErrorClassification(unittest.TestCase):
@@ -26,6 +42,40 @@ class TestErrorClassification(unittest.TestCase):
                 if expected != "unknown":
                     self.assertTrue(hint)
 
+    def test_structured_status_beats_generic_text(self):
+        self.assertEqual(classify_error(_HttpError("Unable to download webpage", 429))[0], "network/rate-limit")
+        self.assertEqual(classify_error(_HttpError("bad gateway", 502))[0], "network/rate-limit")
+        wrapped = RuntimeError("extractor failed")
+        wrapped.__cause__ = _HttpError("nope", 403)
+        self.assertEqual(classify_error(wrapped)[0], "cookies/auth")
+        requests_style = Exception("request failed")
+        requests_style.response = _Response(401)
+        self.assertEqual(classify_error(requests_style)[0], "cookies/auth")
+        self.assertEqual(classify_error(TimeoutError("read"))[0], "network/rate-limit")
+
+    def test_error_raised_while_handling_another_keeps_its_own_reason(self):
+        try:
+            try:
+                raise TimeoutError("read timed out")
+            except TimeoutError:
+                raise RuntimeError("Sign in to confirm you're not a bot")
+        except RuntimeError as err:
+            self.assertIsInstance(err.__context__, TimeoutError)
+            self.assertEqual(classify_error(err)[0], "cookies/auth")
+
+    def test_specific_text_beats_status(self):
+        err = _HttpError("n challenge solving failed", 403)
+        self.assertEqual(classify_error(err)[0], "js runtime")
+
+    def test_shared_predicates(self):
+        self.assertTrue(is_auth_error("Sign in to confirm you're not a bot"))
+        self.assertTrue(is_auth_error(_HttpError("denied", 403)))
+        self.assertFalse(is_auth_error("Failed to decrypt with DPAPI"))
+        self.assertTrue(is_auth_error("Failed to decrypt with DPAPI", include_cookie_store=True))
+        self.assertFalse(is_auth_error("HTTP Error 429: Too Many Requests"))
+        self.assertTrue(is_no_video_error(RuntimeError("ERROR: No video formats found!")))
+        self.assertFalse(is_no_video_error("HTTP Error 404"))
+
     def test_error_guidance_for_js_runtime(self):
         guidance = get_error_guidance("n challenge solving failed")
         self.assertIsNotNone(guidance)
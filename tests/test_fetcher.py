@@ -1,8 +1,11 @@
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 from link2vid.core.errors import CookiesRequiredError
 from link2vid.core.fetcher import FetchError, FetchResults, NeedsCookies, NeedsSelenium, VideoFetcher
+from link2vid.core.site_profiles import STRATEGY_DIRECT_MEDIA, STRATEGY_SELENIUM, STRATEGY_YTDLP, SiteProfileStore
 from tests.fixtures.hosts import AUTH_HOST_A, VIDEO_HOST_A
 
 
@@ -75,5 +78,58 @@ class TestFetcher(unittest.TestCase):
         extractor.assert_called_once()
 
 
+class TestFetcherSiteProfiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.profiles = SiteProfileStore(Path(self.tmp.name) / "site-profiles.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_ytdlp_success_with_cookie_source(self):
+        fetcher = VideoFetcher(
+            get_video_info=lambda *_: [{"title": "ok"}],
+            site_profiles=self.profiles,
+            cookie_source=lambda: "browser:firefox",
+        )
+        fetcher.fetch(f"https://{VIDEO_HOST_A}/video")
+        profile = self.profiles.get(f"https://{VIDEO_HOST_A}/other")
+        self.assertEqual((profile.strategy, profile.cookie_source), (STRATEGY_YTDLP, "browser:firefox"))
+
+    def test_known_scanner_runs_before_ytdlp(self):
+        url = f"https://{VIDEO_HOST_A}/video"
+        self.profiles.record_success(url, STRATEGY_DIRECT_MEDIA, 1.0)
+        calls = []
+        fetcher = VideoFetcher(get_video_info=lambda *_: calls.append("ytdlp") or [], site_profiles=self.profiles)
+        with patch("link2vid.core.fetcher.scan_direct_media_entries", return_value=[{"title": "mp4"}]):
+            outcome = fetcher.fetch(url)
+        self.assertIsInstance(outcome, FetchResults)
+        self.assertEqual(outcome.strategy, STRATEGY_DIRECT_MEDIA)
+        self.assertIsNone(outcome.error)
+        self.assertEqual(calls, [])
+        self.assertEqual(self.profiles.get(url).successes, 2)
+
+    def test_stale_profile_falls_back_to_full_chain(self):
+        url = f"https://{VIDEO_HOST_A}/video"
+        self.profiles.record_success(url, STRATEGY_DIRECT_MEDIA, 1.0)
+        fetcher = VideoFetcher(get_video_info=lambda *_: [{"title": "ok"}], site_profiles=self.profiles)
+        with patch("link2vid.core.fetcher.scan_direct_media_entries", return_value=[]) as scanner:
+            outcome = fetcher.fetch(url)
+        self.assertIsInstance(outcome, FetchResults)
+        scanner.assert_called_once()
+        self.assertEqual(self.profiles.get(url).strategy, STRATEGY_YTDLP)
+
+    def test_remembered_selenium_skips_scanners(self):
+        url = f"https://{VIDEO_HOST_A}/video"
+        self.profiles.record_success(url, STRATEGY_SELENIUM, 20.0)
+
+        def fail(*_args):
+            raise AssertionError("yt-dlp should not run")
+
+        outcome = VideoFetcher(get_video_info=fail, site_profiles=self.profiles).fetch(url)
+        self.assertIsInstance(outcome, NeedsSelenium)
+        self.assertTrue(outcome.remembered)
+
+
 if __name__ == "__main__":
     unittest.main()
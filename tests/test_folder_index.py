@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from link2vid.core.folder_index import FolderIndex
+
+
+class TestFolderIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.folder = self._tmpdir.name
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def _write(self, name, mtime, data=b"x"):
+        path = os.path.join(self.folder, name)
+        with open(path, "wb") as handle:
+            handle.write(data)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_recent_and_newest_are_ordered_by_mtime(self):
+        self._write("old.mp4", 1000)
+        self._write("mid.mp4", 2000)
+        self._write("new.mp4", 3000)
+        index = FolderIndex(self.folder)
+        self.assertEqual([os.path.basename(e.path) for e in index.recent(2000)], ["mid.mp4", "new.mp4"])
+        self.assertEqual([os.path.basename(e.path) for e in index.newest(2)], ["new.mp4", "mid.mp4"])
+
+    def test_unchanged_folder_is_not_relisted(self):
+        self._write("a.mp4", 1000)
+        index = FolderIndex(self.folder)
+        self.assertEqual(len(index), 1)
+        with patch("link2vid.core.folder_index.os.scandir") as scandir:
+            index.recent(0)
+            index.exists(os.path.join(self.folder, "a.mp4"))
+        scandir.assert_not_called()
+
+    def test_rescan_only_stats_new_files_and_drops_removed(self):
+        self._write("a.mp4", 1000)
+        gone = self._write("b.mp4", 1000)
+        index = FolderIndex(self.folder)
+        self.assertEqual(len(index), 2)
+        os.remove(gone)
+        self._write("c.mp4", 5000)
+        os.utime(self.folder, None)
+        self.assertEqual([os.path.basename(e.path) for e in index.newest(5)], ["c.mp4", "a.mp4"])
+        self.assertFalse(index.exists(gone))
+
+    def test_record_write_updates_entry_without_rescan(self):
+        path = self._write("grow.mp4", 1000)
+        index = FolderIndex(self.folder)
+        len(index)
+        with open(path, "ab") as handle:
+            handle.write(b"more")
+        os.utime(path, (9000, 9000))
+        entry = index.record_write(path)
+        self.assertEqual(entry.size, 5)
+        self.assertEqual(index.newest(1)[0].mtime, 9000)
+
+    def test_in_place_rewrite_needs_record_write_or_forced_refresh(self):
+        path = self._write("clip.mp4", 1000)
+        index = FolderIndex(self.folder)
+        self.assertEqual(index.newest(1)[0].size, 1)
+        dir_mtime = os.stat(self.folder).st_mtime_ns
+        with open(path, "ab") as handle:
+            handle.write(b"more")
+        os.utime(path, (9000, 9000))
+        os.utime(self.folder, ns=(dir_mtime, dir_mtime))
+        with patch("link2vid.core.folder_index.os.scandir") as scandir:
+            self.assertEqual(index.recent(5000), [])
+        scandir.assert_not_called()
+        index.refresh(force=True)
+        entry = index.recent(5000)[0]
+        self.assertEqual((entry.size, entry.mtime), (5, 9000))
+
+    def test_relisting_does_not_restat_known_files(self):
+        self._write("a.mp4", 1000)
+        index = FolderIndex(self.folder)
+        self.assertEqual(len(index), 1)
+        self._write("b.mp4", 2000)
+        os.utime(self.folder, None)
+        stats = []
+        real_stat = os.DirEntry.stat
+        with patch.object(os.DirEntry, "stat", lambda item, **kw: stats.append(item.name) or real_stat(item, **kw)):
+            self.assertEqual(len(index), 2)
+        self.assertEqual(stats, ["b.mp4"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,13 @@
 import unittest
 from unittest.mock import MagicMock, patch
 
+from link2vid.core.cancellation import CancelToken
+from link2vid.core.errors import DownloadCancelledError
+from link2vid.core.hls import HlsVariantPolicy
 from link2vid.core.helpers import (
+    FfmpegProgressReader,
     download_with_ffmpeg,
+    hls_playlist_cache,
     parse_ffmpeg_progress_ms,
     parse_ffmpeg_time_seconds,
     probe_media_duration,
@@ -21,8 +26,52 @@ class TestFfmpegProgressParsing(unittest.TestCase):
     def test_parse_ffmpeg_progress_ms(self):
         self.assertAlmostEqual(parse_ffmpeg_progress_ms("out_time_ms=83450"), 83.45)
 
+    def test_progress_reader_emits_once_per_block(self):
+        reader = FfmpegProgressReader(tail_lines=5)
+        block = [
+            "frame=10\n",
+            "out_time_us=83450000\n",
+            "out_time_ms=83450000\n",
+            "out_time=00:01:23.450000\n",
+            "speed=2.0x\n",
+        ]
+        self.assertEqual([reader.feed(line) for line in block], [None] * len(block))
+        self.assertAlmostEqual(reader.feed("progress=continue\n"), 83.45)
+        self.assertIsNone(reader.feed("progress=continue\n"))
+        self.assertFalse(reader.finished)
+        reader.feed("out_time=N/A\n")
+        self.assertIsNone(reader.feed("progress=end\n"))
+        self.assertTrue(reader.finished)
+        self.assertEqual(len(reader.tail), 5)
+        self.assertTrue(reader.tail_text().endswith("progress=end"))
+
+
+def _master_playlist(*, separate_audio):
+    def variant(uri, bandwidth, resolution):
+        media = [MagicMock(type="AUDIO", uri="audio/en.m3u8")] if separate_audio else []
+        return MagicMock(uri=uri, media=media, stream_info=MagicMock(bandwidth=bandwidth, resolution=resolution))
+
+    return MagicMock(
+        is_variant=True,
+        playlists=[
+            variant("2160.m3u8", 16_000_000, (3840, 2160)),
+            variant("720.m3u8", 3_000_000, (1280, 720)),
+            variant("480.m3u8", 1_200_000, (854, 480)),
+        ],
+    )
+
+
+def _finished_proc():
+    proc = MagicMock()
+    proc.stdout = iter(["out_time_us=50000000\n", "progress=end\n"])
+    proc.returncode = 0
+    return proc
+
 
 class TestDownloadWithFfmpeg(unittest.TestCase):
+    def setUp(self):
+        hls_playlist_cache.clear()
+
     @patch("link2vid.core.helpers.os.path.isfile", return_value=True)
     @patch("link2vid.core.helpers.os.path.getsize", return_value=1024)
     @patch("link2vid.core.helpers.probe_media_duration", return_value=100.0)
@@ -82,6 +131,78 @@ class TestDownloadWithFfmpeg(unittest.TestCase):
         with self.assertRaisesRegex(RuntimeError, "ffmpeg failed"):
             download_with_ffmpeg("https://cdn.example.com/playlist.m3u8", "out.mp4")
 
+    @patch("link2vid.core.helpers.os.path.isfile", return_value=True)
+    @patch("link2vid.core.helpers.os.path.getsize", return_value=1024)
+    @patch("link2vid.core.helpers.subprocess.run")
+    @patch("link2vid.core.helpers.m3u8.load")
+    @patch("link2vid.core.helpers.subprocess.Popen")
+    def test_download_with_ffmpeg_reuses_probed_playlist(self, popen_mock, load_mock, run_mock, _size, _exists):
+        master = _master_playlist(separate_audio=False)
+        media = MagicMock(is_variant=False, segments=[MagicMock(duration=60.0), MagicMock(duration=40.0)])
+        load_mock.side_effect = lambda url, headers=None: master if url.endswith("master.m3u8") else media
+        popen_mock.return_value = _finished_proc()
+        seen: list[float] = []
+
+        download_with_ffmpeg(
+            "https://cdn.example.com/master.m3u8",
+            "out.mp4",
+            progress_hook=lambda fraction, _elapsed, _duration: seen.append(fraction),
+            variant_policy=HlsVariantPolicy(max_height=720),
+        )
+
+        self.assertEqual(load_mock.call_count, 2)
+        run_mock.assert_not_called()
+        cmd = popen_mock.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("-i") + 1], "https://cdn.example.com/720.m3u8")
+        self.assertNotIn("-map", cmd)
+        self.assertTrue(any(0.49 <= value < 1.0 for value in seen))
+
+    @patch("link2vid.core.helpers.os.path.isfile", return_value=True)
+    @patch("link2vid.core.helpers.os.path.getsize", return_value=1024)
+    @patch("link2vid.core.helpers.m3u8.load")
+    @patch("link2vid.core.helpers.subprocess.Popen")
+    def test_download_with_ffmpeg_maps_program_for_separate_audio(self, popen_mock, load_mock, _size, _exists):
+        master = _master_playlist(separate_audio=True)
+        media = MagicMock(is_variant=False, segments=[MagicMock(duration=100.0)])
+        load_mock.side_effect = lambda url, headers=None: master if url.endswith("master.m3u8") else media
+        popen_mock.return_value = _finished_proc()
+
+        download_with_ffmpeg(
+            "https://cdn.example.com/master.m3u8",
+            "out.mp4",
+            variant_policy=HlsVariantPolicy(max_height=720),
+        )
+
+        cmd = popen_mock.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("-i") + 1], "https://cdn.example.com/master.m3u8")
+        self.assertEqual(cmd[cmd.index("-map") + 1], "0:p:1")
+
+    @patch("link2vid.core.helpers.os.remove")
+    @patch("link2vid.core.helpers.terminate_process_group")
+    @patch("link2vid.core.helpers.probe_media_duration", return_value=100.0)
+    @patch("link2vid.core.helpers.subprocess.Popen")
+    def test_download_with_ffmpeg_cancel_terminates_and_removes_output(self, popen_mock, _duration, terminate_mock, remove_mock):
+        token = CancelToken()
+
+        def stdout():
+            yield "out_time_us=10000000\n"
+            yield "progress=continue\n"
+            token.cancel()
+            yield "progress=end\n"
+
+        proc = MagicMock()
+        proc.stdout = stdout()
+        proc.returncode = 255
+        popen_mock.return_value = proc
+
+        with self.assertRaises(DownloadCancelledError):
+            download_with_ffmpeg("https://cdn.example.com/clip.mp4", "out.mp4", cancel_token=token)
+
+        terminate_mock.assert_any_call(proc)
+        remove_mock.assert_called_once_with("out.mp4")
+        kwargs = popen_mock.call_args.kwargs
+        self.assertTrue(kwargs.get("start_new_session") or kwargs.get("creationflags"))
+
     @patch("link2vid.core.helpers.m3u8.load")
     def test_probe_media_duration_sums_hls_segments(self, load_mock):
         segment = MagicMock(duration=120.0)
@@ -24,6 +24,11 @@ class TestFilenameHelpers(unittest.TestCase):
             self.assertTrue(second.endswith("Workshop Replay (2).mp4"))
             self.assertNotEqual(first, second)
 
+    def test_unique_output_path_uses_custom_exists(self):
+        taken = {"/out/Clip.mp4", "/out/Clip (2).mp4"}
+        path = unique_output_path("/out", "Clip", "mp4", exists=taken.__contains__)
+        self.assertEqual(path, "/out/Clip (3).mp4")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from types import SimpleNamespace
+
+from link2vid.core.hls import (
+    HLS_BEST_FORMAT,
+    HlsPlaylistCache,
+    HlsVariant,
+    HlsVariantPolicy,
+    hls_format_options,
+    parse_hls_format,
+    select_hls_variant,
+    variants_from_playlist,
+)
+
+
+def _variants():
+    return [
+        HlsVariant(bandwidth_kbps=1200, resolution=(854, 480), uri="https://cdn.example/480.m3u8"),
+        HlsVariant(bandwidth_kbps=16000, resolution=(3840, 2160), uri="https://cdn.example/2160.m3u8"),
+        HlsVariant(bandwidth_kbps=3000, resolution=(1280, 720), uri="https://cdn.example/720.m3u8"),
+        HlsVariant(bandwidth_kbps=2200, resolution=(1280, 720), uri="https://cdn.example/720-low.m3u8"),
+    ]
+
+
+class TestHlsVariantSelection(unittest.TestCase):
+    def test_uncapped_policy_picks_highest(self):
+        self.assertEqual(select_hls_variant(_variants()).resolution, (3840, 2160))
+
+    def test_height_cap_picks_best_bitrate_at_or_below_cap(self):
+        chosen = select_hls_variant(_variants(), HlsVariantPolicy(max_height=720))
+        self.assertEqual(chosen.uri, "https://cdn.example/720.m3u8")
+
+    def test_bitrate_cap(self):
+        chosen = select_hls_variant(_variants(), HlsVariantPolicy(max_bandwidth_kbps=2500))
+        self.assertEqual(chosen.uri, "https://cdn.example/720-low.m3u8")
+
+    def test_falls_back_to_smallest_when_nothing_fits(self):
+        chosen = select_hls_variant(_variants(), HlsVariantPolicy(max_height=240))
+        self.assertEqual(chosen.resolution, (854, 480))
+
+    def test_parse_hls_format(self):
+        self.assertEqual(parse_hls_format(HLS_BEST_FORMAT), HlsVariantPolicy())
+        self.assertEqual(parse_hls_format("hls-720"), HlsVariantPolicy(max_height=720))
+        self.assertEqual(parse_hls_format("hls-2500k"), HlsVariantPolicy(max_bandwidth_kbps=2500))
+        self.assertIsNone(parse_hls_format("bestvideo+bestaudio/best"))
+        self.assertIsNone(parse_hls_format(None))
+
+    def test_format_options_follow_known_heights(self):
+        formats = [option["format"] for option in hls_format_options(_variants())]
+        self.assertEqual(formats, [HLS_BEST_FORMAT, "hls-720", "hls-480"])
+        generic = [option["format"] for option in hls_format_options(None)]
+        self.assertEqual(generic[0], HLS_BEST_FORMAT)
+        self.assertIn("hls-720", generic)
+
+    def test_variants_from_playlist_absolutizes_uris(self):
+        playlist = SimpleNamespace(
+            playlists=[
+                SimpleNamespace(uri="v/720.m3u8", stream_info=SimpleNamespace(bandwidth=3_000_000, resolution=(1280, 720))),
+                SimpleNamespace(uri="https://other.example/a.m3u8", stream_info=SimpleNamespace(bandwidth=None, resolution=None)),
+            ]
+        )
+        variants = variants_from_playlist(playlist, "https://cdn.example/path/master.m3u8")
+        self.assertEqual(variants[0].uri, "https://cdn.example/path/v/720.m3u8")
+        self.assertEqual(variants[0].bandwidth_kbps, 3000)
+        self.assertEqual(variants[0].height, 720)
+        self.assertEqual(variants[1].uri, "https://other.example/a.m3u8")
+        self.assertIsNone(variants[1].height)
+
+
+class TestHlsPlaylistCache(unittest.TestCase):
+    def test_resolve_loads_master_and_media_once(self):
+        master = SimpleNamespace(
+            is_variant=True,
+            playlists=[
+                SimpleNamespace(uri="hi.m3u8", stream_info=SimpleNamespace(bandwidth=8_000_000, resolution=(1920, 1080))),
+                SimpleNamespace(uri="lo.m3u8", stream_info=SimpleNamespace(bandwidth=2_000_000, resolution=(1280, 720))),
+            ],
+        )
+        media = SimpleNamespace(is_variant=False, segments=[SimpleNamespace(duration=6.0)] * 10)
+        loaded = []
+
+        def load(url, headers):
+            loaded.append(url)
+            return master if url.endswith("master.m3u8") else media
+
+        cache = HlsPlaylistCache(load)
+        policy = HlsVariantPolicy(max_height=720)
+        first = cache.resolve("https://cdn.example/master.m3u8", {"Referer": "x"}, policy)
+        second = cache.resolve("https://cdn.example/master.m3u8", {"Referer": "x"}, policy)
+
+        self.assertIs(first, second)
+        self.assertEqual(loaded, ["https://cdn.example/master.m3u8", "https://cdn.example/lo.m3u8"])
+        self.assertEqual(first.duration, 60.0)
+        self.assertEqual(first.ffmpeg_input(), ("https://cdn.example/lo.m3u8", []))
+        self.assertIsNone(cache.get("https://cdn.example/master.m3u8", {}, policy))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from link2vid.ui.components.log_drawer import LogBuffer
+
+
+class TestLogBuffer(unittest.TestCase):
+    def test_first_batch_renders_everything(self):
+        buffer = LogBuffer(max_lines=5)
+        buffer.append("a")
+        buffer.append("b")
+        batch = buffer.take_batch()
+        self.assertTrue(batch.replace)
+        self.assertEqual(batch.text, "a\nb\n")
+        self.assertIsNone(buffer.take_batch())
+
+    def test_pending_lines_arrive_in_one_batch_and_trim_overflow(self):
+        buffer = LogBuffer(max_lines=3)
+        buffer.append("a")
+        buffer.append("b")
+        buffer.take_batch()
+        buffer.append("c")
+        buffer.append("d")
+        batch = buffer.take_batch()
+        self.assertFalse(batch.replace)
+        self.assertEqual(batch.text, "c\nd\n")
+        self.assertEqual(batch.trim_lines, 1)
+        self.assertEqual(list(buffer.lines), ["b", "c", "d"])
+
+    def test_backlog_larger_than_cap_becomes_full_replace(self):
+        buffer = LogBuffer(max_lines=3)
+        buffer.take_batch()
+        for index in range(10):
+            buffer.append(str(index))
+        batch = buffer.take_batch()
+        self.assertTrue(batch.replace)
+        self.assertEqual(batch.text, "7\n8\n9\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
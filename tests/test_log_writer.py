@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from link2vid.core.log_writer import BufferedLogWriter
+
+
+class TestBufferedLogWriter(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = str(Path(self._tmpdir.name) / "debug.log")
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_write_does_not_touch_file_until_flush(self):
+        writer = BufferedLogWriter(self.path, flush_interval=60)
+        try:
+            writer.write("first")
+            self.assertFalse(os.path.exists(self.path))
+            self.assertTrue(writer.flush())
+            self.assertEqual(Path(self.path).read_text(encoding="utf-8"), "first\n")
+        finally:
+            writer.close()
+
+    def test_close_flushes_pending_lines(self):
+        writer = BufferedLogWriter(self.path, flush_interval=60)
+        for index in range(100):
+            writer.write(f"line {index}")
+        writer.close()
+        lines = Path(self.path).read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[0], "line 0")
+        self.assertEqual(len(lines), 100)
+        writer.write("after close")
+        self.assertEqual(len(Path(self.path).read_text(encoding="utf-8").splitlines()), 100)
+
+    def test_full_buffer_drops_oldest_lines_with_marker(self):
+        writer = BufferedLogWriter(self.path, flush_interval=60, max_buffered_lines=3)
+        for index in range(5):
+            writer.write(f"line {index}")
+        writer.close()
+        lines = Path(self.path).read_text(encoding="utf-8").splitlines()
+        self.assertIn("2 line(s) dropped", lines[0])
+        self.assertEqual(lines[1:], ["line 2", "line 3", "line 4"])
+
+    def test_rotates_when_file_exceeds_max_bytes(self):
+        Path(self.path).write_text("x" * 200, encoding="utf-8")
+        writer = BufferedLogWriter(self.path, flush_interval=60, max_bytes=100)
+        writer.write("fresh")
+        writer.close()
+        self.assertEqual(Path(self.path).read_text(encoding="utf-8"), "fresh\n")
+        self.assertEqual(len(Path(f"{self.path}.1").read_text(encoding="utf-8")), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,6 +13,7 @@ REQUIRED_HIDDENIMPORTS = {
     "m3u8",
     "selenium",
     "requests",
+    "httpx",
 }
 
 REQUIRED_COLLECT_ALL = {
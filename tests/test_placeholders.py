@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+
+from link2vid.ui import placeholders
+from link2vid.ui.placeholders import PlaceholderCache, render_vertical_gradient
+
+STYLES = {
+    "site_a": ("Site", ("#1f2937", "#0ea5e9")),
+    "default": ("Video", ("#4b5563", "#9ca3af")),
+}
+
+
+class TestPlaceholders(unittest.TestCase):
+    def test_gradient_runs_from_start_to_end_color(self):
+        image = render_vertical_gradient((120, 72), ("#000000", "#ffffff"))
+        self.assertEqual(image.size, (120, 72))
+        self.assertLess(image.getpixel((0, 0))[0], 10)
+        self.assertGreater(image.getpixel((0, 71))[0], 245)
+
+    def test_cache_renders_each_placeholder_once(self):
+        made = []
+        cache = PlaceholderCache(STYLES, make_image=lambda image, size: made.append(size) or object())
+        with patch.object(placeholders, "render_placeholder", wraps=placeholders.render_placeholder) as render:
+            first = [cache.get("site_a", (120, 72)) for _ in range(20)]
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(len(made), 1)
+        self.assertTrue(all(image is first[0] for image in first))
+
+    def test_unknown_source_label_shares_default_entry(self):
+        cache = PlaceholderCache(STYLES, make_image=lambda image, _size: image)
+        self.assertIs(cache.get("missing", (120, 72)), cache.get("default", (120, 72)))
+
+    def test_theme_is_part_of_the_key(self):
+        theme = ["Dark"]
+        cache = PlaceholderCache(STYLES, make_image=lambda image, _size: object(), get_theme=lambda: theme[0])
+        dark = cache.get("site_a", (120, 72))
+        theme[0] = "Light"
+        self.assertIsNot(cache.get("site_a", (120, 72)), dark)
+
+    def test_prewarm_renders_every_style(self):
+        cache = PlaceholderCache(STYLES, make_image=lambda image, _size: image)
+        self.assertEqual(cache.prewarm((120, 72)), len(STYLES))
+        with patch.object(placeholders, "render_placeholder") as render:
+            cache.get_pil("site_a", (120, 72))
+        render.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from email.utils import formatdate
+from types import SimpleNamespace
+
+from link2vid.core.cancellation import CancelToken
+from link2vid.core.errors import DownloadCancelledError
+from link2vid.core.retry import HostCooldowns, RetryPolicy, RetryScheduler, parse_retry_after, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _scheduler(clock, **policy):
+    return RetryScheduler(
+        RetryPolicy(**policy),
+        cooldowns=HostCooldowns(clock=clock),
+        sleep=clock.sleep,
+        rng=lambda: 0.0,
+    )
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_parse_seconds_and_http_date(self):
+        self.assertEqual(parse_retry_after("30"), 30.0)
+        self.assertAlmostEqual(parse_retry_after(formatdate(1_000_120, usegmt=True), now=1_000_000), 120.0)
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_found_on_wrapped_response(self):
+        inner = Exception("HTTP Error 429: Too Many Requests")
+        inner.response = SimpleNamespace(headers={"Retry-After": "7"})
+        outer = Exception("ERROR: unable to download")
+        outer.exc_info = (type(inner), inner, None)
+        self.assertEqual(retry_after_seconds(outer), 7.0)
+
+
+class TestRetryScheduler(unittest.TestCase):
+    def test_retries_rate_limit_with_backoff_then_succeeds(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock, base_delay=2.0)
+        calls = []
+
+        def flaky():
+            calls.append(clock.now)
+            if len(calls) < 3:
+                raise RuntimeError("HTTP Error 429: Too Many Requests")
+            return "ok"
+
+        self.assertEqual(scheduler.run(flaky, url="https://video.example/a"), "ok")
+        self.assertEqual(calls, [0.0, 2.0, 6.0])
+
+    def test_honours_retry_after_and_shares_host_cooldown(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock)
+        err = RuntimeError("HTTP Error 503: Service Unavailable")
+        err.response = SimpleNamespace(headers={"Retry-After": "30"})
+        attempts = iter([err])
+
+        def once():
+            failure = next(attempts, None)
+            if failure:
+                raise failure
+            return clock.now
+
+        self.assertEqual(scheduler.run(once, url="https://www.video.example/a"), 30.0)
+        scheduler.cooldowns.extend("https://video.example/b", 10)
+        self.assertEqual(scheduler.run(lambda: clock.now, url="https://video.example/c"), 40.0)
+
+    def test_non_transient_errors_are_not_retried(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock)
+        calls = []
+
+        def forbidden():
+            calls.append(1)
+            raise RuntimeError("HTTP Error 403: Forbidden")
+
+        with self.assertRaises(RuntimeError):
+            scheduler.run(forbidden, url="https://video.example/a")
+        self.assertEqual(len(calls), 1)
+
+    def test_gives_up_after_max_attempts(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock, max_attempts=2)
+        calls = []
+
+        def always():
+            calls.append(1)
+            raise RuntimeError("connection reset")
+
+        with self.assertRaises(RuntimeError):
+            scheduler.run(always, url="https://video.example/a")
+        self.assertEqual(len(calls), 2)
+
+    def test_cancelled_failure_is_not_retried(self):
+        token = CancelToken()
+        scheduler = RetryScheduler(RetryPolicy(base_delay=30.0), rng=lambda: 0.0)
+
+        def fail():
+            token.cancel()
+            raise RuntimeError("timed out")
+
+        with self.assertRaises(DownloadCancelledError):
+            scheduler.run(fail, url="https://video.example/a", cancel_token=token)
+
+    def test_cancel_interrupts_cooldown_wait(self):
+        token = CancelToken()
+        token.cancel()
+        scheduler = RetryScheduler()
+        scheduler.cooldowns.extend("https://video.example/a", 60)
+        with self.assertRaises(DownloadCancelledError):
+            scheduler.run(lambda: "never", url="https://video.example/a", cancel_token=token)
+
+    def test_backs_off_without_a_host(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock, base_delay=2.0)
+        calls = []
+
+        def flaky():
+            calls.append(clock.now)
+            if len(calls) < 3:
+                raise RuntimeError("HTTP Error 429: Too Many Requests")
+            return "ok"
+
+        self.assertEqual(scheduler.run(flaky, url=None), "ok")
+        self.assertEqual(calls, [0.0, 2.0, 6.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -94,6 +94,23 @@ class TestRuntime(unittest.TestCase):
                         self.assertIn("developer.json=", summary)
                         self.assertIn(str(paths["app_dir"] / "developer.json"), summary)
 
+    def test_startup_report_lists_phases_and_imports(self):
+        with mock.patch.object(runtime, "_startup_phases", []), mock.patch.object(runtime, "_import_times", []):
+            runtime.mark_startup_phase("bootstrap")
+            runtime.timed_import("json")
+            runtime.mark_startup_phase("imports")
+            report = "\n".join(runtime.startup_report())
+        self.assertIn("bootstrap: +", report)
+        self.assertIn("imports: +", report)
+        self.assertIn("import times:", report)
+        self.assertIn("json:", report)
+
+    def test_user_data_dir_follows_platform_conventions(self):
+        with mock.patch.object(sys, "platform", "win32"), mock.patch.dict(os.environ, {"LOCALAPPDATA": "C:/Users/a/AppData/Local"}):
+            self.assertEqual(runtime.user_data_dir(), Path("C:/Users/a/AppData/Local") / "Link2Vid")
+        with mock.patch.object(sys, "platform", "linux"), mock.patch.dict(os.environ, {"XDG_DATA_HOME": "/data"}):
+            self.assertEqual(runtime.user_data_dir(), Path("/data/link2vid"))
+
 
 class tempfile_dev_json:
     def __init__(self, cwd=True, app_dir=True, appdata=True):
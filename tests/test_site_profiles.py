@@ -0,0 +1,53 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from link2vid.core.site_profiles import STRATEGY_HLS, STRATEGY_YTDLP, SiteProfileStore
+
+
+class TestSiteProfiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "nested" / "site-profiles.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_record_persists_per_domain(self):
+        store = SiteProfileStore(self.path, clock=lambda: 100.0)
+        store.record_success("https://www.video.example/watch/1", STRATEGY_YTDLP, 3.456, "browser:chrome")
+        store.record_success("https://video.example/watch/2", STRATEGY_YTDLP, 2.0, "browser:chrome")
+
+        profile = SiteProfileStore(self.path).get("https://video.example:443/other")
+        self.assertEqual(profile.strategy, STRATEGY_YTDLP)
+        self.assertEqual(profile.seconds, 2.0)
+        self.assertEqual(profile.successes, 2)
+        self.assertEqual(profile.cookie_browser, "chrome")
+        self.assertIsNone(SiteProfileStore(self.path).get("https://elsewhere.example/"))
+
+    def test_new_strategy_replaces_and_forget_drops(self):
+        store = SiteProfileStore(self.path)
+        store.record_success("https://video.example/a", STRATEGY_YTDLP, 1.0)
+        store.record_success("https://video.example/b", STRATEGY_HLS, 4.0)
+        profile = store.get("https://video.example/c")
+        self.assertEqual((profile.strategy, profile.successes, profile.cookie_browser), (STRATEGY_HLS, 1, None))
+
+        store.forget("https://video.example/c")
+        self.assertIsNone(SiteProfileStore(self.path).get("https://video.example/c"))
+
+    def test_unreadable_or_unknown_entries_are_ignored(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text(
+            json.dumps({"sites": {"a.example": {"strategy": "teleport", "seconds": 1}, "b.example": "junk"}}),
+            encoding="utf-8",
+        )
+        self.assertIsNone(SiteProfileStore(self.path).get("https://a.example/"))
+        self.path.write_text("{not json", encoding="utf-8")
+        logs = []
+        self.assertIsNone(SiteProfileStore(self.path, log=logs.append).get("https://a.example/"))
+        self.assertTrue(logs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from link2vid.core.subtitles import (
+    Cue,
+    collapse_rolling_cues,
+    convert_subtitle_file,
+    cues_to_srt,
+    iter_json3_cues,
+    iter_srv3_cues,
+    parse_cues,
+)
+
+SAMPLE_VTT = """WEBVTT
+Kind: captions
+Language: en
+
+00:00:01.000 --> 00:00:02.500 align:start position:0%
+<c>Hello</c> &amp; welcome
+
+intro
+00:01:02.250 --> 00:01:04.000
+Second line
+"""
+
+ROLLING_VTT = """WEBVTT
+Kind: captions
+Language: en
+
+00:00:00.000 --> 00:00:02.000 align:start position:0%
+ 
+hello<00:00:00.500><c> there</c>
+
+00:00:02.000 --> 00:00:02.010 align:start position:0%
+hello there
+ 
+
+00:00:02.010 --> 00:00:04.000 align:start position:0%
+hello there
+how<00:00:02.500><c> are</c><00:00:03.000><c> you</c>
+
+00:00:04.000 --> 00:00:04.010 align:start position:0%
+how are you
+ 
+"""
+
+
+class TestSubtitles(unittest.TestCase):
+    def test_parse_vtt_strips_markup_and_settings(self):
+        cues = parse_cues(SAMPLE_VTT)
+        self.assertEqual([cue.text for cue in cues], ["Hello & welcome", "Second line"])
+        self.assertEqual(cues[1].start_ms, 62250)
+
+    def test_srt_output_is_numbered_with_comma_timestamps(self):
+        srt = cues_to_srt(parse_cues(SAMPLE_VTT))
+        self.assertTrue(srt.startswith("1\n00:00:01,000 --> 00:00:02,500\nHello & welcome\n"))
+        self.assertIn("2\n00:01:02,250 --> 00:01:04,000\nSecond line\n", srt)
+
+    def test_convert_file_to_text_replaces_source(self):
+        with tempfile.TemporaryDirectory() as folder:
+            source = os.path.join(folder, "Clip.transcript.en.vtt")
+            with open(source, "w", encoding="utf-8") as handle:
+                handle.write(SAMPLE_VTT)
+            target = convert_subtitle_file(source, "txt", remove_source=True)
+            self.assertEqual(target, os.path.join(folder, "Clip.transcript.en.txt"))
+            self.assertFalse(os.path.exists(source))
+            with open(target, encoding="utf-8") as handle:
+                self.assertEqual(handle.read(), "Hello & welcome\nSecond line\n")
+
+    def test_rolling_auto_captions_collapse_to_one_cue_per_line(self):
+        cues = list(collapse_rolling_cues(parse_cues(ROLLING_VTT)))
+        self.assertEqual([cue.text for cue in cues], ["hello there", "how are you"])
+        self.assertEqual((cues[0].start_ms, cues[0].end_ms), (0, 2010))
+        self.assertEqual((cues[1].start_ms, cues[1].end_ms), (2010, 4010))
+
+    def test_word_growth_replaces_pending_line_but_repeats_survive(self):
+        cues = [
+            Cue(0, 500, "so"),
+            Cue(500, 900, "so today"),
+            Cue(900, 1500, "so today we"),
+            Cue(2000, 2500, "yes"),
+            Cue(2600, 3000, "yesterday"),
+        ]
+        texts = [cue.text for cue in collapse_rolling_cues(cues)]
+        self.assertEqual(texts, ["so today we", "yes", "yesterday"])
+
+    def test_json3_events_stream_across_chunk_boundaries(self):
+        events = [{"tStartMs": index * 1000, "dDurationMs": 900, "segs": [{"utf8": f"line {index}"}]} for index in range(50)]
+        events.insert(1, {"tStartMs": 500, "aAppend": 1, "segs": [{"utf8": "\n"}]})
+        document = json.dumps({"wireMagic": "pb3", "pens": [{}], "events": events})
+        with unittest.mock.patch("link2vid.core.subtitles._JSON_CHUNK_SIZE", 37):
+            cues = list(iter_json3_cues(io.StringIO(document)))
+        self.assertEqual(len(cues), 50)
+        self.assertEqual((cues[49].start_ms, cues[49].text), (49000, "line 49"))
+
+    def test_srv3_paragraphs_join_word_segments(self):
+        document = b'<?xml version="1.0"?><timedtext format="3"><body>'
+        document += b'<p t="1000" d="2000" w="1"><s>hello</s><s t="400"> world</s></p>'
+        document += b'<p t="3000" d="10" a="1"></p></body></timedtext>'
+        cues = list(iter_srv3_cues(io.BytesIO(document)))
+        self.assertEqual([(cue.start_ms, cue.end_ms, cue.text) for cue in cues], [(1000, 3000, "hello world")])
+
+
+if __name__ == "__main__":
+    unittest.main()
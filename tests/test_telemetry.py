@@ -0,0 +1,56 @@
+import json
+import unittest
+
+from link2vid.core.fetcher import FetchResults, VideoFetcher
+from link2vid.core.telemetry import Telemetry, maybe_span
+from tests.fixtures.hosts import VIDEO_HOST_A
+
+
+class TestTelemetry(unittest.TestCase):
+    def test_span_records_duration_and_emits_jsonl(self):
+        lines = []
+        telemetry = Telemetry(sink=lines.append)
+        with telemetry.span("fetch.scan_hls", url="https://example.com") as span:
+            span["found"] = True
+
+        payload = json.loads(lines[0])
+        self.assertEqual(payload["span"], "fetch.scan_hls")
+        self.assertEqual(payload["url"], "https://example.com")
+        self.assertTrue(payload["found"])
+        self.assertIn("duration_ms", payload)
+        self.assertEqual(telemetry.stages()["fetch.scan_hls"].count, 1)
+
+    def test_span_marks_errors_and_reraises(self):
+        telemetry = Telemetry()
+        with self.assertRaises(ValueError):
+            with telemetry.span("ffprobe"):
+                raise ValueError("boom")
+        self.assertEqual(telemetry.stages()["ffprobe"].errors, 1)
+        self.assertEqual(telemetry.recent[-1].error, "ValueError")
+
+    def test_summary_lines_include_stages_and_counters(self):
+        telemetry = Telemetry()
+        telemetry.record("ytdlp.download", 2.0)
+        telemetry.record("ytdlp.download", 4.0)
+        telemetry.count("download.bytes", 2048)
+        summary = telemetry.summary_lines()
+        self.assertEqual(summary[0], "ytdlp.download: 2x avg 3000 ms, max 4000 ms, total 6.0 s")
+        self.assertIn("download.bytes = 2,048", summary)
+
+    def test_maybe_span_is_noop_without_telemetry(self):
+        with maybe_span(None, "fetch", url="x") as span:
+            span["outcome"] = "ok"
+
+    def test_fetcher_records_stage_spans(self):
+        telemetry = Telemetry()
+        fetcher = VideoFetcher(get_video_info=lambda *_: [{"title": "ok"}], telemetry=telemetry)
+        outcome = fetcher.fetch(f"https://{VIDEO_HOST_A}/video")
+        self.assertIsInstance(outcome, FetchResults)
+        stages = telemetry.stages()
+        self.assertEqual(stages["fetch"].count, 1)
+        self.assertEqual(stages["fetch.ytdlp_extract"].count, 1)
+        self.assertEqual(telemetry.recent[-1].attrs["outcome"], "FetchResults")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from link2vid.core.downloader import TranscriptDownloadResult
+from link2vid.core.errors import NoTranscriptAvailableError
+from link2vid.core.transcript_export import export_transcripts
+
+VTT = "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nhi\n"
+
+
+class TestTranscriptExport(unittest.TestCase):
+    def test_exports_with_bounded_parallelism_and_reuses_info(self):
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+        calls = []
+
+        with tempfile.TemporaryDirectory() as folder:
+            def download(url, outtmpl, info=None):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                    calls.append((url, info is not None))
+                try:
+                    if url.endswith("/none"):
+                        raise NoTranscriptAvailableError("none")
+                    path = os.path.join(folder, f"{url.rsplit('/', 1)[-1]}.en.vtt")
+                    with open(path, "w", encoding="utf-8") as handle:
+                        handle.write(VTT)
+                    return TranscriptDownloadResult(source="subtitles", languages=["en"], path=path)
+                finally:
+                    with lock:
+                        active[0] -= 1
+
+            entries = [
+                {"title": f"Video {index}", "webpage_url": f"https://v.example/{index}", "subtitles": {}}
+                for index in range(6)
+            ]
+            entries.append({"title": "Flat", "webpage_url": "https://v.example/none"})
+            entries.append({"title": "Direct", "webpage_url": "https://cdn.example/a.m3u8", "_ffmpeg_headers": {}})
+            progress = []
+            items = export_transcripts(
+                download,
+                entries,
+                folder,
+                output_format="txt",
+                max_workers=2,
+                on_item=lambda _item, done, total: progress.append((done, total)),
+            )
+            saved = [item for item in items if item.status == "saved"]
+            self.assertEqual(len(saved), 6)
+            self.assertTrue(all(item.path.endswith(".en.txt") for item in saved))
+            self.assertEqual(sorted(os.listdir(folder))[0], "0.en.txt")
+
+        self.assertLessEqual(peak[0], 2)
+        self.assertEqual(len(calls), 7)
+        self.assertIn(("https://v.example/none", False), calls)
+        self.assertEqual([item.status for item in items if item.title == "Flat"], ["unavailable"])
+        self.assertEqual(progress[-1], (7, 7))
+
+    def test_manual_subtitles_are_not_collapsed_but_auto_captions_are(self):
+        manual = (
+            "WEBVTT\n\n"
+            "00:00:00.000 --> 00:00:01.000\nNo.\n\n"
+            "00:00:01.000 --> 00:00:02.000\nNo.\n\n"
+            "00:00:02.000 --> 00:00:03.000\nI said stop\n\n"
+            "00:00:03.000 --> 00:00:04.000\nLine A\nLine B\n\n"
+            "00:00:04.000 --> 00:00:05.000\nLine B\nLine C\n"
+        )
+        rolling = (
+            "WEBVTT\n\n"
+            "00:00:00.000 --> 00:00:01.000\nhello\n\n"
+            "00:00:01.000 --> 00:00:02.000\nhello there\n"
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            def download(url, outtmpl, info=None):
+                name = url.rsplit("/", 1)[-1]
+                path = os.path.join(folder, f"{name}.en.vtt")
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write(manual if name == "manual" else rolling)
+                source = "subtitles" if name == "manual" else "automatic captions"
+                return TranscriptDownloadResult(source=source, languages=["en"], path=path)
+
+            entries = [
+                {"title": "Manual", "webpage_url": "https://v.example/manual"},
+                {"title": "Auto", "webpage_url": "https://v.example/auto"},
+            ]
+            items = export_transcripts(download, entries, folder, output_format="txt")
+            texts = {}
+            for item in items:
+                with open(item.path, encoding="utf-8") as handle:
+                    texts[item.title] = handle.read()
+
+        self.assertEqual(texts["Manual"], "No.\nNo.\nI said stop\nLine A\nLine B\nLine B\nLine C\n")
+        self.assertEqual(texts["Auto"], "hello there\n")
+
+    def test_same_title_entries_get_separate_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            def download(url, outtmpl, info=None):
+                path = outtmpl % {"title": info["title"], "id": info["id"], "ext": "en.vtt"}
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write(VTT)
+                return TranscriptDownloadResult(source="subtitles", languages=["en"], path=path)
+
+            entries = [
+                {"id": video_id, "title": "Intro", "webpage_url": f"https://v.example/{video_id}", "subtitles": {}}
+                for video_id in ("a1", "b2")
+            ]
+            items = export_transcripts(download, entries, folder, output_format="original")
+            names = sorted(os.listdir(folder))
+
+        self.assertEqual([item.status for item in items], ["saved", "saved"])
+        self.assertEqual(names, ["Intro [a1].transcript.en.vtt", "Intro [b2].transcript.en.vtt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
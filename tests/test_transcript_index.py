@@ -0,0 +1,45 @@
+import unittest
+
+from link2vid.core.downloader import DownloadManager
+from link2vid.ui.components.video_card import TranscriptIndex
+
+
+class DummyLogger:
+    def debug(self, _msg):
+        return None
+
+    warning = error = debug
+
+
+class TestTranscriptIndex(unittest.TestCase):
+    def setUp(self):
+        tracks = DownloadManager(ydl_logger=DummyLogger()).transcript_tracks_from_info(
+            {
+                "subtitles": {"en": [{"name": "English"}]},
+                "automatic_captions": {
+                    "de": [{"name": "German"}],
+                    "en": [{"name": "English"}],
+                    "pt-BR": [{"name": "Portuguese (Brazil)"}],
+                },
+            }
+        )
+        self.options = [("Auto-select transcript", None), *((track.label, track) for track in tracks)]
+        self.index = TranscriptIndex(self.options)
+
+    def test_tracks_carry_lowercase_search_key_outside_equality(self):
+        track = self.options[1][1]
+        self.assertEqual(track.search_key, track.label.lower())
+        self.assertEqual(track, type(track)(track.source, track.language, track.label))
+
+    def test_empty_query_returns_all_options_in_order(self):
+        self.assertEqual(self.index.match("  "), list(range(len(self.options))))
+
+    def test_prefix_matches_come_before_substring_matches(self):
+        labels = [self.options[index][0] for index in self.index.match("EN")]
+        self.assertEqual(labels[:2], ["English (en) - Subtitles", "English (en) - Auto"])
+        self.assertIn("Portuguese (Brazil) (pt-BR) - Auto", [self.options[i][0] for i in self.index.match("bra")])
+        self.assertEqual(self.index.match("zz"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
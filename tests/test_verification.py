@@ -0,0 +1,68 @@
+import hashlib
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from link2vid.core.archive import DownloadArchive
+from link2vid.core.verification import DownloadVerifier, sha256_file, verify_media_file
+
+
+def ffprobe_output(duration, codec_types):
+    payload = {"streams": [{"codec_type": kind} for kind in codec_types], "format": {"duration": str(duration)}}
+    return subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps(payload), stderr="")
+
+
+class TestVerification(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmpdir.name, "clip.mp4")
+        with open(self.path, "wb") as handle:
+            handle.write(b"\x00" * 3_000_000)
+
+    def tearDown(self):
+        self._tmpdir.cleanup()
+
+    def test_streaming_hash_matches_hashlib(self):
+        with open(self.path, "rb") as handle:
+            expected = hashlib.sha256(handle.read()).hexdigest()
+        self.assertEqual(sha256_file(self.path, chunk_size=4096), expected)
+
+    def test_probe_accepts_file_with_streams_and_expected_duration(self):
+        with patch("link2vid.core.verification.subprocess.run", return_value=ffprobe_output(598.2, ["video", "audio"])):
+            result = verify_media_file(self.path, ffprobe="ffprobe", expected_duration=600)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.streams, ["video", "audio"])
+
+    def test_truncated_or_streamless_files_fail(self):
+        with patch("link2vid.core.verification.subprocess.run", return_value=ffprobe_output(200, ["video"])):
+            truncated = verify_media_file(self.path, ffprobe="ffprobe", expected_duration=600)
+        with patch("link2vid.core.verification.subprocess.run", return_value=ffprobe_output(600, ["data"])):
+            streamless = verify_media_file(self.path, ffprobe="ffprobe")
+        self.assertFalse(truncated.ok)
+        self.assertIn("expected about 600s", truncated.error)
+        self.assertFalse(streamless.ok)
+
+    def test_verifier_stores_result_and_failed_records_are_not_archived(self):
+        archive = DownloadArchive(os.path.join(self._tmpdir.name, "archive.sqlite3"))
+        try:
+            archive.record(["youtube:abc"], "best", self.path, size=3_000_000)
+            verifier = DownloadVerifier(archive, get_ffprobe=lambda: "ffprobe")
+            with patch("link2vid.core.verification.subprocess.run", return_value=ffprobe_output(10, [])):
+                result = verifier.submit(self.path, ["youtube:abc"], "best").result(timeout=5)
+            verifier.shutdown(wait=True)
+            self.assertFalse(result.ok)
+            self.assertIsNone(archive.lookup(["youtube:abc"], "best"))
+
+            archive.record_verification(["youtube:abc"], "best", ok=True, sha256=result.sha256)
+            record = archive.lookup(["youtube:abc"], "best")
+            self.assertTrue(record.verified_ok)
+            self.assertEqual(record.sha256, result.sha256)
+        finally:
+            archive.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,26 +10,53 @@ def main(argv=None):
         action="store_true",
         help="headless import check for frozen builds",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print startup phase timings and an import-time breakdown",
+    )
     args = parser.parse_args(argv)
 
-    from link2vid.core.runtime import bootstrap_runtime, startup_summary
+    from link2vid.core.runtime import (
+        STARTUP_PROFILE_MODULES,
+        bootstrap_runtime,
+        mark_startup_phase,
+        startup_report,
+        startup_summary,
+        timed_import,
+    )
 
     bootstrap_runtime()
+    mark_startup_phase("bootstrap")
 
     if args.smoke:
-        import customtkinter as ctk  # noqa: F401
-        import yt_dlp  # noqa: F401
-        import yt_dlp_ejs  # noqa: F401
-        from link2vid.ui.main_window import VideoDownloaderApp  # noqa: F401
+        for module_name in STARTUP_PROFILE_MODULES:
+            timed_import(module_name)
+        mark_startup_phase("imports")
 
         print(startup_summary())
+        print("\n".join(startup_report()))
         return 0
 
     import customtkinter as ctk
+
+    if args.profile_startup:
+        timed_import("link2vid.ui.main_window")
     from link2vid.ui.main_window import VideoDownloaderApp
 
+    mark_startup_phase("ui imports")
+
     root = ctk.CTk()
     VideoDownloaderApp(root)
+    mark_startup_phase("window created")
+
+    if args.profile_startup:
+        def report_first_window():
+            mark_startup_phase("first window")
+            print("\n".join(startup_report()))
+
+        root.after(0, report_first_window)
+
     root.mainloop()
     return 0
 